@@ -5,6 +5,7 @@ This example loads the best_attempt.json configuration and runs a full simulatio
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path to import simulator
@@ -13,6 +14,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from simulator import FusionReactorSimulator, ReactorConfiguration
 
 
+@lru_cache(maxsize=8)
+def _load_config(path_str: str, mtime_ns: int) -> ReactorConfiguration:
+    """Parse a configuration file.
+    
+    Cached on (path, modification time), so repeated runs from the same
+    unchanged file skip the parse; editing the file invalidates the entry.
+    """
+    with open(path_str, 'rb') as f:
+        config_dict = json.loads(f.read())
+    return ReactorConfiguration(**config_dict)
+
+
 def run_best_simulation(max_time_hours=2.0, dt=1.0, visualize=False, save_path=None):
     """Run the best optimized simulation.
     
@@ -35,21 +48,20 @@ def run_best_simulation(max_time_hours=2.0, dt=1.0, visualize=False, save_path=N
     print("="*80)
     print(f"\nLoading configuration from: {config_path}")
     
-    with open(config_path, 'r') as f:
-        config_dict = json.load(f)
-    
     # Create configuration
-    config = ReactorConfiguration(**config_dict)
-    
-    print("\nConfiguration Parameters:")
-    print(f"  Major Radius: {config.major_radius:.2f} m")
-    print(f"  Minor Radius: {config.minor_radius:.2f} m")
-    print(f"  Aspect Ratio: {config.major_radius/config.minor_radius:.2f}")
-    print(f"  Toroidal Field: {config.toroidal_field:.2f} T")
-    print(f"  Plasma Current: {config.plasma_current/1e6:.2f} MA")
-    print(f"  Temperature: {config.initial_temperature/1e6:.2f} MK")
-    print(f"  Density: {config.initial_density/1e20:.2f} × 10²⁰ m⁻³")
-    print(f"  Input Power: {config.input_power/1e6:.2f} MW")
+    config = _load_config(str(config_path), config_path.stat().st_mtime_ns)
+    
+    sys.stdout.write("\n".join([
+        "\nConfiguration Parameters:",
+        f"  Major Radius: {config.major_radius:.2f} m",
+        f"  Minor Radius: {config.minor_radius:.2f} m",
+        f"  Aspect Ratio: {config.major_radius/config.minor_radius:.2f}",
+        f"  Toroidal Field: {config.toroidal_field:.2f} T",
+        f"  Plasma Current: {config.plasma_current/1e6:.2f} MA",
+        f"  Temperature: {config.initial_temperature/1e6:.2f} MK",
+        f"  Density: {config.initial_density/1e20:.2f} × 10²⁰ m⁻³",
+        f"  Input Power: {config.input_power/1e6:.2f} MW",
+    ]) + "\n")
     
     # Create simulator
     sim = FusionReactorSimulator(config)
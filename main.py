@@ -11,8 +11,10 @@ def main():
     parser.add_argument('--optimize', action='store_true', help='Try to optimize parameters')
     parser.add_argument('--visualize', action='store_true', help='Show visualizations')
     parser.add_argument('--save', type=str, help='Save path for visualizations')
+    parser.add_argument('--cache-figures', action='store_true', help='Pickle saved figures and reuse them on reruns with identical results (with --save)')
     parser.add_argument('--max-time', type=float, default=3600.0, help='Maximum simulation time in seconds (default: 3600 = 1 hour)')
     parser.add_argument('--dt', type=float, default=1.0, help='Time step in seconds (default: 1.0)')
+    parser.add_argument('--adaptive', action='store_true', help='Adapt the time step to how fast the state changes (--dt is the initial step)')
     parser.add_argument('--target-time', type=float, default=1260.0, help='Target operation time in seconds to beat record (default: 1260 = 21 minutes)')
     
     args = parser.parse_args()
@@ -44,7 +46,7 @@ def main():
     print(f"Target: Beat 21 minutes ({args.target_time/60:.1f} min) record")
     print(f"Simulating up to {args.max_time/60:.1f} minutes with dt={args.dt} s\n")
     
-    state = sim.run(max_time=args.max_time, dt=args.dt)
+    state = sim.run(max_time=args.max_time, dt=args.dt, adaptive=args.adaptive)
     
     # Print status
     sim.print_status()
@@ -83,7 +85,7 @@ def main():
     # Visualize if requested
     if args.visualize or args.save:
         print("\nGenerating visualizations...")
-        sim.visualize(save_path=args.save)
+        sim.visualize(save_path=args.save, cache_figures=args.cache_figures)
     
     return state
 
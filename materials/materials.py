@@ -3,14 +3,25 @@
 Based on real material properties from fusion research.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Sequence
 import numpy as np
 
 
-@dataclass
+def _conductivity_at_temp(k0, temperature):
+    """Thermal conductivity model, branchless over NumPy arrays.
+    
+    Constant below the 300 K reference, then decreasing ~20% per 1000 K
+    down to a floor of 30% of the room-temperature value.
+    """
+    T = np.asarray(temperature, dtype=np.float64)
+    factor = np.maximum(1.0 - 0.2 * (T - 300.0) / 1000.0, 0.3)
+    return k0 * np.where(T < 300.0, 1.0, factor)
+
+
+@dataclass(frozen=True, slots=True)
 class Material:
-    """Material properties for fusion reactor components."""
+    """Material properties for fusion reactor components (immutable)."""
     
     name: str
     density: float  # kg/m³
@@ -39,14 +50,41 @@ class Material:
         # Rough approximation: decreases ~20% per 1000K
         factor = 1.0 - 0.2 * (temperature - T_ref) / 1000.0
         return max(self.thermal_conductivity * factor, self.thermal_conductivity * 0.3)
+    
+    def thermal_conductivity_at_temp_array(self, temperatures: np.ndarray) -> np.ndarray:
+        """Calculate thermal conductivity over an array of temperatures.
+        
+        Vectorized form of thermal_conductivity_at_temp.
+        """
+        return _conductivity_at_temp(self.thermal_conductivity, temperatures)
+
+
+# Numeric Material fields mirrored as database columns
+NUMERIC_FIELDS = tuple(f.name for f in fields(Material) if f.name != 'name')
 
 
 class MaterialDatabase:
-    """Database of materials used in fusion reactors."""
+    """Database of materials used in fusion reactors.
+    
+    Materials are kept as Material records for single lookups and mirrored
+    into one NumPy column per numeric property (structure of arrays), indexed
+    by material id, for batched queries over many materials.
+    """
     
     def __init__(self):
         self._materials: Dict[str, Material] = {}
         self._initialize_materials()
+        self._build_columns()
+    
+    def _build_columns(self):
+        """Rebuild the per-property columns from the material records."""
+        self._names: List[str] = list(self._materials.keys())
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        records = list(self._materials.values())
+        self._columns: Dict[str, np.ndarray] = {
+            field: np.array([getattr(m, field) for m in records], dtype=np.float64)
+            for field in NUMERIC_FIELDS
+        }
     
     def _initialize_materials(self):
         """Initialize material database with real fusion reactor materials."""
@@ -205,6 +243,52 @@ class MaterialDatabase:
         return list(self._materials.keys())
     
     def add_material(self, material: Material):
-        """Add a custom material to the database."""
+        """Add a custom material to the database.
+        
+        Materials are immutable, so to change an existing entry add a new
+        Material (e.g. built with dataclasses.replace) under the same name.
+        """
         self._materials[material.name.lower()] = material
+        self._build_columns()
+    
+    def material_indices(self, names: Sequence[str]) -> np.ndarray:
+        """Get column indices for materials.
+        
+        Args:
+            names: Material names
+            
+        Returns:
+            Integer array of material ids
+        """
+        return np.array([self._index[name.lower()] for name in names], dtype=np.intp)
+    
+    def property_array(self, field: str) -> np.ndarray:
+        """Get a numeric property for all materials, indexed by material id.
+        
+        Args:
+            field: Material field name (e.g. 'density')
+            
+        Returns:
+            Read-only view of the property column
+        """
+        column = self._columns[field].view()
+        column.flags.writeable = False
+        return column
+    
+    def thermal_conductivity_batch(self, indices: np.ndarray,
+                                   temperatures: np.ndarray) -> np.ndarray:
+        """Calculate thermal conductivity for many materials at once.
+        
+        Vectorized form of Material.thermal_conductivity_at_temp; indices
+        and temperatures broadcast against each other.
+        
+        Args:
+            indices: Material ids (see material_indices)
+            temperatures: Temperatures in K
+            
+        Returns:
+            Thermal conductivity in W/(m·K)
+        """
+        return _conductivity_at_temp(self._columns['thermal_conductivity'][indices],
+                                     temperatures)
 
@@ -7,7 +7,8 @@ from optimization.parameter_optimizer import (
 )
 from optimization.solutions_database import (
     SolutionsDatabase,
-    ResearchSolution
+    ResearchSolution,
+    SolutionParams
 )
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     'OptimizationResult',
     'SolutionsDatabase',
     'ResearchSolution',
+    'SolutionParams',
 ]
 
@@ -4,12 +4,68 @@ Implements various optimization algorithms with realistic bounds.
 Based on current fusion research and ITER parameters.
 """
 
+import os
+import logging
+import pickle
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Callable, Union
+from collections import OrderedDict
+from dataclasses import dataclass, astuple, replace
 from simulator import FusionReactorSimulator, ReactorConfiguration
 
 
+logger = logging.getLogger(__name__)
+
+# Parameters sampled by the optimizer, in ParameterBounds declaration order
+SAMPLED_PARAMETERS = (
+    'major_radius',
+    'minor_radius',
+    'elongation',
+    'triangularity',
+    'toroidal_field',
+    'plasma_current',
+    'initial_temperature',
+    'initial_density',
+    'input_power',
+    'auxiliary_heating',
+    'current_drive_power',
+    'initial_tritium_inventory',
+    'initial_deuterium_inventory',
+)
+
+# Subset of SAMPLED_PARAMETERS that SPSA perturbs
+PERTURBED_PARAMETERS = (
+    'major_radius',
+    'minor_radius',
+    'elongation',
+    'toroidal_field',
+    'plasma_current',
+    'initial_temperature',
+    'initial_density',
+)
+
+# Maximum number of entries kept in the optimizer's score cache
+SCORE_CACHE_SIZE = 4096
+
+# Format/physics version of the on-disk score cache; bump whenever a change
+# to the simulator or the scoring makes stored results stale
+SCORE_CACHE_VERSION = 1
+
+# Default location of the on-disk score cache
+DEFAULT_CACHE_PATH = os.path.join('.fusionsim-cache', 'results.bin')
+
+# Perturbation magnitude per unit ck, in PERTURBED_PARAMETERS order
+PERTURBATION_SCALES = np.array([0.5, 0.2, 0.1, 1.0, 1e6, 10e6, 0.1e20])
+
+# Row layout of grid_search history: score followed by the sampled parameters
+HISTORY_DTYPE = np.dtype([('score', 'f8')] + [(name, 'f8') for name in SAMPLED_PARAMETERS])
+
+
 @dataclass
 class ParameterBounds:
     """Realistic bounds for reactor parameters."""
@@ -43,40 +99,236 @@ class OptimizationResult:
     best_config: ReactorConfiguration
     best_state: Optional[object] = None
     best_score: float = 0.0
-    optimization_history: List[Dict] = None
+    optimization_history: Optional[Union[np.ndarray, List[Dict]]] = None
     iterations: int = 0
     success: bool = False
     message: str = ""
+    
+    def to_dict_list(self) -> List[Dict]:
+        """Return the history as a list of {'iteration', 'score', 'config'} dicts.
+        
+        grid_search stores its history as a HISTORY_DTYPE structured array;
+        this converts it to the per-iteration dict form used by SPSA.
+        """
+        history = self.optimization_history
+        if history is None:
+            return []
+        if not isinstance(history, np.ndarray):
+            return list(history)
+        return [
+            {
+                'iteration': i,
+                'score': float(row['score']),
+                'config': ReactorConfiguration(
+                    **{name: float(row[name]) for name in SAMPLED_PARAMETERS}
+                )
+            }
+            for i, row in enumerate(history)
+        ]
+
+
+def _config_key(config: ReactorConfiguration, max_time: float) -> tuple:
+    """Hashable score-cache key: configuration fields to 6 significant figures."""
+    return (max_time,) + tuple(
+        float(f"{value:.6g}") if isinstance(value, float) else value
+        for value in astuple(config)
+    )
+
+
+# Simulator reused by _evaluate_config across evaluations in this process
+_worker_sim: Optional[FusionReactorSimulator] = None
+
+
+def _evaluate_config(task: Tuple[int, tuple], max_time: float,
+                     objective: Callable) -> Tuple[int, float, object]:
+    """Simulate and score one configuration.
+    
+    Module-level so it can be shipped to worker processes.
+    
+    Args:
+        task: Tuple of (sample index, configuration field values in
+            declaration order)
+        max_time: Maximum simulation time
+        objective: Objective function taking (simulator, max_time)
+        
+    Returns:
+        Tuple of (sample index, score, final reactor state)
+    """
+    global _worker_sim
+    index, config_values = task
+    config = ReactorConfiguration(*config_values)
+    if _worker_sim is None:
+        _worker_sim = FusionReactorSimulator(config)
+    else:
+        _worker_sim.reset(config)
+    sim = _worker_sim
+    score = objective(sim, max_time)
+    return index, score, sim.current_state
 
 
 class ParameterOptimizer:
     """Optimize reactor parameters with realistic bounds."""
     
-    def __init__(self, bounds: Optional[ParameterBounds] = None):
+    def __init__(self, bounds: Optional[ParameterBounds] = None,
+                 seed: Optional[int] = None,
+                 cache_path: Optional[str] = None):
         """Initialize optimizer.
         
         Args:
             bounds: Parameter bounds (uses defaults if None)
+            seed: Seed for the random number generator (random if None)
+            cache_path: File to load the score cache from and save it to on
+                close(), so results carry over between runs (in-memory only
+                if None)
         """
         self.bounds = bounds or ParameterBounds()
+        self._rng = np.random.default_rng(seed)
+        
+        # Bound vectors in SAMPLED_PARAMETERS order, so a whole configuration
+        # (or a whole batch of them) is drawn in a single RNG call
+        self._low = np.array([getattr(self.bounds, name)[0] for name in SAMPLED_PARAMETERS])
+        self._high = np.array([getattr(self.bounds, name)[1] for name in SAMPLED_PARAMETERS])
+        
+        # SPSA works on full SAMPLED_PARAMETERS vectors; only the perturbed
+        # entries are clamped, the rest pass through unchanged
+        self._pert_index = np.array([SAMPLED_PARAMETERS.index(name)
+                                     for name in PERTURBED_PARAMETERS])
+        self._pert_low = np.full(len(SAMPLED_PARAMETERS), -np.inf)
+        self._pert_high = np.full(len(SAMPLED_PARAMETERS), np.inf)
+        self._pert_low[self._pert_index] = self._low[self._pert_index]
+        self._pert_high[self._pert_index] = self._high[self._pert_index]
+        
+        # Worker pool for SPSA's paired evaluations (created on first use)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+        # LRU cache of (score, final state) for the default objective, keyed
+        # by quantized configuration; SPSA at small ck revisits near-identical
+        # configurations
+        self._score_cache: OrderedDict = OrderedDict()
+        self.cache_path = cache_path
+        if cache_path is not None:
+            self._load_score_cache()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        # Only release the pool here; saving the cache is left to close()
+        self._shutdown_executor()
+    
+    def __getstate__(self):
+        # The executor cannot be pickled and the cache is consulted (and
+        # saved) in the parent process only; workers need neither
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_score_cache'] = OrderedDict()
+        state['cache_path'] = None
+        return state
+    
+    def close(self):
+        """Save the score cache (if cache_path is set) and shut down the worker pool."""
+        if getattr(self, 'cache_path', None) is not None:
+            self.save_score_cache()
+        self._shutdown_executor()
+    
+    def _shutdown_executor(self):
+        """Shut down the worker pool, if one was started."""
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _load_score_cache(self):
+        """Load the score cache from cache_path, ignoring missing or stale files."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                version, entries = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            return
+        if version != SCORE_CACHE_VERSION:
+            logger.info("Ignoring score cache %s (version %s, expected %s)",
+                        self.cache_path, version, SCORE_CACHE_VERSION)
+            return
+        self._score_cache.update(entries)
+        while len(self._score_cache) > SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+    
+    def save_score_cache(self):
+        """Write the score cache to cache_path, in least-recently-used order."""
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so an interrupted save never
+        # leaves a truncated cache behind
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((SCORE_CACHE_VERSION, list(self._score_cache.items())), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the persistent SPSA worker pool, starting it if needed."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=2)
+        return self._executor
+    
+    def _config_to_vec(self, config: ReactorConfiguration) -> np.ndarray:
+        """Extract a configuration's fields as a vector in SAMPLED_PARAMETERS order."""
+        return np.array([getattr(config, name) for name in SAMPLED_PARAMETERS], dtype=float)
+    
+    def _vec_to_config(self, values: np.ndarray,
+                       base: Optional[ReactorConfiguration] = None) -> ReactorConfiguration:
+        """Build a configuration from a vector in SAMPLED_PARAMETERS order.
+        
+        Fields not in SAMPLED_PARAMETERS are taken from ``base`` if given,
+        otherwise from the ReactorConfiguration defaults.
+        """
+        fields = dict(zip(SAMPLED_PARAMETERS, values.tolist()))
+        if base is None:
+            return ReactorConfiguration(**fields)
+        return replace(base, **fields)
     
     def random_config(self) -> ReactorConfiguration:
         """Generate random configuration within bounds."""
-        return ReactorConfiguration(
-            major_radius=np.random.uniform(*self.bounds.major_radius),
-            minor_radius=np.random.uniform(*self.bounds.minor_radius),
-            elongation=np.random.uniform(*self.bounds.elongation),
-            triangularity=np.random.uniform(*self.bounds.triangularity),
-            toroidal_field=np.random.uniform(*self.bounds.toroidal_field),
-            plasma_current=np.random.uniform(*self.bounds.plasma_current),
-            initial_temperature=np.random.uniform(*self.bounds.initial_temperature),
-            initial_density=np.random.uniform(*self.bounds.initial_density),
-            input_power=np.random.uniform(*self.bounds.input_power),
-            auxiliary_heating=np.random.uniform(*self.bounds.auxiliary_heating),
-            current_drive_power=np.random.uniform(*self.bounds.current_drive_power),
-            initial_tritium_inventory=np.random.uniform(*self.bounds.initial_tritium_inventory),
-            initial_deuterium_inventory=np.random.uniform(*self.bounds.initial_deuterium_inventory),
-        )
+        return self._vec_to_config(self._rng.uniform(self._low, self._high))
+    
+    def _evaluate_all(self, configs: List[ReactorConfiguration], max_time: float,
+                      objective: Callable, mapper: Callable = map):
+        """Evaluate configurations, serving repeats from the score cache.
+        
+        Args:
+            configs: Configurations to evaluate
+            max_time: Maximum simulation time
+            objective: Objective function taking (simulator, max_time)
+            mapper: map-like callable used to run the cache misses
+                (e.g. a process pool's imap_unordered)
+            
+        Yields:
+            Tuples of (config index, score, final reactor state), in
+            completion order
+        """
+        use_cache = objective == self.score_configuration
+        keys = [_config_key(config, max_time) for config in configs] if use_cache else None
+        
+        tasks = []
+        for i, config in enumerate(configs):
+            if use_cache and keys[i] in self._score_cache:
+                self._score_cache.move_to_end(keys[i])
+                score, state = self._score_cache[keys[i]]
+                yield i, score, state
+            else:
+                tasks.append((i, astuple(config)))
+        
+        evaluate = partial(_evaluate_config, max_time=max_time, objective=objective)
+        for i, score, state in mapper(evaluate, tasks):
+            if use_cache:
+                self._score_cache[keys[i]] = (score, state)
+                if len(self._score_cache) > SCORE_CACHE_SIZE:
+                    self._score_cache.popitem(last=False)
+            yield i, score, state
     
     def score_configuration(self, sim: FusionReactorSimulator, 
                           max_time: float = 1260.0) -> float:
@@ -97,8 +349,9 @@ class ParameterOptimizer:
             Score (higher is better)
         """
         try:
-            # Run simulation
-            state = sim.run(max_time=max_time, dt=1.0)
+            # Run simulation; only failures end it early, since operation
+            # time is the main score term
+            state = sim.run(max_time=max_time, dt=1.0, skip_quiet_states=True)
             stats = sim.get_operation_statistics()
             
             # Base score from operation time
@@ -151,44 +404,69 @@ class ParameterOptimizer:
             return -1000.0  # Large penalty for errors
     
     def grid_search(self, n_samples: int = 100, max_time: float = 1260.0,
-                   objective: Optional[Callable] = None) -> OptimizationResult:
+                   objective: Optional[Callable] = None,
+                   n_workers: Optional[int] = None) -> OptimizationResult:
         """Grid search optimization.
         
+        Samples are independent, so they are evaluated in parallel across
+        worker processes.
+        
         Args:
             n_samples: Number of random samples
             max_time: Maximum simulation time
-            objective: Custom objective function (uses default if None)
+            objective: Custom objective function (uses default if None).
+                Must be picklable when more than one worker is used.
+            n_workers: Number of worker processes (defaults to CPU count,
+                1 evaluates serially in this process)
             
         Returns:
-            OptimizationResult
+            OptimizationResult, with optimization_history as a HISTORY_DTYPE
+            structured array (see OptimizationResult.to_dict_list)
         """
         if objective is None:
             objective = self.score_configuration
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
         
         best_score = -np.inf
+        best_index = -1
         best_config = None
         best_state = None
-        history = []
         
-        for i in range(n_samples):
-            config = self.random_config()
-            sim = FusionReactorSimulator(config)
-            
-            score = objective(sim, max_time)
-            
-            history.append({
-                'iteration': i,
-                'score': score,
-                'config': config
-            })
-            
-            if score > best_score:
-                best_score = score
-                best_config = config
-                best_state = sim.current_state
+        # Draw every sample up front: one RNG call instead of 13 per sample
+        samples = self._rng.uniform(self._low, self._high,
+                                    size=(n_samples, len(SAMPLED_PARAMETERS)))
+        configs = [self._vec_to_config(row) for row in samples]
+        
+        # History row i holds sample i; scores are filled in as results arrive
+        history = np.empty(n_samples, dtype=HISTORY_DTYPE)
+        history['score'] = np.nan
+        for column, name in enumerate(SAMPLED_PARAMETERS):
+            history[name] = samples[:, column]
+        
+        with ExitStack() as stack:
+            if n_workers > 1 and n_samples > 1:
+                pool = stack.enter_context(mp.Pool(processes=min(n_workers, n_samples)))
+                mapper = partial(pool.imap_unordered, chunksize=4)
+            else:
+                mapper = map
+            results = self._evaluate_all(configs, max_time, objective, mapper)
             
-            if i % 10 == 0:
-                print(f"Grid search: {i}/{n_samples}, best score: {best_score:.2f}")
+            for completed, (i, score, state) in enumerate(results):
+                config = configs[i]
+                history['score'][i] = score
+                
+                # Results arrive out of order; break ties on sample index so
+                # the outcome does not depend on worker scheduling
+                if score > best_score or (score == best_score and i < best_index):
+                    best_score = score
+                    best_index = i
+                    best_config = config
+                    best_state = state
+                
+                if completed % 10 == 0:
+                    logger.info("Grid search: %d/%d, best score: %.2f",
+                                completed, n_samples, best_score)
         
         return OptimizationResult(
             best_config=best_config or self.random_config(),
@@ -218,9 +496,14 @@ class ParameterOptimizer:
         """
         # Start with random or provided config
         if initial_config is None:
-            current_config = self.random_config()
+            base_config = self.random_config()
         else:
-            current_config = initial_config
+            base_config = initial_config
+        
+        # Iterate on a parameter vector; configurations are only built for
+        # the simulator and for reporting
+        current_vec = self._config_to_vec(base_config)
+        current_config = base_config
         
         best_score = -np.inf
         best_config = current_config
@@ -235,41 +518,44 @@ class ParameterOptimizer:
             # Generate random perturbation
             perturbation = self._generate_perturbation(ck)
             
-            # Create negative perturbation
-            perturbation_minus = {k: -v for k, v in perturbation.items()}
-            
             # Evaluate + and - perturbations
-            config_plus = self._apply_perturbation(current_config, perturbation)
-            config_minus = self._apply_perturbation(current_config, perturbation_minus)
+            config_plus = self._vec_to_config(
+                self._apply_perturbation(current_vec, perturbation), base_config)
+            config_minus = self._vec_to_config(
+                self._apply_perturbation(current_vec, -perturbation), base_config)
             
-            sim_plus = FusionReactorSimulator(config_plus)
-            sim_minus = FusionReactorSimulator(config_minus)
-            
-            score_plus = self.score_configuration(sim_plus, max_time)
-            score_minus = self.score_configuration(sim_minus, max_time)
+            # The two evaluations are independent: run them concurrently
+            results = dict((i, (score, state)) for i, score, state in self._evaluate_all(
+                [config_plus, config_minus], max_time, self.score_configuration,
+                self._get_executor().map
+            ))
+            score_plus, state_plus = results[0]
+            score_minus, state_minus = results[1]
             
             # SPSA gradient approximation
             # g_k ≈ (f(x + ck*Δ) - f(x - ck*Δ)) / (2*ck*Δ)
-            # For each parameter, estimate gradient
-            gradient_estimate = {}
-            for key in perturbation:
-                delta_k = perturbation[key]
-                if abs(delta_k) > 1e-10:  # Avoid division by zero
-                    gradient_estimate[key] = (score_plus - score_minus) / (2.0 * ck * delta_k)
-                else:
-                    gradient_estimate[key] = 0.0
+            # Estimated for all parameters at once; near-zero components
+            # (including the parameters SPSA does not perturb) are masked
+            # to avoid division by zero
+            nonzero = np.abs(perturbation) > 1e-10
+            gradient_estimate = np.where(
+                nonzero,
+                (score_plus - score_minus) / (2.0 * ck * np.where(nonzero, perturbation, 1.0)),
+                0.0
+            )
             
             # Update configuration: x_{k+1} = x_k - a_k * g_k
             # Scale gradient by step size and apply
-            update = {k: -ak * v for k, v in gradient_estimate.items()}
-            current_config = self._update_config(current_config, update)
+            update = -ak * gradient_estimate
+            current_vec = self._apply_perturbation(current_vec, update)
+            current_config = self._vec_to_config(current_vec, base_config)
             
             current_score = max(score_plus, score_minus)
             
             if current_score > best_score:
                 best_score = current_score
                 best_config = current_config
-                best_state = sim_plus.current_state if score_plus > score_minus else sim_minus.current_state
+                best_state = state_plus if score_plus > score_minus else state_minus
             
             history.append({
                 'iteration': k,
@@ -279,7 +565,8 @@ class ParameterOptimizer:
             })
             
             if k % 5 == 0:
-                print(f"SPSA: {k}/{max_iterations}, current: {current_score:.2f}, best: {best_score:.2f}")
+                logger.info("SPSA: %d/%d, current: %.2f, best: %.2f",
+                            k, max_iterations, current_score, best_score)
         
         return OptimizationResult(
             best_config=best_config,
@@ -290,54 +577,25 @@ class ParameterOptimizer:
             success=best_score > 0
         )
     
-    def _generate_perturbation(self, ck: float) -> Dict[str, float]:
-        """Generate random perturbation vector."""
-        return {
-            'major_radius': np.random.choice([-1, 1]) * ck * 0.5,
-            'minor_radius': np.random.choice([-1, 1]) * ck * 0.2,
-            'elongation': np.random.choice([-1, 1]) * ck * 0.1,
-            'toroidal_field': np.random.choice([-1, 1]) * ck * 1.0,
-            'plasma_current': np.random.choice([-1, 1]) * ck * 1e6,
-            'initial_temperature': np.random.choice([-1, 1]) * ck * 10e6,
-            'initial_density': np.random.choice([-1, 1]) * ck * 0.1e20,
-        }
-    
-    def _apply_perturbation(self, config: ReactorConfiguration, 
-                          perturbation: Dict[str, float]) -> ReactorConfiguration:
-        """Apply perturbation to configuration."""
-        return ReactorConfiguration(
-            major_radius=max(self.bounds.major_radius[0], 
-                           min(self.bounds.major_radius[1], 
-                               config.major_radius + perturbation.get('major_radius', 0))),
-            minor_radius=max(self.bounds.minor_radius[0],
-                           min(self.bounds.minor_radius[1],
-                               config.minor_radius + perturbation.get('minor_radius', 0))),
-            elongation=max(self.bounds.elongation[0],
-                         min(self.bounds.elongation[1],
-                             config.elongation + perturbation.get('elongation', 0))),
-            triangularity=config.triangularity,
-            toroidal_field=max(self.bounds.toroidal_field[0],
-                            min(self.bounds.toroidal_field[1],
-                                config.toroidal_field + perturbation.get('toroidal_field', 0))),
-            plasma_current=max(self.bounds.plasma_current[0],
-                            min(self.bounds.plasma_current[1],
-                                config.plasma_current + perturbation.get('plasma_current', 0))),
-            initial_temperature=max(self.bounds.initial_temperature[0],
-                                  min(self.bounds.initial_temperature[1],
-                                      config.initial_temperature + perturbation.get('initial_temperature', 0))),
-            initial_density=max(self.bounds.initial_density[0],
-                              min(self.bounds.initial_density[1],
-                                  config.initial_density + perturbation.get('initial_density', 0))),
-            input_power=config.input_power,
-            auxiliary_heating=config.auxiliary_heating,
-            current_drive_power=config.current_drive_power,
-            initial_tritium_inventory=config.initial_tritium_inventory,
-            initial_deuterium_inventory=config.initial_deuterium_inventory,
-        )
+    def _generate_perturbation(self, ck: float) -> np.ndarray:
+        """Generate random perturbation vector in SAMPLED_PARAMETERS order.
+        
+        Entries for parameters outside PERTURBED_PARAMETERS are zero.
+        """
+        signs = self._rng.choice([-1.0, 1.0], size=len(PERTURBED_PARAMETERS))
+        perturbation = np.zeros(len(SAMPLED_PARAMETERS))
+        perturbation[self._pert_index] = ck * PERTURBATION_SCALES * signs
+        return perturbation
     
-    def _update_config(self, config: ReactorConfiguration, 
-                      update: Dict[str, float]) -> ReactorConfiguration:
-        """Update configuration with gradient step."""
-        # Similar to _apply_perturbation but with update dict
-        return self._apply_perturbation(config, update)
-
+    def _apply_perturbation(self, vec: np.ndarray,
+                            perturbation: np.ndarray) -> np.ndarray:
+        """Apply perturbation to a parameter vector.
+        
+        Args:
+            vec: Parameter vector in SAMPLED_PARAMETERS order
+            perturbation: Offsets in SAMPLED_PARAMETERS order
+            
+        Returns:
+            New vector, with the perturbed parameters clamped to bounds
+        """
+        return np.clip(vec + perturbation, self._pert_low, self._pert_high)
@@ -4,11 +4,31 @@ Run, analyze, iterate, and optimize reactor configurations.
 """
 
 import argparse
-from simulator import FusionReactorSimulator, ReactorConfiguration
-from optimization import ParameterOptimizer, SolutionsDatabase
+import logging
+import queue
+import sys
+from dataclasses import asdict, replace
+from logging.handlers import QueueHandler, QueueListener
 import json
 
 
+def configure_logging() -> QueueListener:
+    """Route progress logging through a queue to a background stderr writer.
+    
+    Log calls in the optimization loops only enqueue the record; formatting
+    and writing happen on the listener thread.
+    
+    Returns:
+        The started listener; call stop() to flush it on exit
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    logging.basicConfig(level=logging.INFO, format='%(message)s',
+                        handlers=[QueueHandler(log_queue)])
+    listener.start()
+    return listener
+
+
 def main():
     """Main optimization loop."""
     parser = argparse.ArgumentParser(description='Fusion Reactor Optimizer')
@@ -25,9 +45,21 @@ def main():
                        help='Apply research-based solutions')
     parser.add_argument('--save', type=str, help='Save best configuration to file')
     parser.add_argument('--load', type=str, help='Load configuration from file')
+    parser.add_argument('--cache', nargs='?', const=True, default=None,
+                       metavar='PATH',
+                       help='Reuse simulation scores across runs via an on-disk cache '
+                            '(default path: .fusionsim-cache/results.bin)')
     
     args = parser.parse_args()
     
+    # Imported only once arguments are parsed, so --help and usage errors
+    # do not pay for NumPy and the physics modules
+    from simulator import FusionReactorSimulator, ReactorConfiguration
+    from optimization import ParameterOptimizer, SolutionsDatabase
+    from optimization.parameter_optimizer import DEFAULT_CACHE_PATH
+    
+    cache_path = DEFAULT_CACHE_PATH if args.cache is True else args.cache
+    
     print("="*80)
     print("FUSION REACTOR OPTIMIZER")
     print("="*80)
@@ -40,7 +72,7 @@ def main():
     solutions_db = SolutionsDatabase()
     
     # Create optimizer
-    optimizer = ParameterOptimizer()
+    optimizer = ParameterOptimizer(cache_path=cache_path)
     
     # Load or create initial config
     if args.load:
@@ -61,36 +93,37 @@ def main():
                 print(f"  - {solution.name}")
                 changes = solutions_db.apply_solution(solution, initial_config)
                 for key, value in changes.items():
-                    setattr(initial_config, key, value)
                     print(f"    {key}: {value}")
+                initial_config = replace(initial_config, **changes)
     
     # Run optimization
     print(f"\nRunning {args.method} optimization...\n")
     
-    if args.method == 'grid':
-        result = optimizer.grid_search(
-            n_samples=args.iterations,
-            max_time=args.max_time
-        )
-    elif args.method == 'spsa':
-        result = optimizer.spsa_optimize(
-            initial_config=initial_config,
-            max_iterations=args.iterations,
-            max_time=args.max_time
-        )
-    else:  # hybrid
-        # Start with grid search, then refine with SPSA
-        print("Phase 1: Grid search...")
-        grid_result = optimizer.grid_search(
-            n_samples=args.iterations // 2,
-            max_time=args.max_time
-        )
-        print(f"\nPhase 2: SPSA refinement (starting from best grid result)...")
-        result = optimizer.spsa_optimize(
-            initial_config=grid_result.best_config,
-            max_iterations=args.iterations // 2,
-            max_time=args.max_time
-        )
+    with optimizer:
+        if args.method == 'grid':
+            result = optimizer.grid_search(
+                n_samples=args.iterations,
+                max_time=args.max_time
+            )
+        elif args.method == 'spsa':
+            result = optimizer.spsa_optimize(
+                initial_config=initial_config,
+                max_iterations=args.iterations,
+                max_time=args.max_time
+            )
+        else:  # hybrid
+            # Start with grid search, then refine with SPSA
+            print("Phase 1: Grid search...")
+            grid_result = optimizer.grid_search(
+                n_samples=args.iterations // 2,
+                max_time=args.max_time
+            )
+            print(f"\nPhase 2: SPSA refinement (starting from best grid result)...")
+            result = optimizer.spsa_optimize(
+                initial_config=grid_result.best_config,
+                max_iterations=args.iterations // 2,
+                max_time=args.max_time
+            )
     
     # Results
     print("\n" + "="*80)
@@ -138,26 +171,17 @@ def main():
     
     # Save configuration
     if args.save and result.best_config:
-        config_dict = {
-            'major_radius': result.best_config.major_radius,
-            'minor_radius': result.best_config.minor_radius,
-            'elongation': result.best_config.elongation,
-            'triangularity': result.best_config.triangularity,
-            'toroidal_field': result.best_config.toroidal_field,
-            'plasma_current': result.best_config.plasma_current,
-            'initial_temperature': result.best_config.initial_temperature,
-            'initial_density': result.best_config.initial_density,
-            'input_power': result.best_config.input_power,
-            'auxiliary_heating': result.best_config.auxiliary_heating,
-            'current_drive_power': result.best_config.current_drive_power,
-            'initial_tritium_inventory': result.best_config.initial_tritium_inventory,
-            'initial_deuterium_inventory': result.best_config.initial_deuterium_inventory,
-        }
+        # Every field, so materials and blanket settings round-trip via --load
+        config_dict = asdict(result.best_config)
         with open(args.save, 'w') as f:
             json.dump(config_dict, f, indent=2)
         print(f"\nConfiguration saved to {args.save}")
 
 
 if __name__ == '__main__':
-    main()
+    listener = configure_logging()
+    try:
+        main()
+    finally:
+        listener.stop()
 
@@ -8,12 +8,42 @@ Implements:
 - Confinement time scaling
 """
 
+import math
 import numpy as np
 from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# Physical constants
+MU_0 = 4.0 * math.pi * 1e-7  # Permeability of free space (H/m)
+K_B = 1.380649e-23  # Boltzmann constant (J/K)
+
+# ITER-98(y,2) leading coefficient with the D-T ion mass term folded in
+# (M = 2.5 amu)
+_TAU_COEFF = 0.0562 * 2.5**0.19
+
+# Geometry and pressure prefactors
+_VOL_COEFF = 2.0 * math.pi**2  # V = 2π² R₀ a² κ
+_SURF_COEFF = 4.0 * math.pi**2  # S = 4π² R₀ a κ
+_INV_MU0_2 = 1.0 / (2.0 * MU_0)  # 1 / (2μ₀)
+
+
+def _tau_e_kernel(I_MA: float, B: float, P_eff_MW: float, n20: float, R: float,
+                  kappa: float, epsilon: float, apply_nbi: bool) -> float:
+    """ITER-98(y,2) confinement time on plain floats, with adjustments and bounds.
+    
+    The NBI and elongation adjustments are multiplicative factors (1.0 when
+    they do not apply) rather than branches.
+    """
+    nbi_factor = 1.0 + 0.15 * apply_nbi
+    kappa_factor = min(1.15, 1.0 + 0.1 * max(0.0, kappa - 1.5))
+    tau_E = (_TAU_COEFF * I_MA**0.93 * B**0.15 * P_eff_MW**-0.69 * n20**0.41 *
+             R**1.97 * kappa**0.78 * epsilon**0.58) * nbi_factor * kappa_factor
+    return max(0.1, min(1000.0, tau_E))
+
+
+@dataclass(frozen=True, slots=True)
 class TokamakGeometry:
     """Tokamak geometry parameters."""
     major_radius: float  # R₀ in m
@@ -24,7 +54,7 @@ class TokamakGeometry:
     plasma_volume: float  # m³
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MagneticState:
     """Magnetic field state."""
     toroidal_field: float  # B₀ in T
@@ -37,17 +67,21 @@ class MagneticState:
 
 
 class MagneticConfinement:
-    """Magnetic confinement calculations for tokamaks."""
+    """Magnetic confinement calculations for tokamaks.
     
-    # Physical constants
-    MU_0 = 4.0 * np.pi * 1e-7  # Permeability of free space (H/m)
-    K_B = 1.380649e-23  # Boltzmann constant (J/K)
+    Stateless: all methods are static and read the module-level constants.
+    """
+    
+    # Physical constants (aliases of the module-level values)
+    MU_0 = MU_0
+    K_B = K_B
     
     def __init__(self):
         """Initialize magnetic confinement calculator."""
         pass
     
-    def calculate_plasma_volume(self, major_radius: float, minor_radius: float,
+    @staticmethod
+    def calculate_plasma_volume(major_radius: float, minor_radius: float,
                                 elongation: float = 1.0) -> float:
         """Calculate plasma volume for tokamak.
         
@@ -61,10 +95,11 @@ class MagneticConfinement:
         Returns:
             Volume in m³
         """
-        volume = 2.0 * np.pi**2 * major_radius * minor_radius**2 * elongation
+        volume = _VOL_COEFF * major_radius * minor_radius*minor_radius * elongation
         return volume
     
-    def calculate_plasma_surface_area(self, major_radius: float, minor_radius: float,
+    @staticmethod
+    def calculate_plasma_surface_area(major_radius: float, minor_radius: float,
                                      elongation: float = 1.0) -> float:
         """Calculate plasma surface area.
         
@@ -79,10 +114,11 @@ class MagneticConfinement:
             Surface area in m²
         """
         # Approximate: S ≈ 4π² R₀ a κ
-        area = 4.0 * np.pi**2 * major_radius * minor_radius * elongation
+        area = _SURF_COEFF * major_radius * minor_radius * elongation
         return area
     
-    def calculate_tokamak_geometry(self, major_radius: float, minor_radius: float,
+    @staticmethod
+    def calculate_tokamak_geometry(major_radius: float, minor_radius: float,
                                    elongation: float = 1.0,
                                    triangularity: float = 0.0) -> TokamakGeometry:
         """Calculate tokamak geometry parameters.
@@ -96,19 +132,13 @@ class MagneticConfinement:
         Returns:
             TokamakGeometry object
         """
-        aspect_ratio = major_radius / minor_radius
-        volume = self.calculate_plasma_volume(major_radius, minor_radius, elongation)
-        
-        return TokamakGeometry(
-            major_radius=major_radius,
-            minor_radius=minor_radius,
-            aspect_ratio=aspect_ratio,
-            elongation=elongation,
-            triangularity=triangularity,
-            plasma_volume=volume
-        )
+        args = (major_radius, minor_radius, elongation, triangularity)
+        if _has_array(args):
+            return _tokamak_geometry(*args)
+        return _tokamak_geometry_cached(*args)
     
-    def calculate_safety_factor(self, major_radius: float, minor_radius: float,
+    @staticmethod
+    def calculate_safety_factor(major_radius: float, minor_radius: float,
                                toroidal_field: float, plasma_current: float) -> float:
         """Calculate safety factor q.
         
@@ -123,13 +153,13 @@ class MagneticConfinement:
         Returns:
             Safety factor q
         """
-        if plasma_current == 0:
-            return float('inf')
-        
-        q = (2.0 * np.pi * minor_radius**2 * toroidal_field) / (self.MU_0 * major_radius * plasma_current)
-        return q
+        args = (major_radius, minor_radius, toroidal_field, plasma_current)
+        if _has_array(args):
+            return _safety_factor(*args)
+        return _safety_factor_cached(*args)
     
-    def calculate_beta(self, plasma_pressure: float, magnetic_pressure: float) -> float:
+    @staticmethod
+    def calculate_beta(plasma_pressure: float, magnetic_pressure: float) -> float:
         """Calculate plasma beta (pressure ratio).
         
         β = p_plasma / p_magnetic
@@ -145,7 +175,8 @@ class MagneticConfinement:
             return float('inf')
         return plasma_pressure / magnetic_pressure
     
-    def calculate_magnetic_pressure(self, magnetic_field: float) -> float:
+    @staticmethod
+    def calculate_magnetic_pressure(magnetic_field: float) -> float:
         """Calculate magnetic pressure.
         
         p_mag = B² / (2μ₀)
@@ -156,10 +187,11 @@ class MagneticConfinement:
         Returns:
             Magnetic pressure in Pa
         """
-        pressure = magnetic_field**2 / (2.0 * self.MU_0)
+        pressure = magnetic_field*magnetic_field * _INV_MU0_2
         return pressure
     
-    def calculate_plasma_pressure(self, density: float, temperature: float) -> float:
+    @staticmethod
+    def calculate_plasma_pressure(density: float, temperature: float) -> float:
         """Calculate plasma pressure.
         
         p = nkT (ideal gas law for plasma)
@@ -171,10 +203,11 @@ class MagneticConfinement:
         Returns:
             Plasma pressure in Pa
         """
-        pressure = density * self.K_B * temperature
+        pressure = density * K_B * temperature
         return pressure
     
-    def calculate_poloidal_field(self, major_radius: float, plasma_current: float) -> float:
+    @staticmethod
+    def calculate_poloidal_field(major_radius: float, plasma_current: float) -> float:
         """Calculate poloidal magnetic field.
         
         B_p ≈ (μ₀ I_p) / (2π a)
@@ -187,10 +220,11 @@ class MagneticConfinement:
             Poloidal field in T
         """
         # Simplified: using major radius as approximation
-        B_p = (self.MU_0 * plasma_current) / (2.0 * np.pi * major_radius)
+        B_p = (MU_0 * plasma_current) / (2.0 * math.pi * major_radius)
         return B_p
     
-    def calculate_confinement_time_scaling(self, major_radius: float, minor_radius: float,
+    @staticmethod
+    def calculate_confinement_time_scaling(major_radius: float, minor_radius: float,
                                           density: float, temperature: float,
                                           toroidal_field: float, plasma_current: float,
                                           elongation: float = 1.0,
@@ -237,48 +271,77 @@ class MagneticConfinement:
             P_ext_MW = 1.0  # Avoid division by zero
         
         # Improved scaling: Separate ohmic heating from external heating
-        # Research shows ohmic heating contributes differently to confinement
-        if use_improved_scaling and ohmic_heating_MW is not None:
-            # Ohmic heating is less effective for confinement (reduced exponent)
-            # Use effective power: P_eff = P_ext + 0.3 * P_ohmic
-            # The 0.3 factor accounts for ohmic heating being less effective
-            P_ohmic_MW = ohmic_heating_MW
-            P_eff_MW = P_ext_MW + 0.3 * P_ohmic_MW
-        else:
-            # Traditional scaling: include all heating
-            if ohmic_heating_MW is not None:
-                P_eff_MW = P_ext_MW + ohmic_heating_MW
-            else:
-                P_eff_MW = P_ext_MW
+        # Research shows ohmic heating contributes differently to confinement:
+        # it is less effective, so P_eff = P_ext + 0.3 * P_ohmic. Traditional
+        # scaling includes all heating (factor 1.0).
+        ohmic_factor = 0.3 if use_improved_scaling else 1.0
+        P_eff_MW = P_ext_MW + ohmic_factor * (ohmic_heating_MW or 0.0)
         
         # Aspect ratio
         epsilon = minor_radius / major_radius
         
-        # ITER-98(y,2) scaling
-        # τ_E in seconds
-        # M = 2.5 for D-T plasma (average ion mass in amu)
-        M = 2.5
-        
-        tau_E = (0.0562 * (I_MA**0.93) * (toroidal_field**0.15) * 
-                (P_eff_MW**-0.69) * ((density/1e20)**0.41) * (M**0.19) *
-                (major_radius**1.97) * (elongation**0.78) * (epsilon**0.58))
-        
-        # NBI confinement improvement (from research: NBI can improve confinement via rotation)
-        # If using NBI (auxiliary heating), apply improvement factor
-        if use_improved_scaling and P_ext_MW > 10.0:  # Assume NBI if significant external heating
-            # NBI-induced rotation can improve confinement by 10-20%
-            nbi_improvement = 1.15  # 15% improvement
-            tau_E *= nbi_improvement
-        
-        # High elongation improvement (from research: higher elongation improves confinement)
-        if elongation > 1.5:
-            elongation_bonus = 1.0 + 0.1 * (elongation - 1.5)  # Up to 10% bonus
-            tau_E *= min(elongation_bonus, 1.15)  # Cap at 15% improvement
-        
-        # Reasonable bounds: 0.1s to 1000s
-        return max(0.1, min(1000.0, tau_E))
+        # ITER-98(y,2) scaling, τ_E in seconds, bounded to 0.1s-1000s.
+        # NBI confinement improvement (from research: NBI can improve
+        # confinement via rotation by 10-20%) applies when there is
+        # significant external heating; higher elongation also improves
+        # confinement, capped at 15%.
+        return _tau_e_kernel(
+            I_MA, toroidal_field, P_eff_MW, density / 1e20, major_radius,
+            elongation, epsilon,
+            use_improved_scaling and P_ext_MW > 10.0
+        )
     
-    def calculate_magnetic_state(self, toroidal_field: float, plasma_current: float,
+    @staticmethod
+    def calculate_confinement_time_scaling_batch(major_radius: np.ndarray,
+                                                minor_radius: np.ndarray,
+                                                density: np.ndarray,
+                                                temperature: np.ndarray,
+                                                toroidal_field: np.ndarray,
+                                                plasma_current: np.ndarray,
+                                                elongation: np.ndarray = 1.0,
+                                                heating_power_MW: Optional[np.ndarray] = None,
+                                                ohmic_heating_MW: Optional[np.ndarray] = None,
+                                                use_improved_scaling: bool = True) -> np.ndarray:
+        """Calculate energy confinement time for arrays of parameters.
+        
+        Vectorized form of calculate_confinement_time_scaling: arguments
+        broadcast against each other and the branches are evaluated
+        elementwise, so a whole parameter sweep is one call.
+        
+        Returns:
+            Array of confinement times in s
+        """
+        I_MA = np.asarray(plasma_current, dtype=np.float64) / 1e6
+        
+        if heating_power_MW is None:
+            P_ext_MW = np.float64(50.0)
+        else:
+            P_ext_MW = np.asarray(heating_power_MW, dtype=np.float64)
+        P_ext_MW = np.where(P_ext_MW <= 0, 1.0, P_ext_MW)
+        
+        ohmic_factor = 0.3 if use_improved_scaling else 1.0
+        if ohmic_heating_MW is None:
+            P_eff_MW = P_ext_MW
+        else:
+            P_eff_MW = P_ext_MW + ohmic_factor * np.asarray(ohmic_heating_MW, dtype=np.float64)
+        
+        major_radius = np.asarray(major_radius, dtype=np.float64)
+        elongation = np.asarray(elongation, dtype=np.float64)
+        epsilon = minor_radius / major_radius
+        
+        tau_E = (_TAU_COEFF * (I_MA**0.93) * (toroidal_field**0.15) *
+                 (P_eff_MW**-0.69) * ((density/1e20)**0.41) *
+                 (major_radius**1.97) * (elongation**0.78) * (epsilon**0.58))
+        
+        # NBI improvement and elongation bonus, as in the scalar version
+        nbi_factor = 1.0 + 0.15 * (use_improved_scaling & (P_ext_MW > 10.0))
+        kappa_factor = np.clip(1.0 + 0.1 * np.maximum(elongation - 1.5, 0.0), 1.0, 1.15)
+        tau_E = tau_E * nbi_factor * kappa_factor
+        
+        return np.clip(tau_E, 0.1, 1000.0)
+    
+    @staticmethod
+    def calculate_magnetic_state(toroidal_field: float, plasma_current: float,
                                 major_radius: float, minor_radius: float,
                                 density: float, temperature: float) -> MagneticState:
         """Calculate complete magnetic field state.
@@ -294,30 +357,135 @@ class MagneticConfinement:
         Returns:
             MagneticState object
         """
-        # Poloidal field
-        poloidal_field = self.calculate_poloidal_field(major_radius, plasma_current)
-        
-        # Total field (approximate)
-        total_field = np.sqrt(toroidal_field**2 + poloidal_field**2)
-        
-        # Pressures
-        magnetic_pressure = self.calculate_magnetic_pressure(toroidal_field)
-        plasma_pressure = self.calculate_plasma_pressure(density, temperature)
-        
-        # Beta
-        beta = self.calculate_beta(plasma_pressure, magnetic_pressure)
-        
-        # Safety factor
-        safety_factor = self.calculate_safety_factor(major_radius, minor_radius,
-                                                     toroidal_field, plasma_current)
-        
-        return MagneticState(
-            toroidal_field=toroidal_field,
-            poloidal_field=poloidal_field,
-            total_field=total_field,
-            beta=beta,
-            safety_factor=safety_factor,
-            magnetic_pressure=magnetic_pressure,
-            plasma_pressure=plasma_pressure
-        )
+        args = (toroidal_field, plasma_current, major_radius, minor_radius,
+                density, temperature)
+        if _has_array(args):
+            return _magnetic_state(*args)
+        return _magnetic_state_cached(*args)
+
+    
+    @staticmethod
+    def calculate_magnetic_state_batch(toroidal_field: np.ndarray,
+                                       plasma_current: np.ndarray,
+                                       major_radius: np.ndarray,
+                                       minor_radius: np.ndarray,
+                                       density: np.ndarray,
+                                       temperature: np.ndarray) -> Dict[str, np.ndarray]:
+        """Calculate magnetic field state for arrays of parameters.
+        
+        Vectorized form of calculate_magnetic_state; arguments broadcast
+        against each other.
+        
+        Returns:
+            Dictionary of arrays keyed by MagneticState field name
+        """
+        B_t = np.asarray(toroidal_field, dtype=np.float64)
+        I_p = np.asarray(plasma_current, dtype=np.float64)
+        R = np.asarray(major_radius, dtype=np.float64)
+        a = np.asarray(minor_radius, dtype=np.float64)
+        
+        poloidal_field = MU_0 * I_p / (2.0 * math.pi * R)
+        magnetic_pressure = B_t*B_t * _INV_MU0_2
+        plasma_pressure = np.asarray(density, dtype=np.float64) * K_B * temperature
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            beta = np.where(magnetic_pressure == 0, np.inf,
+                            plasma_pressure / magnetic_pressure)
+            safety_factor = np.where(I_p == 0, np.inf,
+                                     (2.0 * math.pi * a*a * B_t) / (MU_0 * R * I_p))
+        
+        return {
+            'toroidal_field': B_t,
+            'poloidal_field': poloidal_field,
+            'total_field': np.sqrt(B_t*B_t + poloidal_field*poloidal_field),
+            'beta': beta,
+            'safety_factor': safety_factor,
+            'magnetic_pressure': magnetic_pressure,
+            'plasma_pressure': plasma_pressure,
+        }
+
+# Geometry, safety factor and magnetic state depend only on their float
+# arguments, so scalar results are memoized at module level and shared by
+# every calculator: time stepping and the optimizers revisit the same inputs
+# many times. Within run() the temperature and density settle after startup,
+# so steady-state steps repeat the magnetic state arguments exactly.
+# Arguments are used as given (not rounded), so cached results are exact;
+# the returned dataclasses are frozen and safe to share. Array arguments
+# are unhashable and go to the uncached implementations.
+MAGNETIC_CACHE_SIZE = 4096
+
+
+def _has_array(args: Tuple) -> bool:
+    """Whether any argument is an array, 0-d included, and so unhashable.
+    
+    isinstance rather than np.ndim, which costs more than a cache hit.
+    """
+    return any(isinstance(arg, np.ndarray) for arg in args)
+
+
+def _tokamak_geometry(major_radius: float, minor_radius: float,
+                      elongation: float, triangularity: float) -> TokamakGeometry:
+    """Implementation of MagneticConfinement.calculate_tokamak_geometry."""
+    aspect_ratio = major_radius / minor_radius
+    volume = MagneticConfinement.calculate_plasma_volume(major_radius, minor_radius, elongation)
+    
+    return TokamakGeometry(
+        major_radius=major_radius,
+        minor_radius=minor_radius,
+        aspect_ratio=aspect_ratio,
+        elongation=elongation,
+        triangularity=triangularity,
+        plasma_volume=volume
+    )
+
+
+def _safety_factor(major_radius: float, minor_radius: float,
+                   toroidal_field: float, plasma_current: float) -> float:
+    """Implementation of MagneticConfinement.calculate_safety_factor."""
+    if plasma_current == 0:
+        return float('inf')
+    
+    q = ((2.0 * math.pi * minor_radius*minor_radius * toroidal_field) /
+         (MU_0 * major_radius * plasma_current))
+    return q
+
+
+def _magnetic_state(toroidal_field: float, plasma_current: float,
+                    major_radius: float, minor_radius: float,
+                    density: float, temperature: float) -> MagneticState:
+    """Implementation of MagneticConfinement.calculate_magnetic_state."""
+    # Poloidal field
+    poloidal_field = MagneticConfinement.calculate_poloidal_field(major_radius, plasma_current)
+    
+    # Total field (approximate)
+    total_field_sq = toroidal_field*toroidal_field + poloidal_field*poloidal_field
+    if np.ndim(total_field_sq):
+        total_field = np.sqrt(total_field_sq)
+    else:
+        total_field = math.sqrt(total_field_sq)
+    
+    # Pressures
+    magnetic_pressure = MagneticConfinement.calculate_magnetic_pressure(toroidal_field)
+    plasma_pressure = MagneticConfinement.calculate_plasma_pressure(density, temperature)
+    
+    # Beta
+    beta = MagneticConfinement.calculate_beta(plasma_pressure, magnetic_pressure)
+    
+    # Safety factor
+    safety_factor = MagneticConfinement.calculate_safety_factor(major_radius, minor_radius,
+                                                        toroidal_field, plasma_current)
+    
+    return MagneticState(
+        toroidal_field=toroidal_field,
+        poloidal_field=poloidal_field,
+        total_field=total_field,
+        beta=beta,
+        safety_factor=safety_factor,
+        magnetic_pressure=magnetic_pressure,
+        plasma_pressure=plasma_pressure
+    )
+
 
+_tokamak_geometry_cached = lru_cache(maxsize=MAGNETIC_CACHE_SIZE)(_tokamak_geometry)
+_safety_factor_cached = lru_cache(maxsize=MAGNETIC_CACHE_SIZE)(_safety_factor)
+_magnetic_state_cached = lru_cache(maxsize=MAGNETIC_CACHE_SIZE)(_magnetic_state)
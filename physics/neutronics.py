@@ -8,11 +8,74 @@ Implements:
 """
 
 import numpy as np
-from typing import Dict, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Tuple, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+# Physical constants
+NEUTRON_ENERGY_DT = 14.1e6 * 1.602176634e-19  # J (14.1 MeV)
+LI6_BREEDING_CROSS_SECTION = 940.0  # barns at thermal energies
+LI7_BREEDING_CROSS_SECTION = 0.045  # barns (much lower)
+ENERGY_PER_FUSION = 17.6e6 * 1.602176634e-19  # J per D-T reaction (17.6 MeV)
+SECONDS_PER_YEAR = 365.25 * 24 * 3600  # s, the year of the per-year DPA rates
+
+# Derived constants
+_NEUTRON_POWER_FRACTION = 14.1 / 17.6  # Share of D-T fusion power carried by neutrons
+_INV_NEUTRON_ENERGY_DT = 1.0 / NEUTRON_ENERGY_DT
+_INV_ENERGY_PER_FUSION = 1.0 / ENERGY_PER_FUSION
+_LI_ATOMS_PER_M3 = 534.0 / (6.941 * 1.66053906660e-27)  # Lithium metal (~534 kg/m³)
+
+# Operating points per chunk in chunked neutronics sweeps
+SWEEP_CHUNK_SIZE = 1 << 16
+
+# Breeding cross-section in m² for natural lithium (7.5% Li-6), the default
+_NATURAL_LI6_FRACTION = 0.075
+_NATURAL_LI_SIGMA_M2 = (_NATURAL_LI6_FRACTION * LI6_BREEDING_CROSS_SECTION +
+                        (1 - _NATURAL_LI6_FRACTION) * LI7_BREEDING_CROSS_SECTION) * 1e-28
+
+
+def _breeding_cross_section_m2(li6_fraction: float) -> float:
+    """Effective Li breeding cross-section in m² for a Li-6 fraction."""
+    if li6_fraction == _NATURAL_LI6_FRACTION:
+        return _NATURAL_LI_SIGMA_M2
+    return (li6_fraction * LI6_BREEDING_CROSS_SECTION +
+            (1 - li6_fraction) * LI7_BREEDING_CROSS_SECTION) * 1e-28
+
+
+def _neutron_power_density(fusion_power: float, surface_area: float) -> float:
+    """Neutron power per unit first-wall area in W/m² (zero without a wall)."""
+    return fusion_power * _NEUTRON_POWER_FRACTION / surface_area if surface_area != 0 else 0.0
+
+
+def _neutronics_kernel(fusion_power: float, surface_area: float,
+                       lithium_density: float, blanket_thickness: float,
+                       li6_fraction: float) -> Tuple[float, float, float, float, float]:
+    """Neutronics pipeline on plain floats.
+    
+    Returns:
+        Tuple of (neutron flux, wall loading, tritium production rate,
+        TBR, DPA rate) in the units of NeutronicsState
+    """
+    # Neutron power per unit wall area, shared by flux and loading
+    power_density = _neutron_power_density(fusion_power, surface_area)
+    neutron_flux = power_density * _INV_NEUTRON_ENERGY_DT
+    wall_loading = power_density * 1e-6
+    
+    tritium_consumption = fusion_power * _INV_ENERGY_PER_FUSION
+    tritium_production = (neutron_flux * lithium_density *
+                          _breeding_cross_section_m2(li6_fraction) * blanket_thickness)
+    
+    if tritium_consumption == 0:
+        tbr = float('inf') if tritium_production > 0 else 0.0
+    else:
+        tbr = tritium_production / tritium_consumption
+    
+    dpa_rate = neutron_flux * 1e-24 * SECONDS_PER_YEAR
+    return neutron_flux, wall_loading, tritium_production, tbr, dpa_rate
+
+
+@dataclass(frozen=True, slots=True)
 class NeutronicsState:
     """Neutronics state."""
     neutron_flux: float  # n/(m²·s)
@@ -23,209 +86,480 @@ class NeutronicsState:
     material_damage_accumulated: float  # DPA
 
 
+# Record layout for neutronics time series, one row per NeutronicsState
+NEUTRONICS_DTYPE = np.dtype([
+    ('neutron_flux', 'f8'),
+    ('neutron_wall_loading', 'f8'),
+    ('tritium_production_rate', 'f8'),
+    ('tritium_breeding_ratio', 'f8'),
+    ('dpa_rate', 'f8'),
+    ('material_damage_accumulated', 'f8'),
+])
+
+
+def neutron_flux(fusion_power: float, surface_area: float) -> float:
+    """Calculate neutron flux at first wall.
+    
+    Args:
+        fusion_power: Fusion power in W
+        surface_area: First wall surface area in m²
+        
+    Returns:
+        Neutron flux in n/(m²·s)
+    """
+    # Each D-T fusion produces 1 neutron with 14.1 MeV, carrying
+    # 14.1 / 17.6 of the fusion power; flux assumes a uniform wall
+    return _neutron_power_density(fusion_power, surface_area) * _INV_NEUTRON_ENERGY_DT
+
+
+def neutron_wall_loading(fusion_power: float, surface_area: float) -> float:
+    """Calculate neutron wall loading.
+    
+    Args:
+        fusion_power: Fusion power in W
+        surface_area: First wall surface area in m²
+        
+    Returns:
+        Neutron wall loading in MW/m²
+    """
+    # Neutron power per unit wall area, converted to MW/m²
+    return _neutron_power_density(fusion_power, surface_area) * 1e-6
+
+
+def tritium_production(neutron_flux: float, lithium_density: float, thickness: float,
+                       li6_fraction: float = 0.075) -> float:
+    """Calculate tritium production rate.
+    
+    Args:
+        neutron_flux: Neutron flux in n/(m²·s)
+        lithium_density: Lithium density in atoms/m³
+        thickness: Breeding blanket thickness in m
+        li6_fraction: Fraction of Li-6 (natural: 7.5%)
+        
+    Returns:
+        Tritium production rate in atoms/s
+    """
+    # Production rate: flux * density * cross-section (m²) * thickness
+    return neutron_flux * lithium_density * _breeding_cross_section_m2(li6_fraction) * thickness
+
+
+def tritium_consumption(fusion_power: float) -> float:
+    """Calculate tritium consumption rate.
+    
+    Args:
+        fusion_power: Fusion power in W
+        
+    Returns:
+        Tritium consumption rate in atoms/s
+    """
+    # Each D-T fusion consumes 1 tritium atom
+    # Energy per fusion = 17.6 MeV
+    return fusion_power * _INV_ENERGY_PER_FUSION
+
+
+def tritium_breeding_ratio(tritium_production: float, tritium_consumption: float) -> float:
+    """Calculate tritium breeding ratio.
+    
+    TBR = production / consumption. Without consumption the ratio is inf
+    if anything is bred and 0 otherwise. Accepts floats or arrays; arrays
+    are handled with a single masked divide and give a float64 array
+    (callers averaging TBR over a sweep may prefer to mask the inf
+    entries, e.g. replace them with NaN for np.nanmean).
+    
+    Args:
+        tritium_production: Tritium production rate in atoms/s
+        tritium_consumption: Tritium consumption rate in atoms/s
+        
+    Returns:
+        Tritium breeding ratio
+    """
+    if np.ndim(tritium_production) or np.ndim(tritium_consumption):
+        tbr = np.where(np.greater(tritium_production, 0), np.inf, 0.0)
+        np.divide(tritium_production, tritium_consumption, out=tbr,
+                  where=np.not_equal(tritium_consumption, 0), dtype=np.float64)
+        return tbr
+    if tritium_consumption != 0:
+        return tritium_production / tritium_consumption
+    return float('inf') if tritium_production > 0 else 0.0
+
+
+def neutronics_state(fusion_power: float, surface_area: float,
+                     lithium_density: Optional[float] = None,
+                     blanket_thickness: float = 1.0,
+                     li6_fraction: float = 0.075,
+                     initial_dpa: float = 0.0) -> NeutronicsState:
+    """Calculate complete neutronics state.
+    
+    Args:
+        fusion_power: Fusion power in W
+        surface_area: First wall surface area in m²
+        lithium_density: Lithium density in atoms/m³ (if None, calculated)
+        blanket_thickness: Breeding blanket thickness in m
+        li6_fraction: Fraction of Li-6
+        initial_dpa: Initial accumulated DPA
+        
+    Returns:
+        NeutronicsState object
+    """
+    # Tritium production (if breeding blanket present); estimate the
+    # lithium density from the material density if not given
+    if lithium_density is None:
+        lithium_density = _LI_ATOMS_PER_M3
+    
+    flux, wall_loading, production, tbr, dpa_rate = _neutronics_kernel(
+        fusion_power, surface_area, lithium_density, blanket_thickness, li6_fraction
+    )
+    
+    # Accumulated damage: initial + rate * time
+    # dpa_rate is in DPA/year, so we need operation time in years
+    # initial_dpa should already include time; the simulator integrates
+    # the rate between steps and passes the running total in
+    return NeutronicsState(
+        neutron_flux=flux,
+        neutron_wall_loading=wall_loading,
+        tritium_production_rate=production,
+        tritium_breeding_ratio=tbr,
+        dpa_rate=dpa_rate,
+        material_damage_accumulated=initial_dpa
+    )
+
+
 class NeutronicsCalculator:
-    """Neutronics calculations for fusion reactors."""
+    """Neutronics calculations for fusion reactors.
+    
+    The scalar calculations are also available as module-level functions,
+    which skip the method lookup in hot loops.
+    """
     
     # Physical constants
-    NEUTRON_ENERGY_DT = 14.1e6 * 1.602176634e-19  # J (14.1 MeV)
+    NEUTRON_ENERGY_DT = NEUTRON_ENERGY_DT
     TRITIUM_ATOMIC_MASS = 3.016 * 1.66053906660e-27  # kg
     AVOGADRO = 6.02214076e23  # atoms/mol
     
-    # D-T fusion produces 1 neutron per reaction
-    NEUTRONS_PER_FUSION = 1.0
-    
     # Tritium breeding reactions
     # Li-6 + n → T + He-4 (primary reaction)
     # Li-7 + n → T + He-4 + n (secondary, requires higher energy)
-    LI6_BREEDING_CROSS_SECTION = 940.0  # barns at thermal energies
-    LI7_BREEDING_CROSS_SECTION = 0.045  # barns (much lower)
+    LI6_BREEDING_CROSS_SECTION = LI6_BREEDING_CROSS_SECTION
+    LI7_BREEDING_CROSS_SECTION = LI7_BREEDING_CROSS_SECTION
+    
+    # Energy-group DPA cross-sections (m²) by material name, filled by
+    # register_dpa_cross_sections()
+    _DPA_XS_TABLES: Dict[str, np.ndarray] = {}
     
     def __init__(self):
         """Initialize neutronics calculator."""
         pass
     
     def calculate_neutron_flux(self, fusion_power: float, surface_area: float) -> float:
-        """Calculate neutron flux at first wall.
+        """Calculate neutron flux at first wall in n/(m²·s); see neutron_flux."""
+        return neutron_flux(fusion_power, surface_area)
+    
+    def calculate_neutron_wall_loading(self, fusion_power: float, surface_area: float) -> float:
+        """Calculate neutron wall loading in MW/m²; see neutron_wall_loading."""
+        return neutron_wall_loading(fusion_power, surface_area)
+    
+    def calculate_tritium_production(self, neutron_flux: float, 
+                                    lithium_density: float, thickness: float,
+                                    li6_fraction: float = 0.075) -> float:
+        """Calculate tritium production rate in atoms/s; see tritium_production."""
+        return tritium_production(neutron_flux, lithium_density, thickness, li6_fraction)
+    
+    def calculate_tritium_production_grid(self, neutron_flux: float,
+                                          lithium_density: np.ndarray,
+                                          thickness: np.ndarray,
+                                          li6_fraction: np.ndarray,
+                                          dtype: np.dtype = np.float64) -> np.ndarray:
+        """Calculate tritium production over a blanket design grid.
+        
+        Evaluates calculate_tritium_production on the outer product of the
+        three design axes, for TBR parameter sweeps.
         
         Args:
-            fusion_power: Fusion power in W
-            surface_area: First wall surface area in m²
-            
+            neutron_flux: Neutron flux in n/(m²·s)
+            lithium_density: Lithium densities in atoms/m³
+            thickness: Breeding blanket thicknesses in m
+            li6_fraction: Li-6 fractions
+            dtype: Floating-point type of the result (np.float32 halves
+                the memory of large sweeps)
+        
         Returns:
-            Neutron flux in n/(m²·s)
+            Tritium production rate in atoms/s, indexed
+            [li6_fraction, lithium_density, thickness]
         """
-        if surface_area == 0:
-            return 0.0
-        
-        # Each D-T fusion produces 1 neutron with 14.1 MeV
-        # Neutron power = fusion_power * (14.1 / 17.6)
-        neutron_power = fusion_power * (14.1 / 17.6)
+        li6_fraction = np.asarray(li6_fraction, dtype=dtype)[:, None, None]
+        lithium_density = np.asarray(lithium_density, dtype=dtype)[None, :, None]
+        thickness = np.asarray(thickness, dtype=dtype)[None, None, :]
         
-        # Number of neutrons per second
-        neutrons_per_second = neutron_power / self.NEUTRON_ENERGY_DT
-        
-        # Neutron flux (assuming uniform distribution)
-        flux = neutrons_per_second / surface_area
-        return flux
+        # Atoms per m² of blanket times cross-section first, so float32
+        # does not overflow on flux * density
+        sigma_m2 = (li6_fraction * self.LI6_BREEDING_CROSS_SECTION +
+                    (1 - li6_fraction) * self.LI7_BREEDING_CROSS_SECTION) * 1e-28
+        return neutron_flux * (lithium_density * sigma_m2 * thickness)
     
-    def calculate_neutron_wall_loading(self, fusion_power: float, surface_area: float) -> float:
-        """Calculate neutron wall loading.
+    def calculate_tritium_breeding_ratio(self, tritium_production: float,
+                                        tritium_consumption: float) -> float:
+        """Calculate tritium breeding ratio; see tritium_breeding_ratio."""
+        return tritium_breeding_ratio(tritium_production, tritium_consumption)
+    
+    def calculate_tritium_consumption(self, fusion_power: float) -> float:
+        """Calculate tritium consumption rate in atoms/s; see tritium_consumption."""
+        return tritium_consumption(fusion_power)
+    
+    @classmethod
+    def register_dpa_cross_sections(cls, material: str, cross_sections: np.ndarray):
+        """Register energy-group DPA cross-sections for a material.
         
         Args:
-            fusion_power: Fusion power in W
-            surface_area: First wall surface area in m²
-            
-        Returns:
-            Neutron wall loading in MW/m²
+            material: Material name, as used by calculate_dpa_rate
+            cross_sections: DPA cross-section per energy group in m²
+                (e.g. arc-dpa damage cross-sections from a processed
+                nuclear data library)
         """
-        if surface_area == 0:
-            return 0.0
-        
-        # Neutron power
-        neutron_power = fusion_power * (14.1 / 17.6)
-        
-        # Wall loading
-        loading = (neutron_power / surface_area) / 1e6  # Convert to MW/m²
-        return loading
+        table = np.array(cross_sections, dtype=np.float64)
+        table.flags.writeable = False
+        cls._DPA_XS_TABLES[material] = table
     
-    def calculate_tritium_production(self, neutron_flux: float, 
-                                    lithium_density: float, thickness: float,
-                                    li6_fraction: float = 0.075) -> float:
-        """Calculate tritium production rate.
+    def calculate_dpa_rate(self, neutron_flux: float, dpa_cross_section: float = 1e-24,
+                           flux_spectrum: Optional[np.ndarray] = None,
+                           material: Optional[str] = None) -> float:
+        """Calculate displacement per atom (DPA) rate.
+        
+        With a group flux spectrum and a material whose DPA cross-sections
+        have been registered, the rate is the spectrum folded with the
+        group cross-sections. Otherwise a single effective cross-section is
+        applied to the total flux (simplified model).
         
         Args:
             neutron_flux: Neutron flux in n/(m²·s)
-            lithium_density: Lithium density in atoms/m³
-            thickness: Breeding blanket thickness in m
-            li6_fraction: Fraction of Li-6 (natural: 7.5%)
+            dpa_cross_section: Effective DPA cross-section in m²
+            flux_spectrum: Neutron flux per energy group in n/(m²·s)
+            material: Material name for the group cross-section table
             
         Returns:
-            Tritium production rate in atoms/s
+            DPA rate in DPA/year
         """
-        # Effective cross-section (weighted average)
-        sigma_eff = (li6_fraction * self.LI6_BREEDING_CROSS_SECTION + 
-                    (1 - li6_fraction) * self.LI7_BREEDING_CROSS_SECTION)
+        if flux_spectrum is not None:
+            table = self._DPA_XS_TABLES.get(material)
+            if table is not None:
+                return float(np.dot(flux_spectrum, table)) * SECONDS_PER_YEAR
         
-        # Convert cross-section from barns to m²
-        sigma_m2 = sigma_eff * 1e-28
+        # DPA rate = flux * cross-section * time
+        # Convert to per year
+        dpa_per_second = neutron_flux * dpa_cross_section
+        dpa_per_year = dpa_per_second * SECONDS_PER_YEAR
         
-        # Production rate: flux * density * cross-section * thickness
-        production_rate = neutron_flux * lithium_density * sigma_m2 * thickness
-        return production_rate
+        return dpa_per_year
     
-    def calculate_tritium_breeding_ratio(self, tritium_production: float,
-                                        tritium_consumption: float) -> float:
-        """Calculate tritium breeding ratio.
+    @staticmethod
+    def integrate_dpa(dpa_rate: np.ndarray, dt: np.ndarray,
+                      initial_dpa: float = 0.0) -> np.ndarray:
+        """Integrate a DPA-rate time series into accumulated damage.
         
-        TBR = production / consumption
+        Uses the same rule as the simulator's time stepping: each step adds
+        rate * dt, with the rate taken at the start of the step.
         
         Args:
-            tritium_production: Tritium production rate in atoms/s
-            tritium_consumption: Tritium consumption rate in atoms/s
+            dpa_rate: DPA rate per step in DPA/year
+            dt: Step length(s) in s (scalar or per step)
+            initial_dpa: Damage before the first step
             
         Returns:
-            Tritium breeding ratio
+            Accumulated DPA after each step
         """
-        if tritium_consumption == 0:
-            return float('inf') if tritium_production > 0 else 0.0
-        return tritium_production / tritium_consumption
+        damage = np.multiply(dpa_rate, dt, dtype=np.float64)
+        np.cumsum(damage, out=damage)
+        damage *= 1.0 / SECONDS_PER_YEAR
+        damage += initial_dpa
+        return damage
     
-    def calculate_tritium_consumption(self, fusion_power: float) -> float:
-        """Calculate tritium consumption rate.
+    @classmethod
+    def calculate_neutronics_state_batch(cls, fusion_power: np.ndarray,
+                                         surface_area: np.ndarray,
+                                         lithium_density: Optional[np.ndarray] = None,
+                                         blanket_thickness: np.ndarray = 1.0,
+                                         li6_fraction: np.ndarray = 0.075,
+                                         initial_dpa: np.ndarray = 0.0,
+                                         dtype: np.dtype = np.float64) -> Dict[str, np.ndarray]:
+        """Calculate neutronics state for arrays of operating points.
+        
+        Vectorized form of calculate_neutronics_state; arguments broadcast
+        against each other. Results are computed in dtype (np.float32
+        halves the memory of large sweeps), except TBR, which stays float64.
         
-        Args:
-            fusion_power: Fusion power in W
-            
         Returns:
-            Tritium consumption rate in atoms/s
+            Dictionary of arrays keyed by NeutronicsState field name
         """
-        # Each D-T fusion consumes 1 tritium atom
-        # Energy per fusion = 17.6 MeV
-        energy_per_fusion = 17.6e6 * 1.602176634e-19  # J
+        fusion_power = np.asarray(fusion_power, dtype=dtype)
+        surface_area = np.asarray(surface_area, dtype=dtype)
+        fusion_power, surface_area = np.broadcast_arrays(fusion_power, surface_area)
+        if lithium_density is None:
+            lithium_density = _LI_ATOMS_PER_M3
+        lithium_density = np.asarray(lithium_density, dtype=dtype)
+        blanket_thickness = np.asarray(blanket_thickness, dtype=dtype)
+        li6_fraction = np.asarray(li6_fraction, dtype=dtype)
+        
+        # Flux and wall loading are zero where there is no wall area. Each
+        # output is allocated once and the pipeline runs in place on it.
+        has_area = surface_area != 0
+        neutron_flux = np.zeros(fusion_power.shape, dtype=dtype)
+        np.multiply(fusion_power, _NEUTRON_POWER_FRACTION, out=neutron_flux, where=has_area)
+        np.divide(neutron_flux, surface_area, out=neutron_flux, where=has_area)
+        wall_loading = np.multiply(neutron_flux, 1e-6)
+        neutron_flux *= _INV_NEUTRON_ENERGY_DT
         
-        if energy_per_fusion == 0:
-            return 0.0
+        tritium_consumption = np.multiply(fusion_power, _INV_ENERGY_PER_FUSION)
         
-        consumption_rate = fusion_power / energy_per_fusion
-        return consumption_rate
+        sigma_eff = (li6_fraction * cls.LI6_BREEDING_CROSS_SECTION +
+                     (1 - li6_fraction) * cls.LI7_BREEDING_CROSS_SECTION)
+        tritium_production = neutron_flux * (lithium_density * (sigma_eff * 1e-28) * blanket_thickness)
+        
+        tbr = tritium_breeding_ratio(tritium_production, tritium_consumption)
+        
+        dpa_rate = np.multiply(neutron_flux, 1e-24 * SECONDS_PER_YEAR)
+        
+        return {
+            'neutron_flux': neutron_flux,
+            'neutron_wall_loading': wall_loading,
+            'tritium_production_rate': tritium_production,
+            'tritium_breeding_ratio': tbr,
+            'dpa_rate': dpa_rate,
+            'material_damage_accumulated': np.broadcast_to(
+                np.asarray(initial_dpa, dtype=dtype), neutron_flux.shape
+            ),
+        }
     
-    def calculate_dpa_rate(self, neutron_flux: float, dpa_cross_section: float = 1e-24) -> float:
-        """Calculate displacement per atom (DPA) rate.
+    def calculate_neutronics_history(self, fusion_power: np.ndarray,
+                                     surface_area: np.ndarray,
+                                     lithium_density: Optional[np.ndarray] = None,
+                                     blanket_thickness: np.ndarray = 1.0,
+                                     li6_fraction: np.ndarray = 0.075,
+                                     initial_dpa: np.ndarray = 0.0) -> np.ndarray:
+        """Calculate neutronics states for a time series as a structured array.
         
-        Simplified model for material damage.
+        Same inputs as calculate_neutronics_state_batch.
+        
+        Returns:
+            1-D array of NEUTRONICS_DTYPE records
+        """
+        states = self.calculate_neutronics_state_batch(
+            fusion_power, surface_area, lithium_density, blanket_thickness,
+            li6_fraction, initial_dpa
+        )
+        history = np.empty(states['neutron_flux'].size, dtype=NEUTRONICS_DTYPE)
+        for name in NEUTRONICS_DTYPE.names:
+            history[name] = states[name].ravel()
+        return history
+    
+    def calculate_neutronics_sweep(self, fusion_power: np.ndarray,
+                                   surface_area: np.ndarray,
+                                   lithium_density: Optional[np.ndarray] = None,
+                                   blanket_thickness: np.ndarray = 1.0,
+                                   li6_fraction: np.ndarray = 0.075,
+                                   initial_dpa: np.ndarray = 0.0,
+                                   out: Optional[np.ndarray] = None,
+                                   chunk_size: int = SWEEP_CHUNK_SIZE,
+                                   n_workers: int = 1) -> np.ndarray:
+        """Calculate neutronics states for a large parameter sweep in chunks.
+        
+        Same inputs as calculate_neutronics_state_batch. The inputs are
+        broadcast lazily and evaluated a block of about chunk_size points
+        at a time, so only one block of temporaries is live per worker.
+        For sweeps that do not fit in memory, pass a memory-mapped out
+        (e.g. np.lib.format.open_memmap). NumPy releases the GIL in the
+        arithmetic, so n_workers > 1 evaluates blocks on a thread pool.
         
         Args:
-            neutron_flux: Neutron flux in n/(m²·s)
-            dpa_cross_section: Effective DPA cross-section in m²
+            out: NEUTRONICS_DTYPE array with one record per sweep point
+                (allocated if None)
+            chunk_size: Approximate number of points per block
+            n_workers: Number of worker threads
             
         Returns:
-            DPA rate in DPA/year
+            NEUTRONICS_DTYPE records in the broadcast shape of the inputs
         """
-        # DPA rate = flux * cross-section * time
-        # Convert to per year
-        seconds_per_year = 365.25 * 24 * 3600
+        if lithium_density is None:
+            lithium_density = _LI_ATOMS_PER_M3
+        inputs = np.broadcast_arrays(
+            np.atleast_1d(fusion_power), surface_area, lithium_density,
+            blanket_thickness, li6_fraction, initial_dpa
+        )
+        shape = inputs[0].shape
+        if out is None:
+            out = np.empty(shape, dtype=NEUTRONICS_DTYPE)
+        records = out.reshape(shape)
         
-        dpa_per_second = neutron_flux * dpa_cross_section
-        dpa_per_year = dpa_per_second * seconds_per_year
+        # Blocks are runs of whole rows along the first axis
+        row_size = int(np.prod(shape[1:]))
+        rows_per_block = max(1, chunk_size // max(row_size, 1))
         
-        return dpa_per_year
+        def evaluate(start: int):
+            stop = start + rows_per_block
+            states = self.calculate_neutronics_state_batch(
+                *(values[start:stop] for values in inputs)
+            )
+            block = records[start:stop]
+            for name in NEUTRONICS_DTYPE.names:
+                block[name] = states[name]
+        
+        starts = range(0, shape[0], rows_per_block)
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                # Consume the iterator so worker errors are raised here
+                list(executor.map(evaluate, starts))
+        else:
+            for start in starts:
+                evaluate(start)
+        return records
     
-    def calculate_neutronics_state(self, fusion_power: float, surface_area: float,
-                                  lithium_density: Optional[float] = None,
-                                  blanket_thickness: float = 1.0,
-                                  li6_fraction: float = 0.075,
-                                  initial_dpa: float = 0.0) -> NeutronicsState:
-        """Calculate complete neutronics state.
+    def make_specialized(self, surface_area: float,
+                         lithium_density: Optional[float] = None,
+                         blanket_thickness: float = 1.0,
+                         li6_fraction: float = 0.075) -> Callable[..., NeutronicsState]:
+        """Specialize calculate_neutronics_state for a fixed reactor geometry.
+        
+        Folds everything except fusion power into per-watt coefficients, so
+        each call of the returned function is a few multiplies. Results
+        agree with calculate_neutronics_state to rounding.
         
         Args:
-            fusion_power: Fusion power in W
             surface_area: First wall surface area in m²
             lithium_density: Lithium density in atoms/m³ (if None, calculated)
             blanket_thickness: Breeding blanket thickness in m
             li6_fraction: Fraction of Li-6
-            initial_dpa: Initial accumulated DPA
-            
+        
         Returns:
-            NeutronicsState object
+            Function (fusion_power, initial_dpa=0.0) -> NeutronicsState
         """
-        # Neutron flux
-        neutron_flux = self.calculate_neutron_flux(fusion_power, surface_area)
-        
-        # Neutron wall loading
-        wall_loading = self.calculate_neutron_wall_loading(fusion_power, surface_area)
-        
-        # Tritium consumption
-        tritium_consumption = self.calculate_tritium_consumption(fusion_power)
-        
-        # Tritium production (if breeding blanket present)
         if lithium_density is None:
-            # Estimate from material density (Li: ~534 kg/m³)
-            li_atomic_mass = 6.941 * 1.66053906660e-27  # kg
-            li_atoms_per_m3 = 534.0 / li_atomic_mass
-            lithium_density = li_atoms_per_m3
+            lithium_density = _LI_ATOMS_PER_M3
         
-        tritium_production = self.calculate_tritium_production(
-            neutron_flux, lithium_density, blanket_thickness, li6_fraction
-        )
+        # Neutron power per unit wall area per watt of fusion power
+        k_density = _NEUTRON_POWER_FRACTION / surface_area if surface_area != 0 else 0.0
+        k_flux = k_density * _INV_NEUTRON_ENERGY_DT
+        k_wall = k_density * 1e-6
+        k_tritium = (k_flux * lithium_density *
+                     _breeding_cross_section_m2(li6_fraction) * blanket_thickness)
+        k_dpa = k_flux * 1e-24 * SECONDS_PER_YEAR
+        # Production and consumption both scale with fusion power
+        tbr = k_tritium * ENERGY_PER_FUSION
         
-        # Tritium breeding ratio
-        tbr = self.calculate_tritium_breeding_ratio(tritium_production, tritium_consumption)
-        
-        # DPA rate
-        dpa_rate = self.calculate_dpa_rate(neutron_flux)
-        
-        # Accumulated damage: initial + rate * time
-        # dpa_rate is in DPA/year, so we need operation time in years
-        # For now, if initial_dpa is provided, use it directly (it should already include time)
-        # Otherwise, this will be updated by the simulator with proper time tracking
-        material_damage = initial_dpa  # Simulator will update this with proper time integration
-        
-        return NeutronicsState(
-            neutron_flux=neutron_flux,
-            neutron_wall_loading=wall_loading,
-            tritium_production_rate=tritium_production,
-            tritium_breeding_ratio=tbr,
-            dpa_rate=dpa_rate,
-            material_damage_accumulated=material_damage
-        )
-
+        def specialized_state(fusion_power: float, initial_dpa: float = 0.0) -> NeutronicsState:
+            return NeutronicsState(
+                neutron_flux=fusion_power * k_flux,
+                neutron_wall_loading=fusion_power * k_wall,
+                tritium_production_rate=fusion_power * k_tritium,
+                tritium_breeding_ratio=tbr if fusion_power != 0 else 0.0,
+                dpa_rate=fusion_power * k_dpa,
+                material_damage_accumulated=initial_dpa
+            )
+        
+        return specialized_state
+    
+    def calculate_neutronics_state(self, fusion_power: float, surface_area: float,
+                                  lithium_density: Optional[float] = None,
+                                  blanket_thickness: float = 1.0,
+                                  li6_fraction: float = 0.075,
+                                  initial_dpa: float = 0.0) -> NeutronicsState:
+        """Calculate complete neutronics state; see neutronics_state."""
+        return neutronics_state(fusion_power, surface_area, lithium_density,
+                                blanket_thickness, li6_fraction, initial_dpa)
@@ -7,12 +7,110 @@ Implements:
 - Plasma temperature and density calculations
 """
 
+import math
 import numpy as np
 from typing import Dict, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# Physical constants
+K_B = 1.380649e-23  # Boltzmann constant (J/K)
+E_CHARGE = 1.602176634e-19  # Elementary charge (C)
+K_TO_KEV = K_B / (E_CHARGE * 1000.0)  # keV per K
+_DT_FUSION_ENERGY = 17.6e6 * E_CHARGE  # J (17.6 MeV per reaction)
+_LAWSON_NTAU_MIN = 1e20  # m⁻³·s
+_Z_EFF = 1.5  # Effective charge for D-T plasma (including alpha particles)
+_BREMS_COEFF = 5.35e-37 * _Z_EFF**2  # W·m³/keV^½, Z_eff² folded in
+
+
+def _sigma_v_kernel(T_kev: float) -> float:
+    """D-T <σv> in m³/s on a plain float keV temperature, zero below 0.1 keV."""
+    if T_kev < 0.1:
+        return 0.0
+    # <σv> ≈ 3.7e-19 * T^(-2/3) * exp(-19.94/T^(1/3))
+    return max(0.0, 3.7e-19 * T_kev**(-2.0/3.0) * math.exp(-19.94 / T_kev**(1.0/3.0)))
+
+
+# Cached <σv> for the public scalar methods, whose callers (scans, repeated
+# queries) revisit the same temperatures. The stepping kernels below call
+# _sigma_v_kernel directly since the temperature changes every step.
+SIGMA_V_CACHE_SIZE = 4096
+_sigma_v_cached = lru_cache(maxsize=SIGMA_V_CACHE_SIZE)(_sigma_v_kernel)
+
+
+def _fusion_power_kernel(density: float, T_kev: float) -> float:
+    """D-T fusion power density in W/m³ on plain floats, equal D and T densities."""
+    n_half = density / 2.0
+    return max(0.0, n_half * n_half * _sigma_v_kernel(T_kev)) * _DT_FUSION_ENERGY
+
+
+def _lawson_kernel(n_tau: float, T_kev: float) -> bool:
+    """Lawson test: nτ above the minimum, in the 5-60 keV D-T window."""
+    return n_tau >= _LAWSON_NTAU_MIN and 5.0 <= T_kev <= 60.0
+
+
+def _bremsstrahlung_kernel(density: float, T_kev: float) -> float:
+    """Bremsstrahlung loss in W/m³ on plain floats, zero for T <= 0."""
+    if T_kev <= 0:
+        return 0.0
+    return _BREMS_COEFF * (density*density) * math.sqrt(T_kev)
+
+
+def _synchrotron_kernel(density: float, T_kev: float, magnetic_field: float,
+                        bremsstrahlung: float) -> float:
+    """Synchrotron loss in W/m³ on plain floats, capped at 50% of bremsstrahlung."""
+    if T_kev <= 0:
+        return 0.0
+    # T^2.5 as T²·√T
+    return min(1e-17 * (magnetic_field*magnetic_field) * (T_kev*T_kev*math.sqrt(T_kev)) * density,
+               bremsstrahlung * 0.5)
+
+
+def plasma_kernel(density: float, temperature: float, confinement_time: float,
+                  magnetic_field: float) -> Tuple[float, float, float, float, float, float, bool, float]:
+    """Calculate the plasma state values on plain floats.
+    
+    The allocation-free form of PlasmaPhysics.calculate_plasma_state, for
+    callers that evaluate it every time step. Computes the keV temperature
+    and bremsstrahlung once and shares them between the rate, loss and
+    Lawson calculations.
+    
+    Args:
+        density: Plasma density in m⁻³
+        temperature: Plasma temperature in K
+        confinement_time: Energy confinement time in s
+        magnetic_field: Magnetic field in T
+        
+    Returns:
+        Tuple of (triple product, fusion power density, bremsstrahlung,
+        synchrotron, total loss, net power density, meets Lawson,
+        temperature in keV) in the units of PlasmaState
+    """
+    T_kev = temperature * K_TO_KEV
+    
+    fusion_power = _fusion_power_kernel(density, T_kev)
+    
+    # Bremsstrahlung is computed once and reused for the synchrotron cap
+    bremsstrahlung = _bremsstrahlung_kernel(density, T_kev)
+    synchrotron = _synchrotron_kernel(density, T_kev, magnetic_field, bremsstrahlung)
+    total_loss = bremsstrahlung + synchrotron
+    
+    n_tau = density * confinement_time
+    return (n_tau * temperature, fusion_power, bremsstrahlung, synchrotron,
+            total_loss, fusion_power - total_loss, _lawson_kernel(n_tau, T_kev), T_kev)
+
+
+def _sigma_v_array(T_kev: np.ndarray) -> np.ndarray:
+    """D-T <σv> in m³/s over keV temperatures, zero below 0.1 keV."""
+    sigma_v = np.zeros_like(T_kev)
+    hot = ~(T_kev < 0.1)
+    T_hot = T_kev[hot]
+    sigma_v[hot] = 3.7e-19 * np.power(T_hot, -2.0/3.0) * np.exp(-19.94 / np.power(T_hot, 1.0/3.0))
+    return np.maximum(sigma_v, 0.0, out=sigma_v)
+
+
+@dataclass(slots=True)
 class PlasmaState:
     """Current state of the plasma."""
     temperature: float  # K
@@ -25,14 +123,16 @@ class PlasmaState:
     total_loss: float  # W/m³
     net_power_density: float  # W/m³
     meets_lawson_criterion: bool
+    temperature_kev: float = 0.0  # keV
 
 
 class PlasmaPhysics:
     """Plasma physics calculations for fusion reactors."""
     
     # Physical constants
-    K_B = 1.380649e-23  # Boltzmann constant (J/K)
-    E_CHARGE = 1.602176634e-19  # Elementary charge (C)
+    K_B = K_B
+    E_CHARGE = E_CHARGE
+    K_TO_KEV = K_TO_KEV
     M_PROTON = 1.67262192369e-27  # Proton mass (kg)
     M_DEUTERON = 2.014 * M_PROTON  # Deuterium mass
     M_TRITON = 3.016 * M_PROTON  # Tritium mass
@@ -60,32 +160,24 @@ class PlasmaPhysics:
         Uses empirical formula for D-T fusion.
         <σv> ≈ 3.7e-19 * T^(-2/3) * exp(-19.94/T^(1/3))  [m³/s]
         
+        Accepts a float or an array of temperatures.
+        
         Args:
             temperature_kev: Plasma temperature in keV
             
         Returns:
             <σv> in m³/s
         """
-        if temperature_kev <= 0:
-            return 0.0
-        
-        if temperature_kev < 0.1:
-            return 0.0
-        
-        # <σv> formula for D-T fusion
-        T_third = np.power(temperature_kev, 1.0/3.0)
-        T_neg23 = np.power(temperature_kev, -2.0/3.0)
-        
-        # Coefficients for D-T fusion
-        C1 = 3.7e-19  # m³/s
-        C2 = 19.94  # keV^(1/3)
-        
-        sigma_v = C1 * T_neg23 * np.exp(-C2 / T_third)
-        return max(0.0, sigma_v)
+        if np.ndim(temperature_kev):
+            return _sigma_v_array(np.asarray(temperature_kev, dtype=np.float64))
+        # float() so 0-d arrays, which np.ndim counts as scalars, are hashable
+        return _sigma_v_cached(float(temperature_kev))
     
     def calculate_fusion_reaction_rate(self, density: float, temperature: float) -> float:
         """Calculate D-T fusion reaction rate.
         
+        Density and temperature may be arrays and broadcast together.
+        
         Args:
             density: Plasma density in m⁻³ (assumes equal D and T densities)
             temperature: Plasma temperature in K
@@ -94,7 +186,7 @@ class PlasmaPhysics:
             Reaction rate in reactions/(m³·s)
         """
         # Convert temperature to keV
-        T_kev = temperature * self.K_B / (self.E_CHARGE * 1000.0)
+        T_kev = temperature * self.K_TO_KEV
         
         # Get <σv> directly (more accurate)
         sigma_v = self.calculate_fusion_reaction_rate_coefficient(T_kev)
@@ -105,11 +197,15 @@ class PlasmaPhysics:
         n_t = density / 2.0
         
         reaction_rate = n_d * n_t * sigma_v
+        if np.ndim(reaction_rate):
+            return np.maximum(reaction_rate, 0.0)
         return max(0.0, reaction_rate)
     
     def calculate_fusion_power_density(self, density: float, temperature: float) -> float:
         """Calculate fusion power density.
         
+        Density and temperature may be arrays and broadcast together.
+        
         Args:
             density: Plasma density in m⁻³
             temperature: Plasma temperature in K
@@ -117,13 +213,33 @@ class PlasmaPhysics:
         Returns:
             Power density in W/m³
         """
-        reaction_rate = self.calculate_fusion_reaction_rate(density, temperature)
-        power_density = reaction_rate * self.DT_FUSION_ENERGY
-        return power_density
+        if np.ndim(density) or np.ndim(temperature):
+            reaction_rate = self.calculate_fusion_reaction_rate(density, temperature)
+            return reaction_rate * self.DT_FUSION_ENERGY
+        return _fusion_power_kernel(density, temperature * self.K_TO_KEV)
+    
+    def calculate_fusion_power_density_batch(self, density: np.ndarray,
+                                             temperature: np.ndarray) -> np.ndarray:
+        """Calculate fusion power density over broadcast arrays.
+        
+        Args:
+            density: Plasma densities in m⁻³
+            temperature: Plasma temperatures in K
+        
+        Returns:
+            Power densities in W/m³, same formula as the scalar path
+        """
+        density, temperature = np.broadcast_arrays(
+            np.asarray(density, dtype=np.float64),
+            np.asarray(temperature, dtype=np.float64)
+        )
+        return np.asarray(self.calculate_fusion_power_density(density, temperature))
     
     def calculate_bremsstrahlung_loss(self, density: float, temperature: float) -> float:
         """Calculate bremsstrahlung radiation loss.
         
+        Density and temperature may be arrays and broadcast together.
+        
         Args:
             density: Plasma density in m⁻³
             temperature: Plasma temperature in K
@@ -133,19 +249,19 @@ class PlasmaPhysics:
         """
         # Bremsstrahlung: P_brem ≈ 5.35e-37 * n² * sqrt(T) * Z_eff²
         # For D-T plasma, Z_eff ≈ 1.5 (including alpha particles)
-        Z_eff = 1.5
-        T_kev = temperature * self.K_B / (self.E_CHARGE * 1000.0)
+        T_kev = temperature * self.K_TO_KEV
         
-        if T_kev <= 0:
-            return 0.0
-        
-        power_loss = 5.35e-37 * density**2 * np.sqrt(T_kev) * Z_eff**2
-        return power_loss
+        if np.ndim(T_kev) or np.ndim(density):
+            power_loss = _BREMS_COEFF * np.square(density) * np.sqrt(np.maximum(T_kev, 0.0))
+            return np.where(T_kev > 0, power_loss, 0.0)
+        return _bremsstrahlung_kernel(density, T_kev)
     
     def calculate_synchrotron_loss(self, density: float, temperature: float, 
                                    magnetic_field: float) -> float:
         """Calculate synchrotron radiation loss.
         
+        All arguments may be arrays and broadcast together.
+        
         Args:
             density: Plasma density in m⁻³
             temperature: Plasma temperature in K
@@ -157,22 +273,19 @@ class PlasmaPhysics:
         # Synchrotron radiation formula (more accurate)
         # P_sync ≈ 6.21e-16 * B² * T² * n * (1 - R) where R is reflection coefficient
         # For typical tokamak conditions, synchrotron is usually much smaller than bremsstrahlung
-        T_kev = temperature * self.K_B / (self.E_CHARGE * 1000.0)
+        T_kev = temperature * self.K_TO_KEV
         
-        if T_kev <= 0:
-            return 0.0
+        if np.ndim(T_kev) or np.ndim(density) or np.ndim(magnetic_field):
+            T_pos = np.maximum(T_kev, 0.0)
+            power_loss = 1e-17 * np.square(magnetic_field) * (T_pos*T_pos*np.sqrt(T_pos)) * density
+            bremsstrahlung = self.calculate_bremsstrahlung_loss(density, temperature)
+            return np.where(T_kev > 0, np.minimum(power_loss, bremsstrahlung * 0.5), 0.0)
         
         # More realistic formula: synchrotron is typically 10-100x smaller than bremsstrahlung
-        # Simplified: P_sync ≈ 1e-17 * B² * T^2.5 * n (rough approximation)
-        # Or use: P_sync ≈ 0.1 * P_brem for typical conditions
-        # For now, use a more conservative estimate
-        power_loss = 1e-17 * magnetic_field**2 * np.power(T_kev, 2.5) * density
-        
-        # Cap synchrotron loss to be reasonable compared to bremsstrahlung
-        bremsstrahlung = self.calculate_bremsstrahlung_loss(density, temperature)
-        power_loss = min(power_loss, bremsstrahlung * 0.5)  # Synchrotron < 50% of bremsstrahlung
-        
-        return power_loss
+        # Simplified: P_sync ≈ 1e-17 * B² * T^2.5 * n (rough approximation),
+        # capped to be reasonable compared to bremsstrahlung
+        return _synchrotron_kernel(density, T_kev, magnetic_field,
+                                   _bremsstrahlung_kernel(density, T_kev))
     
     def calculate_triple_product(self, density: float, confinement_time: float, 
                                 temperature: float) -> float:
@@ -201,19 +314,13 @@ class PlasmaPhysics:
             Tuple of (meets_criterion, nτ, required_nτ)
         """
         n_tau = density * confinement_time
-        required_n_tau = self.LAWSON_NTAU_MIN
-        
-        # Check temperature is in acceptable range for D-T fusion
-        # Optimal temperature: 10-20 keV, but can work up to ~50 keV
-        # Convert to keV for comparison
-        T_kev = temperature * self.K_B / (self.E_CHARGE * 1000.0)
-        # Acceptable range: 5-60 keV (wider range - fusion can occur at higher T, just less optimal)
-        optimal_temp_range_kev = (5.0, 60.0)  # keV
-        temp_ok = optimal_temp_range_kev[0] <= T_kev <= optimal_temp_range_kev[1]
         
-        meets_criterion = (n_tau >= required_n_tau) and temp_ok
+        # Temperature must be in the acceptable range for D-T fusion:
+        # optimal is 10-20 keV, but 5-60 keV is accepted (fusion can occur
+        # at higher T, just less optimally)
+        meets_criterion = _lawson_kernel(n_tau, temperature * self.K_TO_KEV)
         
-        return meets_criterion, n_tau, required_n_tau
+        return meets_criterion, n_tau, self.LAWSON_NTAU_MIN
     
     def calculate_plasma_state(self, density: float, temperature: float,
                               confinement_time: float, magnetic_field: float) -> PlasmaState:
@@ -228,23 +335,9 @@ class PlasmaPhysics:
         Returns:
             PlasmaState object with all calculated parameters
         """
-        # Fusion power
-        fusion_power = self.calculate_fusion_power_density(density, temperature)
-        
-        # Losses
-        bremsstrahlung = self.calculate_bremsstrahlung_loss(density, temperature)
-        synchrotron = self.calculate_synchrotron_loss(density, temperature, magnetic_field)
-        total_loss = bremsstrahlung + synchrotron
-        
-        # Net power
-        net_power = fusion_power - total_loss
-        
-        # Triple product
-        triple_product = self.calculate_triple_product(density, confinement_time, temperature)
-        
-        # Lawson criterion
-        meets_lawson, n_tau, required_n_tau = self.check_lawson_criterion(
-            density, confinement_time, temperature
+        (triple_product, fusion_power, bremsstrahlung, synchrotron,
+         total_loss, net_power, meets_lawson, temperature_kev) = plasma_kernel(
+            density, temperature, confinement_time, magnetic_field
         )
         
         return PlasmaState(
@@ -257,6 +350,48 @@ class PlasmaPhysics:
             synchrotron_loss=synchrotron,
             total_loss=total_loss,
             net_power_density=net_power,
-            meets_lawson_criterion=meets_lawson
+            meets_lawson_criterion=meets_lawson,
+            temperature_kev=temperature_kev
+        )
+    
+    def calculate_plasma_state_batch(self, density: np.ndarray, temperature: np.ndarray,
+                                     confinement_time: np.ndarray,
+                                     magnetic_field: np.ndarray) -> Dict[str, np.ndarray]:
+        """Calculate plasma states over broadcast arrays.
+        
+        Args:
+            density: Plasma densities in m⁻³
+            temperature: Plasma temperatures in K
+            confinement_time: Energy confinement times in s
+            magnetic_field: Magnetic field strengths in T
+            
+        Returns:
+            Dictionary of arrays keyed by PlasmaState field names
+        """
+        density, temperature, confinement_time, magnetic_field = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64)
+              for x in (density, temperature, confinement_time, magnetic_field))
         )
+        fusion_power = self.calculate_fusion_power_density(density, temperature)
+        bremsstrahlung = self.calculate_bremsstrahlung_loss(density, temperature)
+        synchrotron = self.calculate_synchrotron_loss(density, temperature, magnetic_field)
+        total_loss = bremsstrahlung + synchrotron
+        
+        n_tau = density * confinement_time
+        T_kev = temperature * K_TO_KEV
+        meets_lawson = (n_tau >= _LAWSON_NTAU_MIN) & (T_kev >= 5.0) & (T_kev <= 60.0)
+        
+        return {
+            'temperature': temperature,
+            'density': density,
+            'confinement_time': confinement_time,
+            'triple_product': n_tau * temperature,
+            'fusion_power_density': fusion_power,
+            'bremsstrahlung_loss': bremsstrahlung,
+            'synchrotron_loss': synchrotron,
+            'total_loss': total_loss,
+            'net_power_density': fusion_power - total_loss,
+            'meets_lawson_criterion': meets_lawson,
+            'temperature_kev': T_kev,
+        }
 
@@ -7,12 +7,68 @@ Implements:
 - Heating power requirements
 """
 
+import math
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 from dataclasses import dataclass
 
 
-@dataclass
+_EV_PER_K = 8.617333262e-5  # Boltzmann constant in eV/K
+_SPITZER_COEFF = 65.0 * 1.5 * 0.2  # Spitzer η coefficient × Z_eff × neoclassical factor
+
+# NRL electron-ion Coulomb logarithm constants (n in cm⁻³, T in eV) for the
+# branches below and above 10 eV, and the inverse width of the tanh blend
+# between them
+_LN_LAMBDA_LOW = 23.0
+_LN_LAMBDA_HIGH = 24.0
+_LN_LAMBDA_SWITCH_EV = 10.0
+_INV_BLEND_WIDTH_EV = 1.0 / 0.1
+
+
+def plasma_resistance_kernel(major_radius: float, minor_radius: float,
+                             temperature: float, density: float) -> float:
+    """Calculate the Spitzer plasma resistance on plain floats.
+    
+    The function behind PowerCalculator.calculate_plasma_resistance, for
+    callers that evaluate it every time step.
+    
+    Args:
+        major_radius: Major radius in m
+        minor_radius: Minor radius in m
+        temperature: Plasma temperature in K
+        density: Plasma density in m⁻³
+        
+    Returns:
+        Plasma resistance in Ω
+    """
+    T_ev = temperature * _EV_PER_K  # Convert K to eV
+    if T_ev <= 0:
+        return float('inf')
+    
+    # Coulomb logarithm ln(Λ) ≈ 17.3 + 1.5*ln(T_keV) - 0.5*ln(n_20), bounded to 10-20
+    T_kev = T_ev / 1000.0
+    n_20 = density / 1e20
+    if T_kev > 0 and n_20 > 0:
+        # 1.5*ln(T) - 0.5*ln(n) folded into a single log
+        ln_lambda = 17.3 + 0.5 * math.log(T_kev*T_kev*T_kev / n_20)
+        ln_lambda = max(10.0, min(20.0, ln_lambda))
+    else:
+        ln_lambda = 15.0
+    
+    # Spitzer resistivity η = 65 * Z_eff * ln(Λ) / T^1.5 (Ω·m, Z_eff = 1.5),
+    # with a neoclassical correction factor of 0.2
+    resistivity = _SPITZER_COEFF * ln_lambda / (T_ev * math.sqrt(T_ev))
+    
+    # R = ρ * L / A over the toroidal circumference 2πR₀ and plasma
+    # cross-section πa², i.e. ρ * 2R₀ / a²
+    if minor_radius == 0:
+        return float('inf')
+    
+    # Bounded to 0.1-10 μΩ, typical of large tokamaks
+    return max(1e-7, min(1e-5, resistivity * (2.0 * major_radius) / (minor_radius*minor_radius)))
+
+
+@dataclass(slots=True)
 class PowerBalance:
     """Power balance state."""
     fusion_power: float  # W
@@ -25,6 +81,46 @@ class PowerBalance:
     ignition: bool  # Q → ∞ (self-sustaining)
 
 
+# Record layout of PowerCalculator.calculate_power_balance_batch(structured=True)
+POWER_BALANCE_DTYPE = np.dtype([
+    ('fusion_power', 'f8'),
+    ('input_power', 'f8'),
+    ('output_power', 'f8'),
+    ('thermal_power', 'f8'),
+    ('q_factor', 'f8'),
+    ('net_efficiency', 'f8'),
+    ('breakeven', '?'),
+    ('ignition', '?'),
+])
+
+
+def _power_balance_kernel(fusion_power: float, input_power: float,
+                          bremsstrahlung_loss: float, synchrotron_loss: float,
+                          efficiency: float) -> Tuple[float, float, float, float, bool, bool]:
+    """Power balance on plain floats; see calculate_power_balance.
+    
+    Returns:
+        Tuple of (Q factor, thermal power, net power, net efficiency,
+        breakeven, ignition) in the units of PowerBalance
+    """
+    if input_power == 0:
+        q_factor = math.inf if fusion_power > 0 else 0.0
+    else:
+        q_factor = fusion_power / input_power
+    
+    # Thermal power is fusion plus input power less radiation losses
+    thermal_power = max(0.0, fusion_power + input_power - (bremsstrahlung_loss + synchrotron_loss))
+    net_power = thermal_power * efficiency - input_power
+    
+    if input_power > 0:
+        net_efficiency = net_power / input_power
+    else:
+        net_efficiency = math.inf if net_power > 0 else 0.0
+    
+    return (q_factor, thermal_power, net_power, net_efficiency,
+            q_factor > 1.0, q_factor > 10.0 or math.isinf(q_factor))
+
+
 class PowerCalculator:
     """Power balance calculations for fusion reactors."""
     
@@ -42,6 +138,9 @@ class PowerCalculator:
         
         Q = P_fusion / P_input
         
+        Accepts floats or arrays; arrays broadcast and give a float64 array
+        from a single masked divide.
+        
         Args:
             fusion_power: Fusion power in W
             input_power: Input power in W
@@ -49,6 +148,12 @@ class PowerCalculator:
         Returns:
             Q factor (infinity if input_power = 0 and fusion_power > 0)
         """
+        if np.ndim(fusion_power) or np.ndim(input_power):
+            fusion_power, input_power = np.broadcast_arrays(fusion_power, input_power)
+            q = np.where(fusion_power > 0, np.inf, 0.0)
+            np.divide(fusion_power, input_power, out=q,
+                      where=input_power != 0, dtype=np.float64)
+            return q
         if input_power == 0:
             if fusion_power > 0:
                 return float('inf')
@@ -100,49 +205,37 @@ class PowerCalculator:
         """
         # Spitzer resistivity: η = m_e * ν_ei / (n_e * e²)
         # More accurate: η ≈ 65 * Z * ln(Λ) / T^1.5 (in Ω·m, T in eV)
-        # For D-T plasma, Z_eff ≈ 1.5 (including alpha particles)
-        
-        T_ev = temperature * 8.617333262e-5  # Convert K to eV
-        if T_ev <= 0:
-            return float('inf')
-        
-        # Coulomb logarithm: ln(Λ) ≈ 15-20 for fusion plasmas
-        # More accurate: ln(Λ) ≈ 17.3 + 1.5*ln(T_keV) - 0.5*ln(n_20)
-        T_kev = T_ev / 1000.0
-        n_20 = density / 1e20
-        if T_kev > 0 and n_20 > 0:
-            ln_lambda = 17.3 + 1.5 * np.log(T_kev) - 0.5 * np.log(n_20)
-            ln_lambda = max(10.0, min(20.0, ln_lambda))  # Bound between 10-20
-        else:
-            ln_lambda = 15.0
-        
-        Z_eff = 1.5  # Effective charge for D-T plasma
-        
-        # Resistivity in Ω·m (Spitzer formula)
-        # η = 65 * Z_eff * ln(Λ) / T^1.5
-        resistivity = 65.0 * Z_eff * ln_lambda / (T_ev**1.5)
-        
         # For tokamaks, the effective resistance is much lower due to
         # current profile and neoclassical effects
-        # Apply neoclassical correction factor (typically 0.1-0.3)
-        neoclassical_factor = 0.2
-        resistivity *= neoclassical_factor
-        
-        # Resistance: R = ρ * L / A
-        # For tokamak: effective length is toroidal circumference
-        # Effective area is plasma cross-section
-        length = 2.0 * np.pi * major_radius
-        area = np.pi * minor_radius**2
+        return plasma_resistance_kernel(major_radius, minor_radius, temperature, density)
+    
+    @staticmethod
+    def calculate_coulomb_logarithm_smooth(density: float, temperature: float) -> float:
+        """Calculate a smooth electron-ion Coulomb logarithm.
         
-        if area == 0:
-            return float('inf')
+        Blends the NRL forms below and above 10 eV with a tanh step 0.1 eV
+        wide, so ln(Λ) and all its derivatives are continuous, unlike the
+        two-branch form. Suited to gradient-based solvers and optimizers.
         
-        resistance = resistivity * length / area
+        Accepts floats or arrays.
         
-        # Ensure reasonable bounds (typically 0.1-10 μΩ for large tokamaks)
-        resistance = max(1e-7, min(1e-5, resistance))
+        Args:
+            density: Electron density in m⁻³
+            temperature: Electron temperature in K
+            
+        Returns:
+            Coulomb logarithm ln(Λ)
+        """
+        T_ev = np.asarray(temperature, dtype=np.float64) * _EV_PER_K
+        half_ln_n = 0.5 * np.log(np.asarray(density, dtype=np.float64) * 1e-6)
+        ln_T = np.log(T_ev)
         
-        return resistance
+        # ln Λ = 23 - ln(n^½ T^-3/2) below 10 eV, 24 - ln(n^½ T^-1) above
+        low = _LN_LAMBDA_LOW - half_ln_n + 1.5 * ln_T
+        high = _LN_LAMBDA_HIGH - half_ln_n + ln_T
+        blend = 0.5 * (np.tanh((T_ev - _LN_LAMBDA_SWITCH_EV) * _INV_BLEND_WIDTH_EV) + 1.0)
+        ln_lambda = low + blend * (high - low)
+        return ln_lambda if ln_lambda.ndim else float(ln_lambda)
     
     def calculate_thermal_power(self, fusion_power: float, input_power: float,
                                 bremsstrahlung_loss: float, synchrotron_loss: float) -> float:
@@ -150,6 +243,8 @@ class PowerCalculator:
         
         Thermal power = fusion power + input power - radiation losses
         
+        Arguments may be arrays and broadcast together.
+        
         Args:
             fusion_power: Fusion power in W
             input_power: Input power in W
@@ -161,6 +256,8 @@ class PowerCalculator:
         """
         radiation_loss = bremsstrahlung_loss + synchrotron_loss
         thermal = fusion_power + input_power - radiation_loss
+        if np.ndim(thermal):
+            return np.maximum(thermal, 0.0)
         return max(0.0, thermal)
     
     def calculate_electrical_output(self, thermal_power: float) -> float:
@@ -189,6 +286,8 @@ class PowerCalculator:
     def check_breakeven(self, q_factor: float) -> bool:
         """Check if reactor is at breakeven (Q > 1).
         
+        Accepts a float or an array, giving an elementwise boolean array.
+        
         Args:
             q_factor: Q factor
             
@@ -200,6 +299,9 @@ class PowerCalculator:
     def check_ignition(self, q_factor: float, threshold: float = 10.0) -> bool:
         """Check if reactor is near ignition (self-sustaining).
         
+        Accepts a float or an array; arrays are tested elementwise with a
+        single mask instead of a per-element branch.
+        
         Args:
             q_factor: Q factor
             threshold: Threshold for "ignition" (default 10)
@@ -207,7 +309,9 @@ class PowerCalculator:
         Returns:
             True if Q > threshold
         """
-        return q_factor > threshold or np.isinf(q_factor)
+        if np.ndim(q_factor):
+            return (q_factor > threshold) | np.isinf(q_factor)
+        return q_factor > threshold or math.isinf(q_factor)
     
     def calculate_power_balance(self, fusion_power: float, input_power: float,
                                bremsstrahlung_loss: float, synchrotron_loss: float) -> PowerBalance:
@@ -222,28 +326,13 @@ class PowerCalculator:
         Returns:
             PowerBalance object
         """
-        # Q factor
-        q_factor = self.calculate_q_factor(fusion_power, input_power)
-        
-        # Thermal power
-        thermal_power = self.calculate_thermal_power(fusion_power, input_power,
-                                                     bremsstrahlung_loss, synchrotron_loss)
-        
-        # Electrical output
-        electrical_output = self.calculate_electrical_output(thermal_power)
-        
-        # Net power
-        net_power = self.calculate_net_power(electrical_output, input_power)
-        
-        # Efficiency
-        if input_power > 0:
-            net_efficiency = net_power / input_power
-        else:
-            net_efficiency = float('inf') if net_power > 0 else 0.0
-        
-        # Breakeven and ignition
-        breakeven = self.check_breakeven(q_factor)
-        ignition = self.check_ignition(q_factor)
+        # Q factor, thermal and electrical output, net power and efficiency
+        # in one pass on plain floats
+        (q_factor, thermal_power, net_power, net_efficiency,
+         breakeven, ignition) = _power_balance_kernel(
+            fusion_power, input_power, bremsstrahlung_loss, synchrotron_loss,
+            self.THERMAL_TO_ELECTRICAL_EFFICIENCY
+        )
         
         return PowerBalance(
             fusion_power=fusion_power,
@@ -255,4 +344,53 @@ class PowerCalculator:
             breakeven=breakeven,
             ignition=ignition
         )
-
+    
+    def calculate_power_balance_batch(self, fusion_power: np.ndarray, input_power: np.ndarray,
+                                      bremsstrahlung_loss: np.ndarray,
+                                      synchrotron_loss: np.ndarray,
+                                      structured: bool = False) -> Union[Dict[str, np.ndarray], np.ndarray]:
+        """Calculate power balances over broadcast arrays, e.g. a run history.
+        
+        Args:
+            fusion_power: Fusion powers in W
+            input_power: Input powers in W
+            bremsstrahlung_loss: Bremsstrahlung losses in W
+            synchrotron_loss: Synchrotron losses in W
+            structured: Return a single POWER_BALANCE_DTYPE structured array,
+                one record per balance, e.g. for saving a run with np.save
+            
+        Returns:
+            Dictionary of arrays keyed by PowerBalance field names, or a
+            POWER_BALANCE_DTYPE array of the broadcast shape if structured
+        """
+        fusion_power, input_power, bremsstrahlung_loss, synchrotron_loss = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(x, dtype=np.float64))
+              for x in (fusion_power, input_power, bremsstrahlung_loss, synchrotron_loss))
+        )
+        q_factor = self.calculate_q_factor(fusion_power, input_power)
+        thermal_power = self.calculate_thermal_power(fusion_power, input_power,
+                                                     bremsstrahlung_loss, synchrotron_loss)
+        net_power = self.calculate_net_power(self.calculate_electrical_output(thermal_power),
+                                             input_power)
+        
+        # Efficiency, with the scalar path's convention for no input power
+        net_efficiency = np.where(net_power > 0, np.inf, 0.0)
+        np.divide(net_power, input_power, out=net_efficiency, where=input_power > 0)
+        
+        balances = {
+            'fusion_power': fusion_power,
+            'input_power': input_power,
+            'output_power': net_power,
+            'thermal_power': thermal_power,
+            'q_factor': q_factor,
+            'net_efficiency': net_efficiency,
+            'breakeven': self.check_breakeven(q_factor),
+            'ignition': self.check_ignition(q_factor),
+        }
+        if not structured:
+            return balances
+        
+        records = np.empty(fusion_power.shape, dtype=POWER_BALANCE_DTYPE)
+        for name, values in balances.items():
+            records[name] = values
+        return records
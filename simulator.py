@@ -3,23 +3,28 @@
 Integrates all physics modules and provides a unified interface.
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
+import sys
 import time
-import matplotlib.pyplot as plt
 
-from physics.plasma import PlasmaPhysics, PlasmaState
+from physics.plasma import PlasmaPhysics, PlasmaState, plasma_kernel
 from physics.magnetic import MagneticConfinement, TokamakGeometry, MagneticState
-from physics.power import PowerCalculator, PowerBalance
-from physics.neutronics import NeutronicsCalculator, NeutronicsState
+from physics.power import PowerCalculator, PowerBalance, plasma_resistance_kernel
+from physics.neutronics import (
+    NeutronicsCalculator, NeutronicsState, ENERGY_PER_FUSION, SECONDS_PER_YEAR
+)
 from materials.materials import MaterialDatabase, Material
-from visualization.plotter import ReactorPlotter
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReactorConfiguration:
-    """Reactor configuration parameters."""
+    """Reactor configuration parameters.
+    
+    Immutable; use dataclasses.replace to derive a modified configuration.
+    """
     # Geometry
     major_radius: float = 6.2  # m (ITER-like)
     minor_radius: float = 2.0  # m
@@ -50,7 +55,208 @@ class ReactorConfiguration:
     min_tritium_inventory: float = 1e23  # atoms (minimum required for operation)
 
 
-@dataclass
+def _calculate_state_core(major_radius: float, minor_radius: float, elongation: float,
+                          toroidal_field: float, plasma_current: float,
+                          external_heating_MW: float, plasma_volume: float,
+                          temperature: float, density: float) -> Tuple:
+    """Physics of one simulator step on plain floats.
+    
+    Chains the resistance, ohmic heating, confinement scaling and plasma
+    kernels without building intermediate objects; calculate_state wraps
+    the results in state dataclasses and runs the diagnostics.
+    
+    Returns:
+        Tuple of (confinement time, triple product, fusion power density,
+        bremsstrahlung, synchrotron, total loss, net power density, meets
+        Lawson, temperature in keV, total fusion power, total
+        bremsstrahlung, total synchrotron)
+    """
+    # Ohmic heating is treated separately in the confinement scaling
+    # (less effective for confinement than external heating)
+    plasma_resistance = plasma_resistance_kernel(major_radius, minor_radius,
+                                                 temperature, density)
+    ohmic_heating_MW = plasma_current**2 * plasma_resistance / 1e6
+    
+    confinement_time = MagneticConfinement.calculate_confinement_time_scaling(
+        major_radius,
+        minor_radius,
+        density,
+        temperature,
+        toroidal_field,
+        plasma_current,
+        elongation,
+        heating_power_MW=external_heating_MW,
+        ohmic_heating_MW=ohmic_heating_MW,
+        use_improved_scaling=True
+    )
+    
+    plasma = plasma_kernel(density, temperature, confinement_time, toroidal_field)
+    fusion_power_density, bremsstrahlung, synchrotron = plasma[1:4]
+    return (confinement_time, *plasma,
+            fusion_power_density * plasma_volume,
+            bremsstrahlung * plasma_volume,
+            synchrotron * plasma_volume)
+
+
+
+def _evolve_core(temperature: float, density: float, tritium: float, deuterium: float,
+                 damage: float, fusion_power: float, input_power: float,
+                 total_loss: float, plasma_volume: float, fusion_power_density: float,
+                 tritium_production_rate: float, dpa_rate: float,
+                 dt: float) -> Tuple[float, float, float, float]:
+    """Advance the evolving reactor quantities by dt on plain floats.
+    
+    Returns:
+        Tuple of (temperature K, tritium atoms, deuterium atoms, damage DPA)
+    """
+    # Plasma temperature evolution (simplified)
+    # dT/dt = (heating - losses) / heat_capacity
+    # Heat capacity ~ n * V * k_B (simplified)
+    heat_capacity = density * plasma_volume * 1.380649e-23  # J/K
+    
+    if heat_capacity > 0:
+        # Net heating power
+        net_heating = fusion_power + input_power - total_loss * plasma_volume
+        
+        # Temperature change, kept in reasonable bounds
+        temperature += (net_heating / heat_capacity) * dt
+        temperature = max(1e6, min(500e6, temperature))
+    
+    # Density evolution (simplified - assume constant for now, could add fueling)
+    # In reality: dn/dt = fueling_rate - consumption_rate
+    # For now, keep density approximately constant (assume continuous fueling)
+    
+    # Fuel consumption
+    # Each D-T fusion consumes 1 D and 1 T atom
+    fusion_reaction_rate = fusion_power_density * plasma_volume
+    consumed_dt = fusion_reaction_rate / ENERGY_PER_FUSION * dt
+    
+    # Prevent negative inventories
+    deuterium = max(0.0, deuterium - consumed_dt)
+    tritium = max(0.0, tritium - consumed_dt)
+    
+    # Tritium production from breeding
+    if tritium_production_rate > 0:
+        tritium += tritium_production_rate * dt
+    
+    # Material damage accumulation
+    # dpa_rate is in DPA/year, convert to DPA/second
+    damage += dpa_rate / SECONDS_PER_YEAR * dt
+    
+    return temperature, tritium, deuterium, damage
+
+
+def _backend_unchosen(matplotlib) -> bool:
+    """Whether matplotlib would still pick its backend automatically."""
+    try:
+        return matplotlib.get_backend(auto_select=False) is None
+    except TypeError:  # matplotlib < 3.10
+        return matplotlib.rcParams._get_backend_or_none() is None
+
+
+# Diagnostic bits set by calculate_state, in reporting order
+ERR_FIRST_WALL_TEMP = 1 << 0
+ERR_SAFETY_CRITICAL = 1 << 1
+ERR_SAFETY_LOW = 1 << 2
+ERR_LAWSON = 1 << 3
+ERR_TBR = 1 << 4
+ERR_DAMAGE = 1 << 5
+ERR_TRITIUM = 1 << 6
+ERR_DEUTERIUM = 1 << 7
+
+WARN_FIRST_WALL_TEMP = 1 << 0
+WARN_SAFETY_STARTUP = 1 << 1
+WARN_SAFETY_LOW = 1 << 2
+WARN_BETA = 1 << 3
+WARN_LAWSON_STARTUP = 1 << 4
+WARN_DAMAGE = 1 << 5
+
+# Failure causes in priority order
+_FAILURE_CAUSES = (
+    (ERR_FIRST_WALL_TEMP, "Material temperature limit exceeded"),
+    (ERR_DAMAGE, "Material damage limit exceeded"),
+    (ERR_TBR | ERR_TRITIUM, "Tritium inventory depleted"),
+    (ERR_DEUTERIUM, "Deuterium inventory depleted"),
+    (ERR_LAWSON, "Lawson criterion not met after startup period"),
+    (ERR_SAFETY_CRITICAL | ERR_SAFETY_LOW, "Safety factor too low (plasma instability)"),
+)
+
+# Minimum deuterium atoms needed for operation
+_MIN_FUEL_ATOMS = 1e22
+
+# Row layout of the saved run history, one row per saved state
+STATE_HISTORY_DTYPE = np.dtype([
+    ('simulation_time', 'f8'),
+    ('q_factor', 'f8'),
+    ('fusion_power', 'f8'),
+    ('operational', '?'),
+])
+
+
+def _format_errors(state: 'ReactorState') -> List[str]:
+    """Error messages for the bits set in state.error_mask."""
+    mask = state.error_mask
+    q = state.magnetic_state.safety_factor
+    first_wall_limit, max_damage, min_tritium = state.diagnostic_limits
+    errors = []
+    if mask & ERR_FIRST_WALL_TEMP:
+        errors.append(
+            f"First wall temperature ({state.first_wall_temp:.0f} K) exceeds "
+            f"material limit ({first_wall_limit:.0f} K)"
+        )
+    if mask & ERR_SAFETY_CRITICAL:
+        errors.append(f"Safety factor (q={q:.2f}) critically low (minimum: 1.5)")
+    if mask & ERR_SAFETY_LOW:
+        errors.append(f"Safety factor (q={q:.2f}) too low (minimum: 2.0)")
+    if mask & ERR_LAWSON:
+        errors.append("Plasma does not meet Lawson criterion for ignition")
+    if mask & ERR_TBR:
+        errors.append(
+            f"Tritium breeding ratio ({state.neutronics_state.tritium_breeding_ratio:.2f}) < 1.0 "
+            "(cannot sustain operation)"
+        )
+    if mask & ERR_DAMAGE:
+        errors.append(
+            f"Material damage ({state.material_damage:.1f} DPA) exceeds limit ({max_damage:.1f} DPA)"
+        )
+    if mask & ERR_TRITIUM:
+        errors.append(
+            f"Tritium inventory ({state.tritium_inventory/1e23:.2f} × 10²³ atoms) "
+            f"below minimum ({min_tritium/1e23:.2f} × 10²³ atoms)"
+        )
+    if mask & ERR_DEUTERIUM:
+        errors.append(
+            f"Deuterium inventory ({state.deuterium_inventory/1e23:.2f} × 10²³ atoms) too low"
+        )
+    return errors
+
+
+def _format_warnings(state: 'ReactorState') -> List[str]:
+    """Warning messages for the bits set in state.warning_mask."""
+    mask = state.warning_mask
+    q = state.magnetic_state.safety_factor
+    max_damage = state.diagnostic_limits[1]
+    warnings = []
+    if mask & WARN_FIRST_WALL_TEMP:
+        warnings.append(f"First wall temperature ({state.first_wall_temp:.0f} K) approaching limit")
+    if mask & WARN_SAFETY_STARTUP:
+        warnings.append(f"Safety factor (q={q:.2f}) is low (may stabilize during startup)")
+    if mask & WARN_SAFETY_LOW:
+        warnings.append(f"Safety factor (q={q:.2f}) is low")
+    if mask & WARN_BETA:
+        warnings.append(f"Beta ({state.magnetic_state.beta:.3f}) is high, may affect stability")
+    if mask & WARN_LAWSON_STARTUP:
+        warnings.append(
+            f"Plasma does not yet meet Lawson criterion (startup phase, t={state.simulation_time:.1f}s)"
+        )
+    if mask & WARN_DAMAGE:
+        warnings.append(
+            f"High material damage: {state.material_damage:.1f} DPA (limit: {max_damage:.1f} DPA)"
+        )
+    return warnings
+
+
+@dataclass(slots=True)
 class ReactorState:
     """Complete reactor state."""
     # Plasma
@@ -66,10 +272,13 @@ class ReactorState:
     # Neutronics
     neutronics_state: NeutronicsState
     
-    # Status
+    # Status; diagnostics are kept as ERR_*/WARN_* bits and only formatted
+    # into messages when errors or warnings is read
     operational: bool = False
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    error_mask: int = 0
+    warning_mask: int = 0
+    # (first wall temperature limit K, damage limit DPA, minimum tritium atoms)
+    diagnostic_limits: Tuple[float, float, float] = (0.0, 100.0, 0.0)
     
     # Material status
     first_wall_temp: float = 0.0
@@ -88,6 +297,16 @@ class ReactorState:
     failed: bool = False
     failure_cause: str = ""
     failure_time: float = 0.0  # seconds
+    
+    @property
+    def errors(self) -> List[str]:
+        """Error messages, most severe checks first."""
+        return _format_errors(self)
+    
+    @property
+    def warnings(self) -> List[str]:
+        """Warning messages."""
+        return _format_warnings(self)
 
 
 class FusionReactorSimulator:
@@ -107,10 +326,45 @@ class FusionReactorSimulator:
         self.power_calc = PowerCalculator()
         self.neutronics = NeutronicsCalculator()
         self.materials = MaterialDatabase()
-        self.plotter = ReactorPlotter()
+        self._plotter = None  # created on first visualize() call
+        
+        # Last saved figure of each visualize() plot with the label (the
+        # data it was drawn from) it was drawn for
+        self._saved_figures: Dict[str, Tuple] = {}
+        
+        # Neutronics specialized to the current wall and blanket, rebuilt
+        # when those change
+        self._neutronics_key = None
+        self._neutronics_fn = None
+        
+        # Geometry and material lookups for the configuration they were
+        # computed from; the configuration is frozen, so they only change
+        # when it is replaced
+        self._invariants_config = None
+        self._geometry: Optional[TokamakGeometry] = None
+        self._surface_area = 0.0
+        self._li_density: Optional[float] = None
+        self._first_wall_mat: Optional[Material] = None
+        self._max_damage = 100.0
+        
+        self.reset()
+    
+    def reset(self, config: Optional[ReactorConfiguration] = None):
+        """Return to the initial state, optionally with a new configuration.
+        
+        Keeps the physics modules and caches, so one simulator can be
+        reused for many configurations instead of constructing a new one
+        for each.
         
-        # State history
-        self.history: List[ReactorState] = []
+        Args:
+            config: Reactor configuration (keeps the current one if None)
+        """
+        if config is not None:
+            self.config = config
+        
+        # State history, preallocated by run() and filled row by row
+        self._history = np.empty(0, dtype=STATE_HISTORY_DTYPE)
+        self._history_len = 0
         
         # Current state
         self.current_state: Optional[ReactorState] = None
@@ -122,59 +376,188 @@ class FusionReactorSimulator:
         self.deuterium_inventory: float = self.config.initial_deuterium_inventory
         self.accumulated_damage: float = 0.0  # DPA
         self.simulation_time: float = 0.0  # seconds
+        self.total_energy: float = 0.0  # J of fusion energy while operational
     
-    def calculate_state(self) -> ReactorState:
-        """Calculate complete reactor state.
+    @property
+    def plotter(self):
+        """Reactor plotter, created on first use.
         
-        Returns:
-            ReactorState object
+        Matplotlib is only imported when a plot is actually made, keeping
+        it out of simulator startup and optimization runs.
+        """
+        if self._plotter is None:
+            from visualization.plotter import ReactorPlotter
+            self._plotter = ReactorPlotter()
+        return self._plotter
+    
+    @property
+    def history(self) -> np.ndarray:
+        """Saved run history as a STATE_HISTORY_DTYPE array."""
+        return self._history[:self._history_len]
+    
+    def _save_history(self, state: ReactorState):
+        """Append a state's summary to the history, growing it if full."""
+        if self._history_len == len(self._history):
+            self._history = np.resize(self._history, max(2 * len(self._history), 16))
+        self._history[self._history_len] = (
+            state.simulation_time,
+            state.power_balance.q_factor,
+            state.power_balance.fusion_power,
+            state.operational,
+        )
+        self._history_len += 1
+    
+    def _external_input_power(self) -> float:
+        """External input power for the Q factor in W.
+        
+        Uses config.input_power, the power you have to supply from outside
+        the reactor; if unset, falls back to auxiliary heating plus current
+        drive. Ohmic heating is a byproduct and not counted as input.
         """
-        # Get geometry
-        geometry = self.magnetic.calculate_tokamak_geometry(
+        if self.config.input_power > 0:
+            return self.config.input_power
+        return self.config.auxiliary_heating + self.config.current_drive_power
+    
+    def _update_invariants(self):
+        """Look up the geometry and materials for the current configuration."""
+        self._geometry = self.magnetic.calculate_tokamak_geometry(
             self.config.major_radius,
             self.config.minor_radius,
             self.config.elongation,
             self.config.triangularity
         )
-        
-        # Calculate plasma state
-        # Use current evolving state (temperature, density)
-        # First, estimate confinement time
-        # Use config.input_power as primary input (more realistic than calculating ohmic heating)
-        # Ohmic heating is included in input_power, or we can estimate it separately for confinement scaling
-        plasma_resistance = self.power_calc.calculate_plasma_resistance(
+        self._surface_area = self.magnetic.calculate_plasma_surface_area(
             self.config.major_radius,
             self.config.minor_radius,
+            self.config.elongation
+        )
+        
+        # Get blanket material for tritium breeding
+        blanket_mat = self.materials.get_material(self.config.blanket_material)
+        if blanket_mat and blanket_mat.tritium_breeding_ratio > 0:
+            # Estimate lithium density from material
+            li_atomic_mass = 6.941 * 1.66053906660e-27
+            self._li_density = blanket_mat.density / li_atomic_mass
+        else:
+            self._li_density = None
+        
+        self._first_wall_mat = self.materials.get_material(self.config.first_wall_material)
+        self._max_damage = 100.0  # Typical limit for first wall materials
+        if self._first_wall_mat and hasattr(self._first_wall_mat, 'max_dpa'):
+            self._max_damage = self._first_wall_mat.max_dpa
+        
+        self._invariants_config = self.config
+    
+    def _neutronics_state(self, fusion_power: float) -> NeutronicsState:
+        """Neutronics for the current wall and blanket at the given fusion power."""
+        neutronics_key = (self._surface_area, self._li_density, self.config.blanket_thickness)
+        if neutronics_key != self._neutronics_key:
+            self._neutronics_fn = self.neutronics.make_specialized(*neutronics_key)
+            self._neutronics_key = neutronics_key
+        # Material damage is accumulated in evolve_state(), so use current value
+        return self._neutronics_fn(fusion_power, initial_dpa=self.accumulated_damage)
+    
+    def _quiet_step_inputs(self, bail_on_failure: bool) -> Optional[Tuple]:
+        """Evolution inputs for the current conditions, if nothing is close to a limit.
+        
+        Runs the step physics without building a ReactorState. Returns None
+        when calculate_state would raise an error or a first wall or damage
+        warning, the safety factor is in its startup band, Lawson is not
+        met, or bail_on_failure would stop the run; the caller then needs
+        the full state.
+        
+        Returns:
+            Tuple of _evolve_core power arguments (fusion power, input power,
+            total loss, plasma volume, fusion power density, tritium
+            production rate, DPA rate), or None
+        """
+        if self._invariants_config is not self.config:
+            self._update_invariants()
+        config = self.config
+        
+        (_, _, fusion_power_density, _, _, total_loss, _, meets_lawson, _,
+         fusion_power_total, _, _) = _calculate_state_core(
+            config.major_radius,
+            config.minor_radius,
+            config.elongation,
+            config.toroidal_field,
+            config.plasma_current,
+            (config.auxiliary_heating + config.current_drive_power) / 1e6,
+            self._geometry.plasma_volume,
             self.current_temperature,
             self.current_density
         )
-        ohmic_heating = self.power_calc.calculate_ohmic_heating(
-            self.config.plasma_current,
-            plasma_resistance
+        neutronics_state = self._neutronics_state(fusion_power_total)
+        input_power = self._external_input_power()
+        
+        safety_factor = self.magnetic.calculate_safety_factor(
+            config.major_radius, config.minor_radius,
+            config.toroidal_field, config.plasma_current
         )
-        # For confinement time scaling, use improved method that separates ohmic heating
-        # Research shows ohmic heating should be treated separately (less effective for confinement)
-        external_heating_MW = (self.config.auxiliary_heating + self.config.current_drive_power) / 1e6
-        ohmic_heating_MW = ohmic_heating / 1e6
+        if (not meets_lawson
+                or safety_factor < 2.0
+                or neutronics_state.tritium_breeding_ratio < 1.0
+                or neutronics_state.material_damage_accumulated > self._max_damage * 0.8
+                or self.tritium_inventory < config.min_tritium_inventory
+                or self.deuterium_inventory < _MIN_FUEL_ATOMS):
+            return None
+        
+        first_wall_mat = self._first_wall_mat
+        if first_wall_mat:
+            # Same estimate as calculate_state
+            heat_flux = neutronics_state.neutron_wall_loading * 1e6  # W/m²
+            first_wall_temp = 300.0 + (heat_flux * 0.01 / first_wall_mat.thermal_conductivity)
+            if first_wall_temp > first_wall_mat.max_operating_temp * 0.8:
+                return None
+        
+        if (bail_on_failure and self.simulation_time > 60.0
+                and self.power_calc.calculate_q_factor(fusion_power_total, input_power) < 0.1):
+            return None
+        
+        return (fusion_power_total, input_power, total_loss, self._geometry.plasma_volume,
+                fusion_power_density, neutronics_state.tritium_production_rate,
+                neutronics_state.dpa_rate)
+    
+    def calculate_state(self) -> ReactorState:
+        """Calculate complete reactor state.
         
-        confinement_time = self.magnetic.calculate_confinement_time_scaling(
+        Returns:
+            ReactorState object
+        """
+        if self._invariants_config is not self.config:
+            self._update_invariants()
+        geometry = self._geometry
+        
+        # Calculate plasma state from the current evolving temperature and
+        # density. Confinement uses the external heating (auxiliary + current
+        # drive) with ohmic heating treated separately; config.input_power is
+        # the external input for Q.
+        external_heating_MW = (self.config.auxiliary_heating + self.config.current_drive_power) / 1e6
+        (confinement_time, triple_product, fusion_power_density, bremsstrahlung,
+         synchrotron, total_loss, net_power_density, meets_lawson, temperature_kev,
+         fusion_power_total, bremsstrahlung_total, synchrotron_total) = _calculate_state_core(
             self.config.major_radius,
             self.config.minor_radius,
-            self.current_density,
-            self.current_temperature,
+            self.config.elongation,
             self.config.toroidal_field,
             self.config.plasma_current,
-            self.config.elongation,
-            heating_power_MW=external_heating_MW,
-            ohmic_heating_MW=ohmic_heating_MW,
-            use_improved_scaling=True
-        )
-        
-        plasma_state = self.plasma_physics.calculate_plasma_state(
-            self.current_density,
+            external_heating_MW,
+            geometry.plasma_volume,
             self.current_temperature,
-            confinement_time,
-            self.config.toroidal_field
+            self.current_density
+        )
+        plasma_state = PlasmaState(
+            temperature=self.current_temperature,
+            density=self.current_density,
+            confinement_time=confinement_time,
+            triple_product=triple_product,
+            fusion_power_density=fusion_power_density,
+            bremsstrahlung_loss=bremsstrahlung,
+            synchrotron_loss=synchrotron,
+            total_loss=total_loss,
+            net_power_density=net_power_density,
+            meets_lawson_criterion=meets_lawson,
+            temperature_kev=temperature_kev
         )
         
         # Calculate magnetic state
@@ -187,80 +570,36 @@ class FusionReactorSimulator:
             self.current_temperature
         )
         
-        # Calculate input power for Q factor
-        # Use config.input_power as the external input power (more realistic)
-        # This represents the power you have to supply from outside the reactor
-        # Ohmic heating is a byproduct, not external input for Q calculation
-        if self.config.input_power > 0:
-            # Use configured input power (external power input)
-            total_input = self.config.input_power
-        else:
-            # Fallback: calculate from components (but ohmic heating is usually not "input" for Q)
-            total_input = self.config.auxiliary_heating + self.config.current_drive_power
-            # Note: Ohmic heating is not counted as external input for Q factor
-        
-        # Calculate fusion power (total)
-        fusion_power_total = plasma_state.fusion_power_density * geometry.plasma_volume
-        
-        # Calculate power balance
-        bremsstrahlung_total = plasma_state.bremsstrahlung_loss * geometry.plasma_volume
-        synchrotron_total = plasma_state.synchrotron_loss * geometry.plasma_volume
-        
+        # Calculate power balance from the volume-integrated powers
         power_balance = self.power_calc.calculate_power_balance(
             fusion_power_total,
-            total_input,
+            self._external_input_power(),
             bremsstrahlung_total,
             synchrotron_total
         )
         
         # Calculate neutronics
-        surface_area = self.magnetic.calculate_plasma_surface_area(
-            self.config.major_radius,
-            self.config.minor_radius,
-            self.config.elongation
-        )
-        
-        # Get blanket material for tritium breeding
-        blanket_mat = self.materials.get_material(self.config.blanket_material)
-        if blanket_mat and blanket_mat.tritium_breeding_ratio > 0:
-            # Estimate lithium density from material
-            li_atomic_mass = 6.941 * 1.66053906660e-27
-            li_density = blanket_mat.density / li_atomic_mass
-        else:
-            li_density = None
-        
-        neutronics_state = self.neutronics.calculate_neutronics_state(
-            fusion_power_total,
-            surface_area,
-            li_density,
-            self.config.blanket_thickness,
-            initial_dpa=self.accumulated_damage
-        )
-        # Material damage is accumulated in evolve_state(), so use current value
-        neutronics_state.material_damage_accumulated = self.accumulated_damage
+        neutronics_state = self._neutronics_state(fusion_power_total)
         
         # Check for errors and warnings
-        errors = []
-        warnings = []
+        errors = 0
+        warnings = 0
         
         # Material temperature checks
-        first_wall_mat = self.materials.get_material(self.config.first_wall_material)
+        first_wall_mat = self._first_wall_mat
+        first_wall_limit = 0.0
         if first_wall_mat:
             # Estimate first wall temperature (simplified)
             # Heat flux from neutron wall loading
             heat_flux = neutronics_state.neutron_wall_loading * 1e6  # W/m²
             # Rough estimate: T ≈ T_coolant + (heat_flux * thickness / k)
             first_wall_temp = 300.0 + (heat_flux * 0.01 / first_wall_mat.thermal_conductivity)
+            first_wall_limit = first_wall_mat.max_operating_temp
             
-            if first_wall_temp > first_wall_mat.max_operating_temp:
-                errors.append(
-                    f"First wall temperature ({first_wall_temp:.0f} K) exceeds "
-                    f"material limit ({first_wall_mat.max_operating_temp:.0f} K)"
-                )
-            elif first_wall_temp > first_wall_mat.max_operating_temp * 0.8:
-                warnings.append(
-                    f"First wall temperature ({first_wall_temp:.0f} K) approaching limit"
-                )
+            if first_wall_temp > first_wall_limit:
+                errors |= ERR_FIRST_WALL_TEMP
+            elif first_wall_temp > first_wall_limit * 0.8:
+                warnings |= WARN_FIRST_WALL_TEMP
         else:
             first_wall_temp = 0.0
         
@@ -270,29 +609,19 @@ class FusionReactorSimulator:
         startup_tolerance = 30.0  # seconds - allow lower q during startup
         if magnetic_state.safety_factor < 1.5:
             # Critically low - always an error
-            errors.append(
-                f"Safety factor (q={magnetic_state.safety_factor:.2f}) critically low (minimum: 1.5)"
-            )
+            errors |= ERR_SAFETY_CRITICAL
         elif magnetic_state.safety_factor < 2.0:
             # Low but might be acceptable during startup
             if self.simulation_time > startup_tolerance:
-                errors.append(
-                    f"Safety factor (q={magnetic_state.safety_factor:.2f}) too low (minimum: 2.0)"
-                )
+                errors |= ERR_SAFETY_LOW
             else:
-                warnings.append(
-                    f"Safety factor (q={magnetic_state.safety_factor:.2f}) is low (may stabilize during startup)"
-                )
+                warnings |= WARN_SAFETY_STARTUP
         elif magnetic_state.safety_factor < 3.0:
-            warnings.append(
-                f"Safety factor (q={magnetic_state.safety_factor:.2f}) is low"
-            )
+            warnings |= WARN_SAFETY_LOW
         
         # Beta check
         if magnetic_state.beta > 0.1:
-            warnings.append(
-                f"Beta ({magnetic_state.beta:.3f}) is high, may affect stability"
-            )
+            warnings |= WARN_BETA
         
         # Lawson criterion
         # During startup, plasma might not meet Lawson criterion immediately
@@ -300,99 +629,46 @@ class FusionReactorSimulator:
         lawson_startup_time = 60.0  # seconds - allow time to reach Lawson criterion
         if not plasma_state.meets_lawson_criterion:
             if self.simulation_time > lawson_startup_time:
-                errors.append("Plasma does not meet Lawson criterion for ignition")
+                errors |= ERR_LAWSON
             else:
-                warnings.append(
-                    f"Plasma does not yet meet Lawson criterion (startup phase, t={self.simulation_time:.1f}s)"
-                )
+                warnings |= WARN_LAWSON_STARTUP
         
         # Tritium breeding
         if neutronics_state.tritium_breeding_ratio < 1.0:
-            errors.append(
-                f"Tritium breeding ratio ({neutronics_state.tritium_breeding_ratio:.2f}) < 1.0 "
-                "(cannot sustain operation)"
-            )
+            errors |= ERR_TBR
         
         # Material damage checks
         material_damage = neutronics_state.material_damage_accumulated
-        first_wall_mat = self.materials.get_material(self.config.first_wall_material)
-        max_damage = 100.0  # Typical limit for first wall materials
-        if first_wall_mat and hasattr(first_wall_mat, 'max_dpa'):
-            max_damage = first_wall_mat.max_dpa
-        
+        max_damage = self._max_damage
         if material_damage > max_damage:
-            errors.append(
-                f"Material damage ({material_damage:.1f} DPA) exceeds limit ({max_damage:.1f} DPA)"
-            )
+            errors |= ERR_DAMAGE
         elif material_damage > max_damage * 0.8:
-            warnings.append(
-                f"High material damage: {material_damage:.1f} DPA (limit: {max_damage:.1f} DPA)"
-            )
+            warnings |= WARN_DAMAGE
         
         # Fuel inventory checks
         if self.tritium_inventory < self.config.min_tritium_inventory:
-            errors.append(
-                f"Tritium inventory ({self.tritium_inventory/1e23:.2f} × 10²³ atoms) "
-                f"below minimum ({self.config.min_tritium_inventory/1e23:.2f} × 10²³ atoms)"
-            )
+            errors |= ERR_TRITIUM
         
         # Check if enough fuel for fusion (need both D and T)
-        min_fuel_atoms = 1e22  # Minimum atoms needed for operation
-        if self.deuterium_inventory < min_fuel_atoms:
-            errors.append(
-                f"Deuterium inventory ({self.deuterium_inventory/1e23:.2f} × 10²³ atoms) too low"
-            )
+        if self.deuterium_inventory < _MIN_FUEL_ATOMS:
+            errors |= ERR_DEUTERIUM
         
         # Failure detection
-        # Only fail on critical errors (not startup-related warnings)
-        failed = False
+        # Safety factor and Lawson errors are only raised after their startup
+        # periods, so every error is critical and causes failure; the cause
+        # is the highest-priority error present
+        failed = errors != 0
         failure_cause = ""
-        
-        # Filter out startup-related errors (they're warnings during startup)
-        critical_errors = []
-        for error in errors:
-            # These are critical and should cause failure
-            if any(keyword in error.lower() for keyword in 
-                   ['temperature', 'damage', 'tritium', 'deuterium', 'critically']):
-                critical_errors.append(error)
-            # Safety factor and Lawson errors are only critical after startup period
-            elif "safety" in error.lower() and self.simulation_time > 30.0:
-                critical_errors.append(error)
-            elif "lawson" in error.lower() and self.simulation_time > 60.0:
-                critical_errors.append(error)
-        
-        # Check failure conditions (only from critical errors)
-        if len(critical_errors) > 0:
-            # Determine primary failure cause
-            if any("temperature" in e.lower() for e in critical_errors):
-                failed = True
-                failure_cause = "Material temperature limit exceeded"
-            elif any("damage" in e.lower() for e in critical_errors):
-                failed = True
-                failure_cause = "Material damage limit exceeded"
-            elif any("tritium" in e.lower() for e in critical_errors):
-                failed = True
-                failure_cause = "Tritium inventory depleted"
-            elif any("deuterium" in e.lower() for e in critical_errors):
-                failed = True
-                failure_cause = "Deuterium inventory depleted"
-            elif any("lawson" in e.lower() for e in critical_errors):
-                failed = True
-                failure_cause = "Lawson criterion not met after startup period"
-            elif any("safety" in e.lower() for e in critical_errors):
-                failed = True
-                failure_cause = "Safety factor too low (plasma instability)"
-            else:
-                failed = True
-                failure_cause = critical_errors[0]  # Use first critical error as cause
+        if failed:
+            for bits, cause in _FAILURE_CAUSES:
+                if errors & bits:
+                    failure_cause = cause
+                    break
         
         # Operational status
         # Allow operation during startup even if some criteria aren't perfect yet
-        # But still need basic safety (no critical errors)
-        critical_errors = [e for e in errors if any(keyword in e.lower() for keyword in 
-                          ['temperature', 'damage', 'tritium', 'deuterium', 'critically'])]
-        
-        operational = (not failed and len(critical_errors) == 0)
+        # (startup issues are warnings), but any error stops operation
+        operational = not failed
         
         # Note: breakeven and Lawson criterion are goals, not requirements for basic operation
         # A reactor can operate below breakeven (Q < 1) - it just consumes more energy than it produces
@@ -404,8 +680,9 @@ class FusionReactorSimulator:
             power_balance=power_balance,
             neutronics_state=neutronics_state,
             operational=operational,
-            errors=errors,
-            warnings=warnings,
+            error_mask=errors,
+            warning_mask=warnings,
+            diagnostic_limits=(first_wall_limit, max_damage, self.config.min_tritium_inventory),
             first_wall_temp=first_wall_temp,
             blanket_temp=300.0,  # Simplified
             material_damage=material_damage,
@@ -429,100 +706,130 @@ class FusionReactorSimulator:
         if state.failed or not state.operational:
             return
         
-        # Update simulation time
-        self.simulation_time += dt
-        
-        # Plasma temperature evolution (simplified)
-        # dT/dt = (heating - losses) / heat_capacity
-        # Heat capacity ~ n * V * k_B (simplified)
-        geometry = state.geometry
-        heat_capacity = self.current_density * geometry.plasma_volume * 1.380649e-23  # J/K
-        
-        if heat_capacity > 0:
-            # Net heating power
-            net_heating = (state.power_balance.fusion_power + 
-                          state.power_balance.input_power - 
-                          state.plasma_state.total_loss * geometry.plasma_volume)
-            
-            # Temperature change
-            dT = (net_heating / heat_capacity) * dt
-            self.current_temperature += dT
-            
-            # Keep temperature in reasonable bounds
-            self.current_temperature = max(1e6, min(500e6, self.current_temperature))
-        
-        # Density evolution (simplified - assume constant for now, could add fueling)
-        # In reality: dn/dt = fueling_rate - consumption_rate
-        # For now, keep density approximately constant (assume continuous fueling)
-        # Could add fueling model later
-        
-        # Fuel consumption
-        # Each D-T fusion consumes 1 D and 1 T atom
-        fusion_reaction_rate = state.plasma_state.fusion_power_density * geometry.plasma_volume
-        energy_per_fusion = 17.6e6 * 1.602176634e-19  # J
-        if energy_per_fusion > 0:
-            consumption_rate = fusion_reaction_rate / energy_per_fusion  # atoms/s
-            consumed_dt = consumption_rate * dt
-            
-            self.deuterium_inventory -= consumed_dt
-            self.tritium_inventory -= consumed_dt
-            
-            # Prevent negative inventories
-            self.deuterium_inventory = max(0.0, self.deuterium_inventory)
-            self.tritium_inventory = max(0.0, self.tritium_inventory)
+        self._advance(dt, (
+            state.power_balance.fusion_power,
+            state.power_balance.input_power,
+            state.plasma_state.total_loss,
+            state.geometry.plasma_volume,
+            state.plasma_state.fusion_power_density,
+            state.neutronics_state.tritium_production_rate,
+            state.neutronics_state.dpa_rate
+        ))
+    
+    def _advance(self, dt: float, inputs: Tuple):
+        """Advance time and the evolving quantities by dt.
         
-        # Tritium production from breeding
-        if state.neutronics_state.tritium_production_rate > 0:
-            produced_dt = state.neutronics_state.tritium_production_rate * dt
-            self.tritium_inventory += produced_dt
+        Args:
+            dt: Time step in seconds
+            inputs: _evolve_core power arguments, see _quiet_step_inputs
+        """
+        # Update simulation time and the fusion energy produced over the step
+        self.simulation_time += dt
+        self.total_energy += inputs[0] * dt
         
-        # Material damage accumulation
-        # dpa_rate is in DPA/year, convert to DPA/second
-        seconds_per_year = 365.25 * 24 * 3600
-        dpa_per_second = state.neutronics_state.dpa_rate / seconds_per_year
-        self.accumulated_damage += dpa_per_second * dt
+        (self.current_temperature, self.tritium_inventory,
+         self.deuterium_inventory, self.accumulated_damage) = _evolve_core(
+            self.current_temperature,
+            self.current_density,
+            self.tritium_inventory,
+            self.deuterium_inventory,
+            self.accumulated_damage,
+            *inputs,
+            dt
+        )
     
     def run(self, max_time: float = 3600.0, dt: float = 1.0, 
-            save_interval: float = 10.0) -> ReactorState:
+            save_interval: float = 10.0, bail_on_failure: bool = False,
+            adaptive: bool = False, rtol: float = 1e-3,
+            dt_min: Optional[float] = None, dt_max: Optional[float] = None,
+            skip_quiet_states: bool = False) -> ReactorState:
         """Run time-dependent simulation.
         
         Args:
             max_time: Maximum simulation time in seconds (default: 1 hour)
-            dt: Time step in seconds (default: 1.0 s)
+            dt: Time step in seconds (default: 1.0 s); the initial step when adaptive
             save_interval: Interval for saving state history in seconds (default: 10.0 s)
+            bail_on_failure: Also stop once Q is below 0.1 after the startup
+                period, even though the reactor is still operational; this
+                shortens the reported operation time. Failures always stop
+                the run.
+            adaptive: Adapt the time step to the relative change per step in
+                temperature, tritium inventory and material damage, taking
+                longer steps through steady operation
+            rtol: Target relative change per step when adaptive
+            dt_min: Smallest adaptive step in seconds (default: dt / 10)
+            dt_max: Largest adaptive step in seconds (default: save_interval,
+                or 100 * dt without saving)
+            skip_quiet_states: Only build the full state for saved steps,
+                the last step and steps close to a limit; other steps just
+                compute what evolution needs. Saved history, failures and
+                the final state are unchanged. Ignored when adaptive.
             
         Returns:
             Final reactor state
         """
-        # Reset state
-        self.history = []
+        # Reset state; saves happen at t=0 and at most once per interval
+        n_slots = int(max_time // save_interval) + 2 if save_interval > 0 else int(max_time // dt) + 2
+        self._history = np.empty(max(n_slots, 1), dtype=STATE_HISTORY_DTYPE)
+        self._history_len = 0
         self.simulation_time = 0.0
         self.current_temperature = self.config.initial_temperature
         self.current_density = self.config.initial_density
         self.tritium_inventory = self.config.initial_tritium_inventory
         self.deuterium_inventory = self.config.initial_deuterium_inventory
         self.accumulated_damage = 0.0
+        self.total_energy = 0.0
+        
+        # Geometry and materials are fixed for the run; refresh them once
+        # in case the material database changed since the last state
+        self._update_invariants()
         
         last_save_time = -save_interval  # Force save at t=0
         
+        if adaptive:
+            dt_min = dt / 10.0 if dt_min is None else dt_min
+            if dt_max is None:
+                dt_max = save_interval if save_interval > 0 else 100.0 * dt
+            # Adaptive steps end on save times up to rounding
+            save_slack = 1e-9 * save_interval
+        else:
+            save_slack = 0.0
+        
         # Initial state
         state = self.calculate_state()
-        self.history.append(state)
+        self._save_history(state)
         self.current_state = state
         
         # Time stepping loop
+        step_inputs = None  # set when the last step skipped the full state
         while self.simulation_time < max_time:
             # Evolve state (only if still operational)
-            if not state.failed and state.operational:
-                self.evolve_state(dt, state)
+            if step_inputs is not None:
+                self._advance(dt, step_inputs)
+                step_inputs = None
+            elif not state.failed and state.operational:
+                if adaptive:
+                    dt = self._adaptive_step(dt, state, max_time - self.simulation_time,
+                                             last_save_time + save_interval - self.simulation_time,
+                                             rtol, dt_min, dt_max)
+                else:
+                    self.evolve_state(dt, state)
+            
+            # Steps that are not saved, not the last and not close to a
+            # limit only need the inputs for the next evolution
+            if (skip_quiet_states and not adaptive and self.simulation_time < max_time
+                    and self.simulation_time - last_save_time < save_interval):
+                step_inputs = self._quiet_step_inputs(bail_on_failure)
+                if step_inputs is not None:
+                    continue
             
             # Calculate new state
             state = self.calculate_state()
             self.current_state = state
             
             # Save state at intervals
-            if self.simulation_time - last_save_time >= save_interval:
-                self.history.append(state)
+            if self.simulation_time - last_save_time >= save_interval - save_slack:
+                self._save_history(state)
                 last_save_time = self.simulation_time
             
             # Check if reactor has failed
@@ -531,45 +838,75 @@ class FusionReactorSimulator:
                 print(f"Failure cause: {state.failure_cause}")
                 break
             
-            # Check if still operational
-            if not state.operational and not state.failed:
-                # Check what went wrong
-                if state.errors:
-                    print(f"\nReactor became non-operational at t = {self.simulation_time:.1f} s ({self.simulation_time/60:.2f} min)")
-                    print(f"Reason: {state.errors[0]}")
+            # Fusion has collapsed after startup: nothing left worth simulating
+            if (bail_on_failure and self.simulation_time > 60.0
+                    and state.power_balance.q_factor < 0.1):
+                break
         
         return self.current_state
     
+    def _adaptive_step(self, dt: float, state: ReactorState, time_left: float,
+                       time_to_save: float, rtol: float, dt_min: float,
+                       dt_max: float) -> float:
+        """Evolve by one adaptive step and return the next step size.
+        
+        The step is shortened to land on the next save time and on the end
+        of the run. The next step scales with sqrt(rtol / r), limited to a
+        factor of 0.5-4 per step, where r is the largest relative change in
+        temperature, tritium inventory and damage (relative to the damage
+        limit). Steps are not rejected, so rtol bounds the change per step
+        only approximately. While any warning is raised the step does not
+        grow.
+        """
+        step = min(dt, time_left)
+        if time_to_save > 0:
+            step = min(step, time_to_save)
+        
+        temperature = self.current_temperature
+        tritium = self.tritium_inventory
+        damage = self.accumulated_damage
+        self.evolve_state(step, state)
+        
+        change = abs(self.current_temperature - temperature) / temperature
+        if tritium > 0:
+            change = max(change, abs(self.tritium_inventory - tritium) / tritium)
+        if self._max_damage > 0:
+            change = max(change, (self.accumulated_damage - damage) / self._max_damage)
+        
+        factor = 4.0 if change == 0 else min(max((rtol / change) ** 0.5, 0.5), 4.0)
+        if state.warning_mask:
+            factor = min(factor, 1.0)
+        # Scale the full step, not one cut short by a save time
+        return min(max(dt * factor, dt_min), dt_max)
+    
     def get_operation_statistics(self) -> Dict:
         """Get operation statistics from simulation history.
         
         Returns:
             Dictionary with operation statistics
         """
-        if not self.history:
+        history = self.history
+        if len(history) == 0:
             return {}
         
         # Find when reactor failed or stopped
         final_state = self.current_state
         max_operation_time = self.simulation_time
         
-        # Calculate average Q factor during operation
-        operational_states = [s for s in self.history if s.operational]
-        if operational_states:
-            avg_q = sum(s.power_balance.q_factor for s in operational_states if not np.isinf(s.power_balance.q_factor)) / len(operational_states)
-            max_q = max((s.power_balance.q_factor for s in operational_states if not np.isinf(s.power_balance.q_factor)), default=0.0)
+        # Calculate average and maximum Q factor during operation, leaving
+        # out states with infinite or undefined Q
+        q_factor = history['q_factor']
+        counted = history['operational'] & np.isfinite(q_factor)
+        if counted.any():
+            q_values = q_factor[counted]
+            avg_q = q_values.mean()
+            max_q = q_values.max()
         else:
             avg_q = 0.0
             max_q = 0.0
         
-        # Calculate total energy produced
-        total_energy = 0.0
-        if len(self.history) > 1:
-            for i in range(len(self.history) - 1):
-                if self.history[i].operational:
-                    dt = self.history[i+1].simulation_time - self.history[i].simulation_time
-                    power = self.history[i].power_balance.fusion_power
-                    total_energy += power * dt
+        # Total energy produced is accumulated step by step in evolve_state()
+        total_energy = self.total_energy
         
         # Predict maximum runtime based on limiting factors
         max_runtime_prediction = float('inf')
@@ -592,7 +929,8 @@ class FusionReactorSimulator:
                         limiting_factor = f"Material damage (will reach {max_damage:.1f} DPA)"
             
             # Check tritium inventory
-            if final_state.neutronics_state.tritium_breeding_ratio < 1.0:
+            # (no breeding at all means no fusion, so nothing is consumed)
+            if 0.0 < final_state.neutronics_state.tritium_breeding_ratio < 1.0:
                 consumption_rate = final_state.neutronics_state.tritium_production_rate - (
                     final_state.neutronics_state.tritium_production_rate / final_state.neutronics_state.tritium_breeding_ratio
                 )
@@ -627,30 +965,41 @@ class FusionReactorSimulator:
         Returns:
             Dictionary with optimization results
         """
-        best_state = None
-        best_q = 0.0
-        best_config = None
-        
         # Simple grid search over key parameters
         temp_range = np.linspace(10e6, 20e6, 10)
         density_range = np.linspace(0.5e20, 2e20, 10)
         
-        for temp in temp_range:
-            for density in density_range:
-                self.config.initial_temperature = temp
-                self.config.initial_density = density
-                
-                state = self.calculate_state()
-                q = state.power_balance.q_factor
-                
-                if not np.isinf(q) and q > best_q:
-                    best_q = q
-                    best_state = state
-                    best_config = self.config
+        # Q depends only on fusion power (temperature and density) and the
+        # fixed input power, so score the whole grid at once
+        if self._invariants_config is not self.config:
+            self._update_invariants()
+        geometry = self._geometry
+        temps, densities = np.meshgrid(temp_range, density_range, indexing='ij')
+        fusion_power = self.plasma_physics.calculate_fusion_power_density_batch(
+            densities, temps
+        ) * geometry.plasma_volume
+        q_grid = self.power_calc.calculate_q_factor(fusion_power,
+                                                    self._external_input_power())
+        
+        # First grid point with the highest finite, positive Q
+        scores = np.where(np.isfinite(q_grid), q_grid, -np.inf)
+        best_index = np.unravel_index(np.argmax(scores), scores.shape)
         
-        if best_config:
+        best_q = 0.0
+        best_config = None
+        if scores[best_index] > best_q:
+            # Materialize the full state only for the winner; the state is
+            # computed from the evolving plasma conditions, so set those as
+            # well as the configuration
+            temp = temps[best_index]
+            density = densities[best_index]
+            best_config = replace(self.config, initial_temperature=temp,
+                                  initial_density=density)
             self.config = best_config
-            self.current_state = best_state
+            self.current_temperature = temp
+            self.current_density = density
+            self.current_state = self.calculate_state()
+            best_q = self.current_state.power_balance.q_factor
         
         return {
             'best_q': best_q,
@@ -691,47 +1040,68 @@ class FusionReactorSimulator:
             'material_damage': state.material_damage
         }
     
-    def visualize(self, save_path: Optional[str] = None):
+    def visualize(self, save_path: Optional[str] = None, cache_figures: bool = False):
         """Create visualizations of reactor state.
         
         Args:
             save_path: Optional path to save figures (saved in plots/ folder)
+            cache_figures: Also pickle saved figures next to the images and,
+                on later calls (including from other runs), re-save a
+                pickled figure instead of redrawing it when it was drawn
+                from the same data
         """
         if not self.current_state:
             print("No state to visualize. Run simulation first.")
             return
         
-        # Status dashboard
-        status_dict = self.get_status_dict()
-        fig_dashboard = self.plotter.create_status_dashboard(status_dict)
-        if save_path:
-            self.plotter.save_figure(fig_dashboard, f"{save_path}_dashboard.png")
-        else:
-            plt.show()
+        if save_path and 'matplotlib.pyplot' not in sys.modules:
+            # Saving only: avoid initializing a GUI backend, unless the
+            # caller or the environment already chose one
+            import matplotlib
+            if _backend_unchosen(matplotlib):
+                matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
         
-        # Reactor diagram
-        fig_diagram = self.plotter.create_reactor_diagram(
-            self.config.major_radius,
-            self.config.minor_radius,
-            self.config.elongation
-        )
-        if save_path:
-            self.plotter.save_figure(fig_diagram, f"{save_path}_diagram.png")
-        else:
-            plt.show()
-        
-        # Power balance
+        status_dict = self.get_status_dict()
+        diagram_key = (self.config.major_radius, self.config.minor_radius,
+                       self.config.elongation)
         power_dict = {
             'fusion_power': status_dict['fusion_power'],
             'input_power': status_dict['input_power'],
             'output_power': status_dict['output_power'],
             'q_factor': status_dict['q_factor']
         }
-        fig_power = self.plotter.plot_power_balance(power_dict)
-        if save_path:
-            self.plotter.save_figure(fig_power, f"{save_path}_power.png")
-        else:
-            plt.show()
+        
+        # Status dashboard, reactor diagram (which only depends on the
+        # geometry) and power balance
+        plots = (
+            ('dashboard', status_dict,
+             lambda: self.plotter.create_status_dashboard(status_dict)),
+            ('diagram', diagram_key,
+             lambda: self.plotter.create_reactor_diagram(*diagram_key)),
+            ('power', power_dict,
+             lambda: self.plotter.plot_power_balance(power_dict)),
+        )
+        for name, label, create in plots:
+            if save_path:
+                # Reuse the last saved figure if it shows the same data
+                saved = self._saved_figures.get(name)
+                if saved is not None and saved[0] == label:
+                    fig = saved[1]
+                else:
+                    cache_file = f"{save_path}_{name}.pkl"
+                    fig = (self.plotter.load_cached_figure(cache_file, label)
+                           if cache_figures else None)
+                    if fig is None:
+                        fig = create()
+                        if cache_figures:
+                            self.plotter.cache_figure(fig, cache_file, label)
+                    self._saved_figures[name] = (label, fig)
+                self.plotter.save_figure(fig, f"{save_path}_{name}.png")
+            else:
+                # Shown figures are closed with their window, so always redraw
+                create()
+                plt.show()
     
     def print_status(self):
         """Print detailed status to console."""
@@ -740,90 +1110,100 @@ class FusionReactorSimulator:
             return
         
         state = self.current_state
-        
-        print("\n" + "="*80)
-        print("FUSION REACTOR SIMULATOR - STATUS REPORT")
-        print("="*80)
-        
-        print("\n[PLASMA STATE]")
-        print(f"  Temperature:        {state.plasma_state.temperature/1e6:.2f} MK")
-        print(f"  Density:            {state.plasma_state.density/1e20:.2f} × 10²⁰ m⁻³")
-        print(f"  Confinement Time:   {state.plasma_state.confinement_time:.3f} s")
-        print(f"  Triple Product:     {state.plasma_state.triple_product/1e21:.2f} × 10²¹ m⁻³·s·K")
-        print(f"  Lawson Criterion:   {'✓ MET' if state.plasma_state.meets_lawson_criterion else '✗ NOT MET'}")
-        
-        print("\n[MAGNETIC CONFINEMENT]")
-        print(f"  Toroidal Field:     {state.magnetic_state.toroidal_field:.2f} T")
-        print(f"  Plasma Current:     {self.config.plasma_current/1e6:.1f} MA")
-        print(f"  Safety Factor (q):  {state.magnetic_state.safety_factor:.2f}")
-        print(f"  Beta:               {state.magnetic_state.beta:.4f}")
-        print(f"  Aspect Ratio:       {state.geometry.aspect_ratio:.2f}")
-        
-        print("\n[POWER BALANCE]")
-        print(f"  Fusion Power:       {state.power_balance.fusion_power/1e6:.1f} MW")
-        print(f"  Input Power:        {state.power_balance.input_power/1e6:.1f} MW")
-        print(f"  Thermal Power:      {state.power_balance.thermal_power/1e6:.1f} MW")
-        print(f"  Electrical Output:  {state.power_balance.output_power/1e6:.1f} MW")
-        print(f"  Q Factor:           {state.power_balance.q_factor:.2f}" + 
-              (" (∞)" if np.isinf(state.power_balance.q_factor) else ""))
-        print(f"  Breakeven:          {'✓ YES' if state.power_balance.breakeven else '✗ NO'}")
-        print(f"  Ignition:           {'✓ YES' if state.power_balance.ignition else '✗ NO'}")
-        
-        print("\n[NEUTRONICS]")
-        print(f"  Neutron Flux:       {state.neutronics_state.neutron_flux/1e18:.2f} × 10¹⁸ n/(m²·s)")
-        print(f"  Wall Loading:       {state.neutronics_state.neutron_wall_loading:.2f} MW/m²")
-        print(f"  Tritium Production: {state.neutronics_state.tritium_production_rate/1e20:.2f} × 10²⁰ atoms/s")
-        print(f"  Tritium Breeding:   {state.neutronics_state.tritium_breeding_ratio:.3f}")
-        print(f"  Material Damage:    {state.neutronics_state.material_damage_accumulated:.2f} DPA")
-        
-        print("\n[MATERIALS]")
-        print(f"  First Wall Temp:    {state.first_wall_temp:.0f} K")
-        print(f"  Material Damage:    {state.material_damage:.2f} DPA")
-        
-        print("\n[TIME & OPERATION]")
-        print(f"  Simulation Time:    {state.simulation_time:.1f} s ({state.simulation_time/60:.2f} min)")
+        plasma = state.plasma_state
+        magnetic = state.magnetic_state
+        power = state.power_balance
+        neutronics = state.neutronics_state
+        lines = []
+        
+        lines.append("\n" + "="*80)
+        lines.append("FUSION REACTOR SIMULATOR - STATUS REPORT")
+        lines.append("="*80)
+        
+        lines.append("\n[PLASMA STATE]")
+        lines.append(f"  Temperature:        {plasma.temperature/1e6:.2f} MK")
+        lines.append(f"  Density:            {plasma.density/1e20:.2f} × 10²⁰ m⁻³")
+        lines.append(f"  Confinement Time:   {plasma.confinement_time:.3f} s")
+        lines.append(f"  Triple Product:     {plasma.triple_product/1e21:.2f} × 10²¹ m⁻³·s·K")
+        lines.append(f"  Lawson Criterion:   {'✓ MET' if plasma.meets_lawson_criterion else '✗ NOT MET'}")
+        
+        lines.append("\n[MAGNETIC CONFINEMENT]")
+        lines.append(f"  Toroidal Field:     {magnetic.toroidal_field:.2f} T")
+        lines.append(f"  Plasma Current:     {self.config.plasma_current/1e6:.1f} MA")
+        lines.append(f"  Safety Factor (q):  {magnetic.safety_factor:.2f}")
+        lines.append(f"  Beta:               {magnetic.beta:.4f}")
+        lines.append(f"  Aspect Ratio:       {state.geometry.aspect_ratio:.2f}")
+        
+        lines.append("\n[POWER BALANCE]")
+        lines.append(f"  Fusion Power:       {power.fusion_power/1e6:.1f} MW")
+        lines.append(f"  Input Power:        {power.input_power/1e6:.1f} MW")
+        lines.append(f"  Thermal Power:      {power.thermal_power/1e6:.1f} MW")
+        lines.append(f"  Electrical Output:  {power.output_power/1e6:.1f} MW")
+        lines.append(f"  Q Factor:           {power.q_factor:.2f}" + 
+                     (" (∞)" if math.isinf(power.q_factor) else ""))
+        lines.append(f"  Breakeven:          {'✓ YES' if power.breakeven else '✗ NO'}")
+        lines.append(f"  Ignition:           {'✓ YES' if power.ignition else '✗ NO'}")
+        
+        lines.append("\n[NEUTRONICS]")
+        lines.append(f"  Neutron Flux:       {neutronics.neutron_flux/1e18:.2f} × 10¹⁸ n/(m²·s)")
+        lines.append(f"  Wall Loading:       {neutronics.neutron_wall_loading:.2f} MW/m²")
+        lines.append(f"  Tritium Production: {neutronics.tritium_production_rate/1e20:.2f} × 10²⁰ atoms/s")
+        lines.append(f"  Tritium Breeding:   {neutronics.tritium_breeding_ratio:.3f}")
+        lines.append(f"  Material Damage:    {neutronics.material_damage_accumulated:.2f} DPA")
+        
+        lines.append("\n[MATERIALS]")
+        lines.append(f"  First Wall Temp:    {state.first_wall_temp:.0f} K")
+        lines.append(f"  Material Damage:    {state.material_damage:.2f} DPA")
+        
+        lines.append("\n[TIME & OPERATION]")
+        lines.append(f"  Simulation Time:    {state.simulation_time:.1f} s ({state.simulation_time/60:.2f} min)")
         if state.operation_time > 0:
-            print(f"  Operation Time:      {state.operation_time:.1f} s ({state.operation_time/60:.2f} min)")
-        print(f"  Tritium Inventory:  {state.tritium_inventory/1e23:.2f} × 10²³ atoms")
-        print(f"  Deuterium Inventory: {state.deuterium_inventory/1e23:.2f} × 10²³ atoms")
+            lines.append(f"  Operation Time:      {state.operation_time:.1f} s ({state.operation_time/60:.2f} min)")
+        lines.append(f"  Tritium Inventory:  {state.tritium_inventory/1e23:.2f} × 10²³ atoms")
+        lines.append(f"  Deuterium Inventory: {state.deuterium_inventory/1e23:.2f} × 10²³ atoms")
         
-        print("\n[STATUS]")
+        lines.append("\n[STATUS]")
         if state.operational:
-            print("  ✓ OPERATIONAL")
+            lines.append("  ✓ OPERATIONAL")
         else:
-            print("  ✗ NOT OPERATIONAL")
+            lines.append("  ✗ NOT OPERATIONAL")
         
         if state.failed:
-            print(f"  ✗ FAILED at t = {state.failure_time:.1f} s ({state.failure_time/60:.2f} min)")
-            print(f"  Failure Cause: {state.failure_cause}")
+            lines.append(f"  ✗ FAILED at t = {state.failure_time:.1f} s ({state.failure_time/60:.2f} min)")
+            lines.append(f"  Failure Cause: {state.failure_cause}")
         
-        if state.errors:
-            print("\n[ERRORS]")
-            for error in state.errors:
-                print(f"  ✗ {error}")
+        errors = state.errors
+        if errors:
+            lines.append("\n[ERRORS]")
+            for error in errors:
+                lines.append(f"  ✗ {error}")
         
-        if state.warnings:
-            print("\n[WARNINGS]")
-            for warning in state.warnings:
-                print(f"  ⚠ {warning}")
+        warnings = state.warnings
+        if warnings:
+            lines.append("\n[WARNINGS]")
+            for warning in warnings:
+                lines.append(f"  ⚠ {warning}")
         
         # Operation statistics if available
-        if self.history and len(self.history) > 1:
+        if len(self.history) > 1:
             stats = self.get_operation_statistics()
-            print("\n[OPERATION STATISTICS]")
-            print(f"  Max Operation Time: {stats['max_operation_time_minutes']:.2f} min")
+            lines.append("\n[OPERATION STATISTICS]")
+            lines.append(f"  Max Operation Time: {stats['max_operation_time_minutes']:.2f} min")
             if stats['failed']:
-                print(f"  Status: FAILED - {stats['failure_cause']}")
+                lines.append(f"  Status: FAILED - {stats['failure_cause']}")
             else:
-                print(f"  Status: {'OPERATIONAL' if state.operational else 'STOPPED'}")
-            print(f"  Average Q Factor:   {stats['average_q_factor']:.2f}")
-            print(f"  Max Q Factor:       {stats['max_q_factor']:.2f}")
-            print(f"  Total Energy:       {stats['total_energy_produced_MWh']:.2f} MWh")
+                lines.append(f"  Status: {'OPERATIONAL' if state.operational else 'STOPPED'}")
+            lines.append(f"  Average Q Factor:   {stats['average_q_factor']:.2f}")
+            lines.append(f"  Max Q Factor:       {stats['max_q_factor']:.2f}")
+            lines.append(f"  Total Energy:       {stats['total_energy_produced_MWh']:.2f} MWh")
             if stats['can_run_indefinitely']:
-                print(f"  Max Runtime:        INDEFINITE")
+                lines.append(f"  Max Runtime:        INDEFINITE")
             else:
-                print(f"  Max Runtime:        {stats['max_runtime_prediction_minutes']:.2f} min")
-            print(f"  Limiting Factor:    {stats['limiting_factor']}")
+                lines.append(f"  Max Runtime:        {stats['max_runtime_prediction_minutes']:.2f} min")
+            lines.append(f"  Limiting Factor:    {stats['limiting_factor']}")
+        
+        lines.append("\n" + "="*80 + "\n")
         
-        print("\n" + "="*80 + "\n")
+        # One write for the whole report
+        print("\n".join(lines))
 
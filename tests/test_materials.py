@@ -0,0 +1,31 @@
+"""Tests for the material database."""
+
+import numpy as np
+from materials.materials import MaterialDatabase
+
+
+def test_thermal_conductivity_batch():
+    """Test batched thermal conductivity against the per-material method."""
+    db = MaterialDatabase()
+
+    names = ['tungsten', 'lithium_lead', 'eurofer97', 'water']
+    temperatures = np.array([250.0, 800.0, 1500.0, 6000.0])
+    batch = db.thermal_conductivity_batch(db.material_indices(names), temperatures)
+
+    for name, T, k in zip(names, temperatures, batch):
+        expected = db.get_material(name).thermal_conductivity_at_temp(T)
+        assert np.isclose(k, expected), f"{name} at {T} K: {k} != {expected}"
+
+    # Array form on a single material matches too
+    tungsten = db.get_material('tungsten')
+    array_k = tungsten.thermal_conductivity_at_temp_array(temperatures)
+    scalar_k = [tungsten.thermal_conductivity_at_temp(T) for T in temperatures]
+    assert np.allclose(array_k, scalar_k)
+
+    print("✓ Material database tests passed")
+
+
+if __name__ == '__main__':
+    print("Running material database tests...\n")
+    test_thermal_conductivity_batch()
+    print("\nAll tests passed! ✓")
@@ -0,0 +1,85 @@
+"""Tests for optimization modules."""
+
+import os
+import tempfile
+
+import numpy as np
+
+from optimization.parameter_optimizer import (
+    ParameterOptimizer, SAMPLED_PARAMETERS, HISTORY_DTYPE
+)
+from optimization.solutions_database import SolutionsDatabase
+
+
+def test_random_config():
+    """Test random configuration sampling."""
+    optimizer = ParameterOptimizer(seed=42)
+
+    # Every sampled parameter must lie within its bounds
+    for _ in range(20):
+        config = optimizer.random_config()
+        for name in SAMPLED_PARAMETERS:
+            low, high = getattr(optimizer.bounds, name)
+            value = getattr(config, name)
+            assert low <= value <= high, f"{name}={value} outside [{low}, {high}]"
+
+    # Same seed gives the same configuration
+    config_a = ParameterOptimizer(seed=7).random_config()
+    config_b = ParameterOptimizer(seed=7).random_config()
+    assert config_a == config_b, "Seeded optimizers should agree"
+
+    print("✓ Random configuration tests passed")
+
+
+def test_grid_search_history():
+    """Test structured grid search history."""
+    optimizer = ParameterOptimizer(seed=42)
+    result = optimizer.grid_search(n_samples=3, max_time=20.0, n_workers=1)
+
+    history = result.optimization_history
+    assert history.dtype == HISTORY_DTYPE
+    assert len(history) == 3
+    assert not np.isnan(history['score']).any(), "Every sample should be scored"
+    assert history['score'].max() == result.best_score
+
+    # Dict form reproduces the sampled configurations
+    entries = result.to_dict_list()
+    assert [entry['iteration'] for entry in entries] == [0, 1, 2]
+    best = entries[int(np.argmax(history['score']))]
+    assert best['config'] == result.best_config
+
+    print("✓ Grid search history tests passed")
+
+
+def test_score_cache_persistence():
+    """Test that scores saved on close are reused by a new optimizer."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, 'cache', 'results.bin')
+
+        with ParameterOptimizer(seed=1, cache_path=cache_path) as optimizer:
+            first = optimizer.grid_search(n_samples=2, max_time=20.0, n_workers=1)
+        assert os.path.exists(cache_path), "Cache should be written on close"
+
+        with ParameterOptimizer(seed=1, cache_path=cache_path) as optimizer:
+            assert len(optimizer._score_cache) == 2, "Cache should be loaded"
+            second = optimizer.grid_search(n_samples=2, max_time=20.0, n_workers=1)
+        assert second.best_score == first.best_score
+
+    print("✓ Score cache persistence tests passed")
+
+
+def test_solutions_hashable():
+    """Test that research solutions can be used as set members and dict keys."""
+    solutions = SolutionsDatabase().solutions
+    assert len(set(solutions)) == len(solutions)
+
+    print("✓ Solutions hashable tests passed")
+
+
+if __name__ == '__main__':
+    print("Running optimization module tests...\n")
+    test_random_config()
+    test_grid_search_history()
+    test_score_cache_persistence()
+    test_solutions_hashable()
+    print("\nAll tests passed! ✓")
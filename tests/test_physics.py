@@ -1,10 +1,14 @@
 """Tests for physics modules."""
 
+from dataclasses import fields as dataclass_fields
+
 import numpy as np
-from physics.plasma import PlasmaPhysics
+from physics.plasma import PlasmaPhysics, PlasmaState
 from physics.magnetic import MagneticConfinement
-from physics.power import PowerCalculator
-from physics.neutronics import NeutronicsCalculator
+from physics.power import PowerCalculator, PowerBalance, POWER_BALANCE_DTYPE
+from physics.neutronics import (
+    NeutronicsCalculator, NEUTRONICS_DTYPE, neutron_flux, neutronics_state
+)
 
 
 def test_plasma_physics():
@@ -32,6 +36,45 @@ def test_plasma_physics():
     print("✓ Plasma physics tests passed")
 
 
+def test_plasma_batch():
+    """Test the broadcast plasma calculations against the scalar path."""
+    plasma = PlasmaPhysics()
+    
+    # Includes temperatures below the 0.1 keV cutoff
+    temperatures = np.array([0.0, 500.0, 1e6, 15e6, 150e6])
+    densities = np.array([0.5e20, 1e20, 2e20])
+    grid = plasma.calculate_fusion_power_density_batch(densities[:, None], temperatures)
+    assert grid.shape == (3, 5)
+    for i, density in enumerate(densities):
+        for j, temperature in enumerate(temperatures):
+            expected = plasma.calculate_fusion_power_density(density, temperature)
+            assert np.isclose(grid[i, j], expected, rtol=1e-12)
+    assert grid[0, 0] == 0.0 and grid[0, 1] == 0.0
+    
+    # Scalar <σv> matches the array path; a 0-d array takes the scalar path
+    T_kev = np.array([0.05, 10.0, 1.5e8])
+    sigma_v = plasma.calculate_fusion_reaction_rate_coefficient(T_kev)
+    for i, T in enumerate(T_kev):
+        scalar = plasma.calculate_fusion_reaction_rate_coefficient(float(T))
+        assert np.isclose(scalar, sigma_v[i], rtol=1e-12, atol=0.0)
+        assert plasma.calculate_fusion_reaction_rate_coefficient(np.array(T)) == scalar
+    
+    # Batch plasma state matches the scalar state field by field
+    taus = np.array([0.5, 3.0, 1.0])
+    fields = np.array([5.3, 12.0, 2.0])
+    states = plasma.calculate_plasma_state_batch(
+        densities[:, None], temperatures, taus[:, None], fields[:, None]
+    )
+    assert set(states) == {field.name for field in dataclass_fields(PlasmaState)}
+    for i in range(3):
+        for j in range(5):
+            state = plasma.calculate_plasma_state(densities[i], temperatures[j], taus[i], fields[i])
+            for name, values in states.items():
+                assert np.isclose(values[i, j], getattr(state, name), rtol=1e-12), name
+    
+    print("✓ Plasma batch tests passed")
+
+
 def test_magnetic_confinement():
     """Test magnetic confinement calculations."""
     magnetic = MagneticConfinement()
@@ -46,6 +89,15 @@ def test_magnetic_confinement():
     assert geometry.aspect_ratio == major_radius / minor_radius
     assert geometry.plasma_volume > 0
     
+    # Arrays, 0-d included, bypass the geometry cache and match the scalar path
+    radii = np.array([major_radius, 3.0])
+    geometries = magnetic.calculate_tokamak_geometry(radii, np.array([minor_radius, 1.0]))
+    assert geometries.plasma_volume.shape == (2,)
+    assert geometries.plasma_volume[0] == geometry.plasma_volume
+    assert np.array_equal(geometries.aspect_ratio, [geometry.aspect_ratio, 3.0])
+    geometry_0d = magnetic.calculate_tokamak_geometry(np.array(major_radius), minor_radius)
+    assert geometry_0d.plasma_volume == geometry.plasma_volume
+    
     # Test safety factor
     toroidal_field = 5.3  # T
     plasma_current = 15e6  # A
@@ -61,6 +113,37 @@ def test_magnetic_confinement():
     assert beta > 0, "Beta should be positive"
     assert beta < 1, "Beta should typically be < 1"
     
+    # Batch confinement time matches the scalar scaling
+    rng = np.random.default_rng(0)
+    R = rng.uniform(3.0, 10.0, 50)
+    a = rng.uniform(0.5, 3.0, 50)
+    n = rng.uniform(0.5e20, 3e20, 50)
+    B = rng.uniform(2.0, 20.0, 50)
+    I = rng.uniform(5e6, 20e6, 50)
+    kappa = rng.uniform(1.0, 2.5, 50)
+    P = rng.uniform(0.0, 100.0, 50)
+    P_ohm = rng.uniform(0.0, 5.0, 50)
+    for improved in (True, False):
+        batch = magnetic.calculate_confinement_time_scaling_batch(
+            R, a, n, 150e6, B, I, kappa, P, P_ohm, use_improved_scaling=improved
+        )
+        scalar = [
+            magnetic.calculate_confinement_time_scaling(
+                R[i], a[i], n[i], 150e6, B[i], I[i], kappa[i], P[i], P_ohm[i],
+                use_improved_scaling=improved
+            )
+            for i in range(50)
+        ]
+        assert np.allclose(batch, scalar, rtol=1e-12), "Batch τ_E should match scalar"
+    
+    # Batch magnetic state matches the scalar state field by field
+    T = rng.uniform(50e6, 300e6, 50)
+    states = magnetic.calculate_magnetic_state_batch(B, I, R, a, n, T)
+    for i in range(50):
+        state = magnetic.calculate_magnetic_state(B[i], I[i], R[i], a[i], n[i], T[i])
+        for name, values in states.items():
+            assert np.isclose(values[i], getattr(state, name), rtol=1e-12), name
+    
     print("✓ Magnetic confinement tests passed")
 
 
@@ -73,6 +156,8 @@ def test_power_balance():
     input_power = 50e6  # W
     q = power.calculate_q_factor(fusion_power, input_power)
     assert q == 10.0, f"Q should be 10, got {q}"
+    qs = power.calculate_q_factor(np.array([500e6, 500e6, 0.0]), np.array([50e6, 0.0, 0.0]))
+    assert np.array_equal(qs, [10.0, np.inf, 0.0]), f"Array Q wrong: {qs}"
     
     # Test breakeven
     assert power.check_breakeven(1.5) == True
@@ -81,6 +166,39 @@ def test_power_balance():
     # Test ignition
     assert power.check_ignition(15.0) == True
     assert power.check_ignition(5.0) == False
+    qs = np.array([0.5, 1.5, 15.0, np.inf])
+    assert np.array_equal(power.check_breakeven(qs), [False, True, True, True])
+    assert np.array_equal(power.check_ignition(qs), [False, False, True, True])
+    
+    # Smooth Coulomb logarithm follows the NRL branches away from 10 eV
+    # and is continuous across it
+    ev = 1.0 / 8.617333262e-5  # K per eV
+    n_e = 1e20
+    low = 23.0 - np.log(np.sqrt(n_e * 1e-6) * 2.0**-1.5)
+    high = 24.0 - np.log(np.sqrt(n_e * 1e-6) / 1000.0)
+    assert np.isclose(power.calculate_coulomb_logarithm_smooth(n_e, 2.0 * ev), low)
+    assert np.isclose(power.calculate_coulomb_logarithm_smooth(n_e, 1000.0 * ev), high)
+    near_switch = power.calculate_coulomb_logarithm_smooth(n_e, np.linspace(9.0, 11.0, 2001) * ev)
+    assert np.abs(np.diff(near_switch)).max() < 0.05
+    
+    # Batch power balance matches the scalar balance field by field,
+    # including zero input power
+    fusion = np.array([500e6, 500e6, 0.0, 10e6])
+    inputs = np.array([50e6, 0.0, 0.0, 50e6])
+    brems = np.array([20e6, 20e6, 0.0, 80e6])
+    sync = np.array([5e6, 5e6, 0.0, 0.0])
+    balances = power.calculate_power_balance_batch(fusion, inputs, brems, sync)
+    assert set(balances) == {field.name for field in dataclass_fields(PowerBalance)}
+    for i in range(len(fusion)):
+        balance = power.calculate_power_balance(fusion[i], inputs[i], brems[i], sync[i])
+        for name, values in balances.items():
+            assert values[i] == getattr(balance, name), name
+    
+    records = power.calculate_power_balance_batch(fusion, inputs, brems, sync, structured=True)
+    assert records.dtype == POWER_BALANCE_DTYPE
+    assert records.dtype.names == tuple(balances)
+    for name, values in balances.items():
+        assert np.array_equal(records[name], values), name
     
     print("✓ Power balance tests passed")
 
@@ -94,6 +212,7 @@ def test_neutronics():
     surface_area = 1000.0  # m^2
     flux = neutronics.calculate_neutron_flux(fusion_power, surface_area)
     assert flux > 0, "Neutron flux should be positive"
+    assert neutron_flux(fusion_power, surface_area) == flux
     
     # Test tritium consumption
     consumption = neutronics.calculate_tritium_consumption(fusion_power)
@@ -104,6 +223,105 @@ def test_neutronics():
     consumption = 1e20  # atoms/s
     tbr = neutronics.calculate_tritium_breeding_ratio(production, consumption)
     assert tbr == 1.2, f"TBR should be 1.2, got {tbr}"
+    tbrs = neutronics.calculate_tritium_breeding_ratio(
+        np.array([1.2e20, 1e20, 0.0]), np.array([1e20, 0.0, 0.0])
+    )
+    assert np.array_equal(tbrs, [1.2, np.inf, 0.0]), f"Array TBR wrong: {tbrs}"
+    
+    # Production grid matches pointwise production over every design axis
+    li_densities = np.array([1e28, 4.6e28])
+    thicknesses = np.array([0.5, 1.0, 1.5])
+    li6_fractions = np.array([0.075, 0.3, 0.9, 0.6])
+    grid = neutronics.calculate_tritium_production_grid(
+        flux, li_densities, thicknesses, li6_fractions
+    )
+    assert grid.shape == (4, 2, 3)
+    for i, li6 in enumerate(li6_fractions):
+        for j, density in enumerate(li_densities):
+            for k, thickness in enumerate(thicknesses):
+                expected = neutronics.calculate_tritium_production(flux, density, thickness, li6)
+                assert np.isclose(grid[i, j, k], expected, rtol=1e-12)
+    grid32 = neutronics.calculate_tritium_production_grid(
+        flux, li_densities, thicknesses, li6_fractions, dtype=np.float32
+    )
+    assert grid32.dtype == np.float32
+    assert np.allclose(grid32, grid, rtol=1e-5)
+    
+    # Group DPA rate folds the spectrum with the registered cross-sections;
+    # unknown materials fall back to the effective cross-section
+    spectrum = np.array([1e17, 5e17, 2e18])
+    NeutronicsCalculator.register_dpa_cross_sections('test_steel', [1e-26, 5e-26, 3e-25])
+    expected = (1e17 * 1e-26 + 5e17 * 5e-26 + 2e18 * 3e-25) * 365.25 * 24 * 3600
+    dpa = neutronics.calculate_dpa_rate(spectrum.sum(), flux_spectrum=spectrum,
+                                        material='test_steel')
+    assert np.isclose(dpa, expected, rtol=1e-12)
+    fallback = neutronics.calculate_dpa_rate(spectrum.sum(), flux_spectrum=spectrum,
+                                             material='unobtainium')
+    assert fallback == neutronics.calculate_dpa_rate(spectrum.sum())
+    
+    # Batch state matches the scalar state, including zero power and area
+    powers = np.array([0.0, 1e6, 500e6, 2e9, 500e6])
+    areas = np.array([1000.0, 1000.0, 700.0, 1500.0, 0.0])
+    states = neutronics.calculate_neutronics_state_batch(
+        powers, areas, blanket_thickness=0.8, li6_fraction=0.3, initial_dpa=2.0
+    )
+    for i in range(len(powers)):
+        state = neutronics.calculate_neutronics_state(
+            powers[i], areas[i], blanket_thickness=0.8, li6_fraction=0.3, initial_dpa=2.0
+        )
+        for name, values in states.items():
+            assert np.isclose(values[i], getattr(state, name), rtol=1e-12), name
+        assert neutronics_state(
+            powers[i], areas[i], blanket_thickness=0.8, li6_fraction=0.3, initial_dpa=2.0
+        ) == state
+    
+    # Single precision keeps TBR in float64 and agrees to float32 accuracy
+    states32 = neutronics.calculate_neutronics_state_batch(
+        powers, areas, blanket_thickness=0.8, li6_fraction=0.3, initial_dpa=2.0,
+        dtype=np.float32
+    )
+    assert states32['neutron_flux'].dtype == np.float32
+    assert states32['tritium_breeding_ratio'].dtype == np.float64
+    for name, values in states.items():
+        assert np.allclose(states32[name], values, rtol=1e-5), name
+    
+    # Structured history holds the same values
+    history = neutronics.calculate_neutronics_history(
+        powers, areas, blanket_thickness=0.8, li6_fraction=0.3, initial_dpa=2.0
+    )
+    assert history.dtype == NEUTRONICS_DTYPE
+    assert np.array_equal(history['dpa_rate'], states['dpa_rate'])
+    
+    # Chunked sweep over a grid matches the batch, on threads too
+    sweep_powers = np.linspace(0.0, 2e9, 101)[:, None]
+    sweep_areas = np.array([0.0, 700.0, 1500.0])
+    grid_states = neutronics.calculate_neutronics_state_batch(sweep_powers, sweep_areas)
+    for n_workers in (1, 3):
+        sweep = neutronics.calculate_neutronics_sweep(
+            sweep_powers, sweep_areas, chunk_size=30, n_workers=n_workers
+        )
+        assert sweep.shape == (101, 3)
+        for name in NEUTRONICS_DTYPE.names:
+            assert np.array_equal(sweep[name], grid_states[name]), name
+    
+    # Specialized state matches the general one for a fixed geometry
+    for area in (700.0, 0.0):
+        specialized = neutronics.make_specialized(area, blanket_thickness=0.8, li6_fraction=0.3)
+        for power in (0.0, 1e6, 500e6):
+            expected = neutronics.calculate_neutronics_state(
+                power, area, blanket_thickness=0.8, li6_fraction=0.3, initial_dpa=2.0
+            )
+            state = specialized(power, initial_dpa=2.0)
+            for name in NEUTRONICS_DTYPE.names:
+                assert np.isclose(getattr(state, name), getattr(expected, name), rtol=1e-12), name
+    
+    # Vectorized DPA integration matches step-by-step accumulation
+    rates = np.array([1.0, 2.0, 0.5, 3.0])
+    damage = 0.1
+    for rate in rates:
+        damage += rate / (365.25 * 24 * 3600) * 60.0
+    integrated = neutronics.integrate_dpa(rates, 60.0, initial_dpa=0.1)
+    assert np.isclose(integrated[-1], damage, rtol=1e-12)
     
     print("✓ Neutronics tests passed")
 
@@ -111,6 +329,7 @@ def test_neutronics():
 if __name__ == '__main__':
     print("Running physics module tests...\n")
     test_plasma_physics()
+    test_plasma_batch()
     test_magnetic_confinement()
     test_power_balance()
     test_neutronics()
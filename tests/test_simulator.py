@@ -0,0 +1,28 @@
+"""Tests for the reactor simulator."""
+
+import math
+
+from simulator import FusionReactorSimulator, ReactorConfiguration
+
+
+def test_statistics_without_breeding():
+    """Test operation statistics for a run that ends with TBR = 0."""
+    # No heating and a cold plasma: no fusion, so nothing is bred
+    config = ReactorConfiguration(initial_temperature=1e6, input_power=0.0,
+                                  auxiliary_heating=0.0)
+    sim = FusionReactorSimulator(config)
+    sim.run(max_time=30.0, dt=1.0)
+    assert sim.current_state.neutronics_state.tritium_breeding_ratio == 0.0
+
+    # Used to raise ZeroDivisionError estimating the tritium depletion time
+    stats = sim.get_operation_statistics()
+    assert stats['failed']
+    assert math.isfinite(stats['max_operation_time'])
+
+    print("✓ Statistics without breeding tests passed")
+
+
+if __name__ == '__main__':
+    print("Running simulator tests...\n")
+    test_statistics_without_breeding()
+    print("\nAll tests passed! ✓")
@@ -1,5 +1,11 @@
 """Plotting and visualization for fusion reactor simulator."""
 
+import math
+import os
+import pickle
+from pathlib import Path
+
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.figure import Figure
@@ -8,14 +14,80 @@ from typing import Dict, Optional, Tuple
 import io
 
 
+# Folder figures are saved in, relative to the working directory
+_PLOTS_DIR = Path('plots')
+
+# Divisor taking each plot_plasma_parameters series to its plotted unit
+_PLASMA_PANEL_SCALES = {
+    'temperature': 1e6,  # MK
+    'density': 1e20,  # 10²⁰ m⁻³
+    'triple_product': 1e21,  # 10²¹ m⁻³·s·K
+    'q_factor': 1.0,
+}
+
+# Series longer than this many samples per pixel column of their axes are
+# drawn as a min/max envelope
+_SAMPLES_PER_PIXEL = 4
+
+
+def _decimated_series(ax, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample indices and values of a series to draw on ax.
+    
+    Long series are reduced to the first and last sample plus the minimum
+    and maximum of each of _SAMPLES_PER_PIXEL bins per pixel column, kept
+    in time order, so the line covers the same pixels with far fewer
+    segments to stroke.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    n_bins = int(_SAMPLES_PER_PIXEL * ax.bbox.width)
+    # Each bin keeps two samples, so only bins of more than two help
+    if n_bins < 1 or n <= 2 * n_bins:
+        return np.arange(n), values
+    
+    chunk = n // n_bins
+    usable = n_bins * chunk
+    bins = values[:usable].reshape(n_bins, chunk)
+    starts = np.arange(0, usable, chunk)
+    indices = np.concatenate((
+        [0],
+        starts + bins.argmin(axis=1),
+        starts + bins.argmax(axis=1),
+        np.arange(usable, n),
+        [n - 1],
+    ))
+    indices = np.unique(indices)
+    return indices, values[indices]
+
+
 class ReactorPlotter:
     """Plotting utilities for fusion reactor visualization."""
     
-    def __init__(self):
-        """Initialize plotter."""
+    def __init__(self, reuse_figures: bool = False):
+        """Initialize plotter.
+        
+        Args:
+            reuse_figures: Update the figure from the previous
+                create_reactor_diagram / plot_plasma_parameters call in
+                place while it is still open, instead of creating a new one;
+                for displays redrawn every simulation step
+        """
         plt.style.use('dark_background')
         self.fig = None
         self.axes = None
+        self.reuse_figures = reuse_figures
+        
+        # Last figure of each reusable plot with the artists updated on reuse
+        self._reusable: Dict[str, Tuple[Figure, Dict]] = {}
+    
+    def _open_figure(self, name: str) -> Optional[Tuple[Figure, Dict]]:
+        """Previous figure and artists of a reusable plot, if still open."""
+        if not self.reuse_figures:
+            return None
+        entry = self._reusable.get(name)
+        if entry is None or not plt.fignum_exists(entry[0].number):
+            return None
+        return entry
     
     def create_reactor_diagram(self, major_radius: float, minor_radius: float,
                               elongation: float = 1.0) -> Figure:
@@ -29,16 +101,21 @@ class ReactorPlotter:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=(10, 10))
+        reusable = self._open_figure('reactor_diagram')
+        if reusable is not None:
+            fig, artists = reusable
+            self._draw_reactor_geometry(artists, major_radius, minor_radius, elongation)
+            fig.canvas.draw_idle()
+            return fig
         
-        # Draw torus
-        center = (major_radius, 0)
+        fig, ax = plt.subplots(figsize=(10, 10))
         
-        # Create elliptical plasma cross-section
+        # Elliptical plasma cross-section and major radius circle, sized
+        # by _draw_reactor_geometry
         ellipse = patches.Ellipse(
-            center, 
-            width=2 * minor_radius,
-            height=2 * minor_radius * elongation,
+            (0, 0),
+            width=1.0,
+            height=1.0,
             fill=False,
             edgecolor='cyan',
             linewidth=2,
@@ -46,10 +123,9 @@ class ReactorPlotter:
         )
         ax.add_patch(ellipse)
         
-        # Draw major radius circle
         circle = plt.Circle(
             (0, 0),
-            major_radius,
+            1.0,
             fill=False,
             edgecolor='yellow',
             linestyle='--',
@@ -62,17 +138,17 @@ class ReactorPlotter:
         ax.plot(0, 0, 'ro', markersize=10, label='Center')
         
         # Labels
-        ax.annotate(f'R₀ = {major_radius:.2f} m', 
-                   xy=(major_radius, 0), 
-                   xytext=(major_radius + 0.5, 0.5),
-                   color='yellow', fontsize=10)
-        ax.annotate(f'a = {minor_radius:.2f} m',
-                   xy=(major_radius, minor_radius),
-                   xytext=(major_radius + 0.5, minor_radius + 0.5),
-                   color='cyan', fontsize=10)
+        artists = {
+            'ax': ax,
+            'plasma': ellipse,
+            'major_circle': circle,
+            'major_label': ax.annotate('', xy=(0, 0), xytext=(0, 0),
+                                       color='yellow', fontsize=10),
+            'minor_label': ax.annotate('', xy=(0, 0), xytext=(0, 0),
+                                       color='cyan', fontsize=10),
+        }
+        self._draw_reactor_geometry(artists, major_radius, minor_radius, elongation)
         
-        ax.set_xlim(-major_radius * 1.5, major_radius * 2.5)
-        ax.set_ylim(-major_radius * 1.2, major_radius * 1.2)
         ax.set_aspect('equal')
         ax.set_xlabel('R (m)', fontsize=12)
         ax.set_ylabel('Z (m)', fontsize=12)
@@ -80,8 +156,34 @@ class ReactorPlotter:
         ax.legend(loc='upper right')
         ax.grid(True, alpha=0.3)
         
+        self._reusable['reactor_diagram'] = (fig, artists)
         return fig
     
+    @staticmethod
+    def _draw_reactor_geometry(artists: Dict, major_radius: float, minor_radius: float,
+                               elongation: float):
+        """Size the reactor diagram artists for a geometry."""
+        # Draw torus
+        center = (major_radius, 0)
+        plasma = artists['plasma']
+        plasma.set_center(center)
+        plasma.set_width(2 * minor_radius)
+        plasma.set_height(2 * minor_radius * elongation)
+        artists['major_circle'].set_radius(major_radius)
+        
+        major_label = artists['major_label']
+        major_label.set_text(f'R₀ = {major_radius:.2f} m')
+        major_label.xy = center
+        major_label.xyann = (major_radius + 0.5, 0.5)
+        minor_label = artists['minor_label']
+        minor_label.set_text(f'a = {minor_radius:.2f} m')
+        minor_label.xy = (major_radius, minor_radius)
+        minor_label.xyann = (major_radius + 0.5, minor_radius + 0.5)
+        
+        ax = artists['ax']
+        ax.set_xlim(-major_radius * 1.5, major_radius * 2.5)
+        ax.set_ylim(-major_radius * 1.2, major_radius * 1.2)
+    
     def plot_plasma_parameters(self, states: Dict[str, np.ndarray]) -> Figure:
         """Plot plasma parameters over time or iterations.
         
@@ -91,50 +193,83 @@ class ReactorPlotter:
         Returns:
             Matplotlib figure
         """
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        plotted = tuple(name for name in _PLASMA_PANEL_SCALES if name in states)
+        reusable = self._open_figure('plasma_parameters')
+        if reusable is not None and reusable[1]['plotted'] == plotted:
+            fig, artists = reusable
+            for name in plotted:
+                values = np.asarray(states[name]) / _PLASMA_PANEL_SCALES[name]
+                line = artists[name]
+                line.set_data(*_decimated_series(line.axes, values))
+                line.axes.relim()
+                line.axes.autoscale_view()
+            # Tick labels may have changed width
+            fig.tight_layout()
+            fig.canvas.draw_idle()
+            return fig
+        
+        # One panel per series present, two to a row
+        n_panels = max(len(plotted), 1)
+        rows, cols = (n_panels + 1) // 2, min(2, n_panels)
+        fig, axes = plt.subplots(rows, cols, figsize=(7 * cols, 5 * rows), squeeze=False)
         fig.suptitle('Plasma Parameters', fontsize=16, fontweight='bold')
+        panels = dict(zip(plotted, axes.ravel()))
+        artists = {'plotted': plotted}
         
         # Temperature
         if 'temperature' in states:
-            axes[0, 0].plot(states['temperature'] / 1e6, 'r-', linewidth=2)
-            axes[0, 0].axhline(y=15, color='g', linestyle='--', label='Optimal (15 MK)')
-            axes[0, 0].set_xlabel('Time/Iteration')
-            axes[0, 0].set_ylabel('Temperature (MK)')
-            axes[0, 0].set_title('Plasma Temperature')
-            axes[0, 0].legend()
-            axes[0, 0].grid(True, alpha=0.3)
+            ax = panels['temperature']
+            artists['temperature'], = ax.plot(*_decimated_series(
+                ax, states['temperature'] / _PLASMA_PANEL_SCALES['temperature']), 'r-', linewidth=2)
+            ax.axhline(y=15, color='g', linestyle='--', label='Optimal (15 MK)')
+            ax.set_xlabel('Time/Iteration')
+            ax.set_ylabel('Temperature (MK)')
+            ax.set_title('Plasma Temperature')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
         
         # Density
         if 'density' in states:
-            axes[0, 1].plot(states['density'] / 1e20, 'b-', linewidth=2)
-            axes[0, 1].set_xlabel('Time/Iteration')
-            axes[0, 1].set_ylabel('Density (10²⁰ m⁻³)')
-            axes[0, 1].set_title('Plasma Density')
-            axes[0, 1].grid(True, alpha=0.3)
+            ax = panels['density']
+            artists['density'], = ax.plot(*_decimated_series(
+                ax, states['density'] / _PLASMA_PANEL_SCALES['density']), 'b-', linewidth=2)
+            ax.set_xlabel('Time/Iteration')
+            ax.set_ylabel('Density (10²⁰ m⁻³)')
+            ax.set_title('Plasma Density')
+            ax.grid(True, alpha=0.3)
         
         # Triple product
         if 'triple_product' in states:
-            axes[1, 0].plot(states['triple_product'] / 1e21, 'g-', linewidth=2)
-            axes[1, 0].axhline(y=3.0, color='r', linestyle='--', label='Lawson (3×10²¹)')
-            axes[1, 0].set_xlabel('Time/Iteration')
-            axes[1, 0].set_ylabel('Triple Product (10²¹ m⁻³·s·K)')
-            axes[1, 0].set_title('Triple Product (nτT)')
-            axes[1, 0].legend()
-            axes[1, 0].grid(True, alpha=0.3)
+            ax = panels['triple_product']
+            artists['triple_product'], = ax.plot(*_decimated_series(
+                ax, states['triple_product'] / _PLASMA_PANEL_SCALES['triple_product']), 'g-', linewidth=2)
+            ax.axhline(y=3.0, color='r', linestyle='--', label='Lawson (3×10²¹)')
+            ax.set_xlabel('Time/Iteration')
+            ax.set_ylabel('Triple Product (10²¹ m⁻³·s·K)')
+            ax.set_title('Triple Product (nτT)')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
         
         # Q factor
         if 'q_factor' in states:
-            axes[1, 1].plot(states['q_factor'], 'm-', linewidth=2)
-            axes[1, 1].axhline(y=1.0, color='y', linestyle='--', label='Breakeven (Q=1)')
-            axes[1, 1].axhline(y=10.0, color='g', linestyle='--', label='Ignition (Q=10)')
-            axes[1, 1].set_xlabel('Time/Iteration')
-            axes[1, 1].set_ylabel('Q Factor')
-            axes[1, 1].set_title('Q Factor (Fusion/Input Power)')
-            axes[1, 1].set_yscale('log')
-            axes[1, 1].legend()
-            axes[1, 1].grid(True, alpha=0.3)
+            ax = panels['q_factor']
+            artists['q_factor'], = ax.plot(
+                *_decimated_series(ax, states['q_factor']), 'm-', linewidth=2)
+            ax.axhline(y=1.0, color='y', linestyle='--', label='Breakeven (Q=1)')
+            ax.axhline(y=10.0, color='g', linestyle='--', label='Ignition (Q=10)')
+            ax.set_xlabel('Time/Iteration')
+            ax.set_ylabel('Q Factor')
+            ax.set_title('Q Factor (Fusion/Input Power)')
+            ax.set_yscale('log')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+        
+        # An odd panel count leaves the last grid slot empty
+        for ax in axes.ravel()[len(plotted):]:
+            ax.remove()
         
         plt.tight_layout()
+        self._reusable['plasma_parameters'] = (fig, artists)
         return fig
     
     def plot_power_balance(self, power_data: Dict[str, float]) -> Figure:
@@ -164,12 +299,9 @@ class ReactorPlotter:
             ax1.set_title('Power Components')
             ax1.grid(True, alpha=0.3, axis='y')
             
-            # Add value labels
-            for bar, val in zip(bars, values):
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{val:.1f} MW',
-                        ha='center', va='bottom' if val > 0 else 'top', fontweight='bold')
+            # Add value labels at the bar ends in one call
+            ax1.bar_label(bars, labels=[f'{val:.1f} MW' for val in values],
+                          fontweight='bold')
         
         # Q factor indicator
         if 'q_factor' in power_data:
@@ -248,30 +380,16 @@ class ReactorPlotter:
             ('TBR', status_data.get('tbr', 0), '', 'yellow'),
         ]
         
-        # First row: 3 parameters
-        for idx in range(3):
-            name, value, unit, color = params[idx]
-            ax = fig.add_subplot(gs[1, idx])
+        # First three parameters in single columns, the last two spanning
+        # two columns each
+        slots = (gs[1, 0], gs[1, 1], gs[1, 2], gs[1, 0:2], gs[1, 2:4])
+        for (name, value, unit, color), slot in zip(params, slots):
+            ax = fig.add_subplot(slot)
             ax.axis('off')
-            if np.isinf(value) or np.isnan(value):
-                val_str = '∞' if np.isinf(value) else 'N/A'
-            else:
-                val_str = f'{value:.2f}'
-            ax.text(0.5, 0.5, f'{name}\n{val_str} {unit}',
-                   ha='center', va='center',
-                   fontsize=14, fontweight='bold',
-                   color=color,
-                   transform=ax.transAxes)
-        
-        # Second row: 2 parameters (spanning 2 columns each, centered)
-        for idx in range(3, 5):
-            name, value, unit, color = params[idx]
-            # Center the last two parameters
-            col_start = (idx - 3) * 2
-            ax = fig.add_subplot(gs[1, col_start:col_start+2])
-            ax.axis('off')
-            if np.isinf(value) or np.isnan(value):
-                val_str = '∞' if np.isinf(value) else 'N/A'
+            if math.isinf(value):
+                val_str = '∞'
+            elif math.isnan(value):
+                val_str = 'N/A'
             else:
                 val_str = f'{value:.2f}'
             ax.text(0.5, 0.5, f'{name}\n{val_str} {unit}',
@@ -313,33 +431,69 @@ class ReactorPlotter:
         
         return fig
     
-    def save_figure(self, fig: Figure, filename: str):
-        """Save figure to file.
-        
-        Args:
-            fig: Matplotlib figure
-            filename: Filename (will be saved in plots/ folder)
-        """
-        from pathlib import Path
-        
-        # Create plots directory if it doesn't exist
-        plots_dir = Path('plots')
-        plots_dir.mkdir(exist_ok=True)
+    @staticmethod
+    def _plots_path(filename: str) -> Path:
+        """Path of filename in the plots/ folder, creating the folder."""
+        # Create plots directory if it doesn't exist; checked on every save
+        # since it is relative to the working directory, which may change
+        _PLOTS_DIR.mkdir(exist_ok=True)
         
         # Ensure filename is in plots directory
         if not str(filename).startswith('plots/'):
-            filepath = plots_dir / filename
-        else:
-            filepath = Path(filename)
+            return _PLOTS_DIR / filename
+        return Path(filename)
+    
+    def load_cached_figure(self, filename: str, label) -> Optional[Figure]:
+        """Load a figure pickled by cache_figure, if it was drawn for label.
         
-        fig.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='black')
-        print(f"Saved: {filepath}")
+        Args:
+            filename: Pickle filename (in plots/ folder)
+            label: Data the figure must have been drawn from
+            
+        Returns:
+            The cached figure, or None if it is missing, stale or was
+            written by another matplotlib version
+        """
+        try:
+            with open(self._plots_path(filename), 'rb') as f:
+                version, cached_label, fig = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError,
+                pickle.UnpicklingError):
+            return None
+        if version != matplotlib.__version__ or cached_label != label:
+            return None
+        return fig
+    
+    def cache_figure(self, fig: Figure, filename: str, label):
+        """Pickle a figure with the data it was drawn from.
+        
+        Args:
+            fig: Matplotlib figure
+            filename: Pickle filename (will be saved in plots/ folder)
+            label: Data the figure was drawn from, compared on load
+        """
+        filepath = self._plots_path(filename)
+        # Write to a temporary file first so an interrupted save never
+        # leaves a truncated pickle behind
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((matplotlib.__version__, label, fig), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, filepath)
+    
+    def save_figure(self, fig: Figure, filename: str):
         """Save figure to file.
         
         Args:
             fig: Matplotlib figure
-            filename: Output filename
+            filename: Filename (will be saved in plots/ folder)
         """
-        fig.savefig(filename, dpi=150, bbox_inches='tight', facecolor='black')
+        filepath = self._plots_path(filename)
+        if os.environ.get('FUSIONSIM_BATCH') == '1':
+            # Batch runs: lower resolution, without the tight bounding box pass
+            fig.savefig(filepath, dpi=100, facecolor='black')
+        else:
+            fig.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='black')
+        print(f"Saved: {filepath}")
         plt.close(fig)
 